@@ -4,8 +4,16 @@ Add Korean (한국어) translations to Chapter 9 of rdg_en_v3.json
 """
 
 import json
+import sys
 from pathlib import Path
 
+# Write through the backend's atomic writer (no Django needed)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+from circles.translation.atomicfile import atomic_write_json  # noqa: E402
+
+# Previous versions kept as rdg_en_v3.json.1 .. .N, as the backend does on save
+BACKUP_GENERATIONS = 5
+
 # Korean translations for Chapter 9
 KOREAN_TITLE = "회복 다르마란 무엇인가?"
 
@@ -49,12 +57,6 @@ def main():
     with open(input_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
-    # Create backup
-    backup_file = input_file.with_name('rdg_en_v3.json.backup_before_korean')
-    print(f"Creating backup at {backup_file}...")
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
     print("Adding Korean translations to Chapter 9...")
 
     # Find and update Chapter 9
@@ -78,12 +80,11 @@ def main():
                                     print(f"✓ Updated {para_id}")
 
     print(f"\nSaving updated JSON...")
-    with open(input_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    atomic_write_json(input_file, data, generations=BACKUP_GENERATIONS)
 
     print(f"\n✅ Korean translations added successfully!")
     print(f"   Updated: 1 title + {updated_count} paragraphs")
-    print(f"   Backup saved at: {backup_file}")
+    print(f"   Previous version kept at: {input_file}.1")
 
 if __name__ == "__main__":
     main()
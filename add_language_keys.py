@@ -8,9 +8,17 @@ the entire JSON document.
 """
 
 import json
+import sys
 from collections import OrderedDict
 from pathlib import Path
 
+# Write through the backend's atomic writer (no Django needed)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+from circles.translation.atomicfile import atomic_write_json  # noqa: E402
+
+# Previous versions kept as rdg_en_v3.json.1 .. .N, as the backend does on save
+BACKUP_GENERATIONS = 5
+
 # Define the language keys in the correct order
 TITLE_KEYS = [
     "thai_title",
@@ -141,28 +149,21 @@ def main():
     """Main function to process the JSON file."""
     input_file = Path("/mnt/c/Users/scott/Documents/AIProjects/Markdown/ThaiTranslation/rdg_en_v3.json")
     output_file = input_file  # Overwrite the original
-    backup_file = input_file.with_suffix('.json.backup')
 
     print(f"Loading {input_file}...")
     with open(input_file, 'r', encoding='utf-8') as f:
         data = json.load(f, object_pairs_hook=OrderedDict)
 
-    # Create backup
-    print(f"Creating backup at {backup_file}...")
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
     print("Processing JSON structure...")
     # Process the content
     if 'content' in data:
         data['content'] = [process_item(item) for item in data['content']]
 
     print(f"Saving modified JSON to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    atomic_write_json(output_file, data, generations=BACKUP_GENERATIONS)
 
     print("✅ Language keys added successfully!")
-    print(f"   Backup saved at: {backup_file}")
+    print(f"   Previous version kept at: {output_file}.1")
 
     # Verify the changes
     print("\nVerifying changes...")
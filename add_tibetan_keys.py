@@ -4,9 +4,17 @@ Add tibetan_title and tibetan_text keys throughout rdg_en_v3.json
 """
 
 import json
+import sys
 from collections import OrderedDict
 from pathlib import Path
 
+# Write through the backend's atomic writer (no Django needed)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+from circles.translation.atomicfile import atomic_write_json  # noqa: E402
+
+# Previous versions kept as rdg_en_v3.json.1 .. .N, as the backend does on save
+BACKUP_GENERATIONS = 5
+
 def add_tibetan_keys_to_chapter(chapter):
     """Add tibetan_title key to a chapter after Chinese_Simplified_title."""
     if "title" not in chapter:
@@ -68,17 +76,11 @@ def main():
     """Add Tibetan keys throughout the JSON file."""
     input_file = Path("/mnt/c/Users/scott/Documents/AIProjects/Markdown/ThaiTranslation/rdg_en_v3.json")
     output_file = input_file
-    backup_file = input_file.with_name('rdg_en_v3.json.backup_before_tibetan_keys')
 
     print(f"Loading {input_file}...")
     with open(input_file, 'r', encoding='utf-8') as f:
         data = json.load(f, object_pairs_hook=OrderedDict)
 
-    # Create backup
-    print(f"Creating backup at {backup_file}...")
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
     print("Adding Tibetan keys to JSON structure...")
 
     # Process the content
@@ -86,8 +88,7 @@ def main():
         data['content'] = [process_item(item) for item in data['content']]
 
     print(f"Saving modified JSON to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    atomic_write_json(output_file, data, generations=BACKUP_GENERATIONS)
 
     print("✅ Tibetan keys added successfully!")
 
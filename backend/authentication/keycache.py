@@ -0,0 +1,232 @@
+"""
+Access Key Cache
+
+In-process cache of active access keys, with write-behind tracking of
+AccessKey.last_used.
+
+Every authenticated request resolves its key. Without the cache that is a
+SELECT plus a full-row UPDATE of last_used - a database write, and
+SQLite's write lock, on every GET. Instead:
+
+- Active keys are cached per worker for
+  ACCESS_KEY_CONFIG['cache_ttl_seconds'] in a bounded LRU. Saving or
+  deleting an AccessKey invalidates it in the current worker at once;
+  other workers see the change when their entry expires, so deactivating
+  a key takes effect everywhere within the TTL.
+- last_used is only advanced once per 'last_used_resolution_seconds' per
+  key, and the new timestamps are buffered and written for all keys in
+  one UPDATE at most every 'last_used_flush_seconds' (and at exit).
+  Polling with a key therefore costs no write per request.
+
+Classes:
+- AccessKeyCache: TTL'd LRU of active keys by key string
+- LastUsedBuffer: Write-behind buffer of last_used timestamps
+
+Functions:
+- resolve_key: Active AccessKey for a key string, recording its use
+
+Status: Phase 2 - Implementation
+"""
+
+import atexit
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.db.models import Case, DateTimeField, Value, When
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import AccessKey
+
+logger = logging.getLogger(__name__)
+
+# Keys per UPDATE statement when flushing (two parameters per key)
+FLUSH_BATCH_SIZE = 300
+
+
+def _config(name, default):
+    return getattr(settings, 'ACCESS_KEY_CONFIG', {}).get(name, default)
+
+
+class AccessKeyCache:
+    """
+    LRU of active AccessKeys by key string, each entry valid for ttl seconds.
+
+    Callers get a copy of the cached instance, so changing it (or saving
+    it) never alters what other requests see. Unknown and inactive keys
+    are not cached.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key_value: str) -> Optional[AccessKey]:
+        """Active AccessKey for key_value, or None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key_value)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key_value)
+                self.hits += 1
+                return copy.copy(entry[0])
+            self.misses += 1
+
+        access_key = AccessKey.objects.filter(key=key_value, is_active=True).first()
+        if access_key is None:
+            self.invalidate(key_value)
+            return None
+
+        with self._lock:
+            self._entries[key_value] = (access_key, now + self.ttl)
+            self._entries.move_to_end(key_value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy.copy(access_key)
+
+    def mark_used(self, key_value: str, when):
+        """Record a new last_used on the cached instance"""
+        with self._lock:
+            entry = self._entries.get(key_value)
+            if entry is not None:
+                entry[0].last_used = when
+
+    def invalidate(self, key_value: Optional[str] = None, pk: Optional[int] = None):
+        """Drop the entry for a key string and/or any entry for a primary key"""
+        with self._lock:
+            if key_value is not None:
+                self._entries.pop(key_value, None)
+            if pk is not None:
+                for cached_key in [k for k, (instance, _) in self._entries.items() if instance.pk == pk]:
+                    del self._entries[cached_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Entry count and hit/miss counters, for monitoring"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+class LastUsedBuffer:
+    """
+    Buffered last_used timestamps, written in batched UPDATEs.
+
+    A flush happens on the first touch() after flush_interval seconds, in
+    the request that touched; a failed flush keeps its timestamps for the
+    next one.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, object] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.flushed = 0
+
+    def touch(self, pk: int, when):
+        with self._lock:
+            self._pending[pk] = when
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        # Inside a transaction the write would share its fate; wait for the next request
+        if due and not connection.in_atomic_block:
+            self.flush()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write all buffered timestamps; returns the number of keys written"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        items = list(pending.items())
+        try:
+            for start in range(0, len(items), FLUSH_BATCH_SIZE):
+                batch = items[start:start + FLUSH_BATCH_SIZE]
+                AccessKey.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+                    last_used=Case(
+                        *(When(pk=pk, then=Value(when)) for pk, when in batch),
+                        output_field=DateTimeField()
+                    )
+                )
+        except DatabaseError:
+            logger.warning("Could not write last_used for %d access keys; retrying later", len(pending),
+                           exc_info=True)
+            with self._lock:
+                for pk, when in pending.items():
+                    if pk not in self._pending or self._pending[pk] < when:
+                        self._pending[pk] = when
+            return 0
+
+        with self._lock:
+            self.flushed += len(pending)
+        return len(pending)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'flush_seconds': self.flush_interval,
+                'flushed': self.flushed,
+            }
+
+
+access_keys = AccessKeyCache(
+    ttl=_config('cache_ttl_seconds', 30),
+    max_entries=_config('cache_max_entries', 4096),
+)
+last_used_buffer = LastUsedBuffer(flush_interval=_config('last_used_flush_seconds', 5))
+atexit.register(last_used_buffer.flush)
+
+
+def resolve_key(key_value: str) -> Optional[AccessKey]:
+    """
+    Active AccessKey for a key string, recording that it was used.
+
+    Returns:
+        A private copy of the AccessKey, or None if the key is unknown or
+        inactive
+    """
+    access_key = access_keys.get(key_value)
+    if access_key is None:
+        return None
+
+    now = timezone.now()
+    resolution = timedelta(seconds=_config('last_used_resolution_seconds', 60))
+    if access_key.last_used is None or now - access_key.last_used >= resolution:
+        access_key.last_used = now
+        access_keys.mark_used(key_value, now)
+        last_used_buffer.touch(access_key.pk, now)
+    return access_key
+
+
+@receiver(post_save, sender=AccessKey)
+@receiver(post_delete, sender=AccessKey)
+def _invalidate_access_key(sender, instance, **kwargs):
+    # By pk too: the key string itself may have changed
+    access_keys.invalidate(instance.key, pk=instance.pk)
@@ -0,0 +1,17 @@
+from django.utils.functional import SimpleLazyObject
+
+from .principal import principal_from_request
+
+
+class PrincipalMiddleware:
+    """
+    Attach request.principal: the caller resolved from the Authorization
+    header, once per request and only when a view asks for it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.principal = SimpleLazyObject(lambda: principal_from_request(request))
+        return self.get_response(request)
@@ -0,0 +1,147 @@
+"""
+Request Principal
+
+The caller of a request, resolved once from its Authorization: Key header.
+
+Views used to call get_key_from_request and then repeat their own
+Circle/CircleParticipant lookups, so one request could resolve the same
+key and membership two or three times. PrincipalMiddleware attaches a
+Principal to every request instead: the key is resolved on first use and
+the set of circles the caller can access is loaded once, on first use,
+and reused by every check in the request.
+
+Classes:
+- Principal: Immutable caller identity with memoized circle access
+
+Functions:
+- principal_from_request: Resolve a request's Authorization header
+- get_principal: The request's principal (attached by the middleware)
+
+Status: Phase 2 - Implementation
+"""
+
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from .keycache import resolve_key
+from .models import AccessKey
+
+INVALID_HEADER = 'Invalid authorization header format'
+INVALID_KEY = 'Invalid key'
+
+
+class Principal:
+    """
+    Caller of one request.
+
+    Attributes are read-only; access_key is the request's own copy of the
+    cached AccessKey and must not be modified. circle_ids is computed on
+    first access and memoized for the rest of the request.
+    """
+
+    def __init__(self, access_key: Optional[AccessKey], error: Optional[str] = None):
+        object.__setattr__(self, '_access_key', access_key)
+        object.__setattr__(self, '_error', error)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Principal is immutable (tried to set {name!r})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Principal is immutable (tried to delete {name!r})")
+
+    def __bool__(self) -> bool:
+        return self._access_key is not None
+
+    def __repr__(self) -> str:
+        if self._access_key is None:
+            return f"<Principal anonymous: {self._error}>"
+        return f"<Principal {self.role} key_id={self.key_id}>"
+
+    @property
+    def access_key(self) -> Optional[AccessKey]:
+        return self._access_key
+
+    @property
+    def error(self) -> Optional[str]:
+        """Why the request is not authenticated (None when it is)"""
+        return self._error
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self._access_key is not None
+
+    @property
+    def key_id(self) -> Optional[int]:
+        return self._access_key.pk if self._access_key is not None else None
+
+    @property
+    def role(self) -> Optional[str]:
+        return self._access_key.role if self._access_key is not None else None
+
+    @property
+    def is_facilitator(self) -> bool:
+        return self.role == 'facilitator'
+
+    @cached_property
+    def circle_roles(self) -> Dict[int, str]:
+        """{circle_id: 'facilitator' | 'participant'} for every circle the key can see"""
+        if self._access_key is None:
+            return {}
+
+        from circles.membership import memberships
+        return memberships.circles(self.key_id)
+
+    @cached_property
+    def circle_ids(self) -> FrozenSet[int]:
+        """
+        IDs of the circles the caller can access: a facilitator's own
+        circles, or the circles a participant belongs to.
+        """
+        role = 'facilitator' if self.is_facilitator else 'participant'
+        return frozenset(circle_id for circle_id, circle_role in self.circle_roles.items()
+                         if circle_role == role)
+
+    def visible_circles(self, circle_ids: Iterable) -> FrozenSet[int]:
+        """Which of these circles the caller can access, in one lookup"""
+        from circles.membership import memberships
+
+        if self._access_key is None:
+            return frozenset()
+        return frozenset(memberships.visible(self.key_id, circle_ids)) & self.circle_ids
+
+    def can_access(self, circle) -> bool:
+        """Whether the caller facilitates or belongs to a circle"""
+        if self._access_key is None:
+            return False
+        if self.is_facilitator:
+            # Answered from the circle row itself, without loading circle_ids
+            return circle.facilitator_key_id == self.key_id
+        return circle.id in self.circle_ids
+
+
+def principal_from_request(request) -> Principal:
+    """Resolve the Authorization: Key header of a request"""
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    if not auth_header.startswith('Key '):
+        return Principal(None, INVALID_HEADER)
+
+    access_key = resolve_key(auth_header[4:])
+    if access_key is None:
+        return Principal(None, INVALID_KEY)
+    return Principal(access_key)
+
+
+def get_principal(request) -> Principal:
+    """
+    Principal of a request.
+
+    Set by PrincipalMiddleware; resolved here (and kept on the request)
+    for requests that did not pass through it.
+    """
+    principal = getattr(request, 'principal', None)
+    if principal is None:
+        principal = principal_from_request(request)
+        # On a DRF Request, store it on the wrapped HttpRequest
+        target = getattr(request, '_request', request)
+        target.principal = principal
+    return principal
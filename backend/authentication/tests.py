@@ -1,3 +1,116 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from circles.models import Circle, CircleParticipant
+
+from .keycache import access_keys, last_used_buffer, resolve_key
+from .models import AccessKey
+from .principal import INVALID_HEADER, INVALID_KEY, get_principal
+from .views import get_key_from_request
+
+
+class AccessKeyCacheTests(TestCase):
+    """Cached key lookups and write-behind last_used"""
+
+    def setUp(self):
+        access_keys.clear()
+        last_used_buffer.flush()
+        self.key = AccessKey.objects.create(key='cached-key', role='participant')
+
+    def test_repeated_lookups_skip_the_database(self):
+        self.assertEqual(resolve_key('cached-key').pk, self.key.pk)
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(5):
+                self.assertEqual(resolve_key('cached-key').pk, self.key.pk)
+        self.assertEqual(len(queries), 0)
+        self.assertIsNone(resolve_key('unknown-key'))
+
+    def test_deactivation_and_deletion_invalidate(self):
+        resolve_key('cached-key')
+        self.key.is_active = False
+        self.key.save()
+        self.assertIsNone(resolve_key('cached-key'))
+
+        self.key.is_active = True
+        self.key.save()
+        self.assertIsNotNone(resolve_key('cached-key'))
+        self.key.delete()
+        self.assertIsNone(resolve_key('cached-key'))
+
+    def test_last_used_is_flushed_in_one_update(self):
+        other = AccessKey.objects.create(key='other-key', role='participant')
+        resolve_key('cached-key')
+        resolve_key('other-key')
+        self.key.refresh_from_db()
+        self.assertIsNone(self.key.last_used)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(last_used_buffer.flush(), 2)
+        self.assertEqual(len(queries), 1)
+        for access_key in (self.key, other):
+            access_key.refresh_from_db()
+            self.assertAlmostEqual(access_key.last_used, timezone.now(), delta=timedelta(seconds=5))
+
+        # Within the resolution window nothing new is buffered
+        resolve_key('cached-key')
+        self.assertEqual(last_used_buffer.pending(), 0)
+
+
+class PrincipalTests(TestCase):
+    """Request principal resolved once per request"""
+
+    def setUp(self):
+        access_keys.clear()
+        self.facilitator = AccessKey.objects.create(key='principal-facilitator', role='facilitator')
+        self.participant = AccessKey.objects.create(key='principal-participant', role='participant')
+        self.circle = Circle.objects.create(name='Mine', facilitator_key=self.facilitator)
+        self.other = Circle.objects.create(name='Other', facilitator_key=self.facilitator, jitsi_room_id='other')
+        CircleParticipant.objects.create(circle=self.circle, access_key=self.participant)
+        self.factory = RequestFactory()
+
+    def request(self, key=None):
+        headers = {'HTTP_AUTHORIZATION': f'Key {key}'} if key else {}
+        return self.factory.get('/', **headers)
+
+    def test_resolved_once_per_request(self):
+        request = self.request('principal-participant')
+        principal = get_principal(request)
+        self.assertIs(get_principal(request), principal)
+        self.assertEqual(get_key_from_request(request), (principal.access_key, None))
+        self.assertEqual(principal.role, 'participant')
+        with self.assertRaises(AttributeError):
+            principal.role = 'facilitator'
+
+    def test_unauthenticated(self):
+        self.assertEqual(get_principal(self.request()).error, INVALID_HEADER)
+        principal = get_principal(self.request('no-such-key'))
+        self.assertFalse(principal)
+        self.assertEqual(principal.error, INVALID_KEY)
+        self.assertEqual(principal.circle_ids, frozenset())
+        self.assertFalse(principal.can_access(self.circle))
+
+    def test_circle_access_is_memoized(self):
+        principal = get_principal(self.request('principal-participant'))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(principal.can_access(self.circle))
+            self.assertFalse(principal.can_access(self.other))
+            self.assertEqual(principal.circle_ids, {self.circle.id})
+        self.assertEqual(len(queries), 1)
+
+        facilitator = get_principal(self.request('principal-facilitator'))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(facilitator.can_access(self.other))
+        self.assertEqual(len(queries), 0)
+
+    def test_verify_key_through_middleware(self):
+        response = self.client.post('/api/auth/verify-key/', HTTP_AUTHORIZATION='Key principal-participant')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['circle']['id'], self.circle.id)
+        response = self.client.post('/api/auth/verify-key/')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/auth/verify-key/', HTTP_AUTHORIZATION='Key no-such-key')
+        self.assertEqual(response.status_code, 401)
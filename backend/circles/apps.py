@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CirclesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'circles'
+
+    def ready(self):
+        # Connect the membership index invalidation signals
+        from . import membership  # noqa: F401
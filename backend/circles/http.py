@@ -0,0 +1,19 @@
+"""
+Circle HTTP Helpers
+
+Conditional-request helpers shared by the circles and translation views.
+
+Functions:
+- if_none_match: Whether a request's If-None-Match header matches an ETag
+
+Status: Phase 2 - Implementation
+"""
+
+
+def if_none_match(request, etag: str) -> bool:
+    """Whether the If-None-Match header matches etag (weak comparison)"""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return '*' in tags or etag.removeprefix('W/') in tags
@@ -0,0 +1,31 @@
+"""
+Finish asynchronous key batches whose worker went away.
+
+Runs every batch still pending (each is claimed before it runs, so a
+worker that is still about to run it does not run it twice), then marks
+batches running for longer than KEY_BATCH_CONFIG['stale_after_seconds']
+as failed. Run after a restart or deploy, or periodically.
+
+Usage: python manage.py recover_key_batches
+"""
+
+from django.core.management.base import BaseCommand
+
+from circles.models import KeyBatch
+from circles.provisioning import fail_stale_key_batches, run_key_batch
+
+
+class Command(BaseCommand):
+    help = "Run pending key batches and fail batches that stopped running"
+
+    def handle(self, *args, **options):
+        pending = list(KeyBatch.objects.filter(status='pending').order_by('id').values_list('id', flat=True))
+        for batch_id in pending:
+            run_key_batch(batch_id)
+            batch = KeyBatch.objects.get(pk=batch_id)
+            self.stdout.write(f"Key batch {batch_id}: {batch.status}")
+
+        failed = fail_stale_key_batches()
+        self.stdout.write(self.style.SUCCESS(
+            f"Key batches: {len(pending)} pending run, {failed} stale marked failed"
+        ))
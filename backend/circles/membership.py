@@ -0,0 +1,184 @@
+"""
+Circle Membership Index
+
+Per access key, the circles it can see and its role in each, cached
+across requests.
+
+Every translation, message and room call checks membership. The index
+loads a key's memberships (circles it facilitates plus circles it
+participates in) in one query and keeps them per worker in a bounded LRU
+for CIRCLE_MEMBERSHIP_CONFIG['cache_ttl_seconds'], so polling clients
+cause no membership queries in steady state.
+
+Creating or deleting a Circle or CircleParticipant (including the
+participant key endpoints and circle deletion, whose cascades delete the
+participants) invalidates the affected keys in the current worker at
+once; other workers catch up within the TTL. Code that writes
+memberships without signals (queryset.update(), bulk_create) must call
+memberships.invalidate() itself.
+
+Classes:
+- MembershipIndex: TTL'd LRU of {circle_id: role} per access key
+
+Status: Phase 2 - Implementation
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import AccessKey
+from .models import Circle, CircleParticipant
+
+FACILITATOR = 'facilitator'
+PARTICIPANT = 'participant'
+
+
+def _config(name, default):
+    return getattr(settings, 'CIRCLE_MEMBERSHIP_CONFIG', {}).get(name, default)
+
+
+class MembershipIndex:
+    """
+    Cached {circle_id: role} per access key id.
+
+    Role is 'facilitator' for circles the key facilitates and
+    'participant' for circles it was added to. Returned mappings are
+    shared and must not be modified.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a load that raced one is not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def circles(self, key_id: int) -> Dict[int, str]:
+        """{circle_id: role} for every circle the key can see"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key_id)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._generation
+
+        roles = self._load(key_id)
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key_id] = (roles, now + self.ttl)
+                self._entries.move_to_end(key_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return roles
+
+    @staticmethod
+    def _load(key_id: int) -> Dict[int, str]:
+        rows = (
+            Circle.objects
+            .filter(Q(facilitator_key_id=key_id) | Q(participants__access_key_id=key_id))
+            .values_list('id', 'facilitator_key_id')
+            .distinct()
+        )
+        return {
+            circle_id: FACILITATOR if facilitator_id == key_id else PARTICIPANT
+            for circle_id, facilitator_id in rows
+        }
+
+    def role(self, key_id: int, circle_id: int) -> Optional[str]:
+        """The key's role in a circle, or None if it cannot see it"""
+        return self.circles(key_id).get(_circle_id(circle_id))
+
+    def visible(self, key_id: int, circle_ids: Iterable) -> Dict[int, str]:
+        """
+        Which of these circles can the key see?
+
+        Answered from one cached lookup however many circles are asked
+        about.
+
+        Returns:
+            {circle_id: role} for the visible subset of circle_ids
+        """
+        roles = self.circles(key_id)
+        visible = {}
+        for circle_id in circle_ids:
+            circle_id = _circle_id(circle_id)
+            role = roles.get(circle_id)
+            if role is not None:
+                visible[circle_id] = role
+        return visible
+
+    def invalidate(self, key_ids: Iterable[int] = (), circle_id: Optional[int] = None):
+        """Drop the entries of some keys and/or of every key that can see a circle"""
+        with self._lock:
+            self._generation += 1
+            for key_id in key_ids:
+                self._entries.pop(key_id, None)
+            if circle_id is not None:
+                for key_id in [k for k, (roles, _) in self._entries.items() if circle_id in roles]:
+                    del self._entries[key_id]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Entry count and hit/miss counters, for monitoring"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+def _circle_id(value) -> Optional[int]:
+    # Circle ids arrive as ints, strings from URLs/query params, or Circles
+    if isinstance(value, Circle):
+        return value.pk
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+memberships = MembershipIndex(
+    ttl=_config('cache_ttl_seconds', 30),
+    max_entries=_config('cache_max_entries', 4096),
+)
+
+
+@receiver(post_save, sender=Circle)
+@receiver(post_delete, sender=Circle)
+def _invalidate_circle(sender, instance, **kwargs):
+    # The facilitator may have changed: also drop whoever had the circle cached
+    memberships.invalidate(key_ids=[instance.facilitator_key_id], circle_id=instance.pk)
+
+
+@receiver(post_save, sender=CircleParticipant)
+@receiver(post_delete, sender=CircleParticipant)
+def _invalidate_participant(sender, instance, **kwargs):
+    memberships.invalidate(key_ids=[instance.access_key_id])
+
+
+@receiver(post_save, sender=AccessKey)
+@receiver(post_delete, sender=AccessKey)
+def _invalidate_access_key(sender, instance, **kwargs):
+    # Key ids can be reused (e.g. after a rollback)
+    memberships.invalidate(key_ids=[instance.pk])
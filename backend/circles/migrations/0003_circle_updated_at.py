@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('circles', '0002_circle_circle_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='circle',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
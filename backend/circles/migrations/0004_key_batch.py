@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:37
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('circles', '0003_circle_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeyBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('generate_count', models.PositiveIntegerField(default=0)),
+                ('imported_keys', models.JSONField(default=list)),
+                ('key_ids', models.JSONField(default=list)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('circle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='key_batches', to='circles.circle')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='authentication.accesskey')),
+            ],
+            options={
+                'verbose_name': 'Key Batch',
+                'verbose_name_plural': 'Key Batches',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 02:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('circles', '0004_key_batch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='keybatch',
+            name='started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
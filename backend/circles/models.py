@@ -34,6 +34,7 @@ class Circle(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     started_at = models.DateTimeField(null=True, blank=True)
     ended_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return self.name
@@ -57,3 +58,33 @@ class CircleParticipant(models.Model):
         unique_together = ['circle', 'access_key']
         verbose_name = "Circle Participant"
         verbose_name_plural = "Circle Participants"
+
+
+class KeyBatch(models.Model):
+    """Asynchronous batch of participant keys provisioned for a circle"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    circle = models.ForeignKey(Circle, on_delete=models.CASCADE, related_name='key_batches')
+    created_by = models.ForeignKey(AccessKey, on_delete=models.SET_NULL, null=True, related_name='+')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    # Keys to generate, plus custom key values to import
+    generate_count = models.PositiveIntegerField(default=0)
+    imported_keys = models.JSONField(default=list)
+    # AccessKey ids created, once completed
+    key_ids = models.JSONField(default=list)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Key batch {self.id} for {self.circle.name} ({self.status})"
+
+    class Meta:
+        verbose_name = "Key Batch"
+        verbose_name_plural = "Key Batches"
@@ -0,0 +1,234 @@
+"""
+Participant Key Provisioning
+
+Generate or import many participant keys for a circle at once.
+
+A batch is validated up front (sizes, duplicates, one IN query for
+collisions with existing keys), then all AccessKeys and CircleParticipants
+are inserted with bulk_create in one transaction: a cohort of 40 costs a
+handful of queries instead of 40 requests. The unique constraint on
+AccessKey.key still guards against a key taken between the check and the
+insert; the whole batch then fails.
+
+Large rosters can be provisioned asynchronously: a KeyBatch row records
+the request, a background thread started after commit runs it, and any
+worker can report its status and manifest. The thread dies with its
+worker, so batches left pending or running for longer than
+KEY_BATCH_CONFIG['stale_after_seconds'] are marked failed, and the
+recover_key_batches command runs batches still pending.
+
+Functions:
+- validate_batch: Check a batch request, returning the imported keys
+- provision_keys: Create a batch of participant keys in one transaction
+- start_key_batch / run_key_batch: Asynchronous batches
+- fail_stale_key_batches: Fail batches whose worker went away
+- manifest_rows, iter_manifest_csv: Manifest of created keys
+
+Status: Phase 2 - Implementation
+"""
+
+import csv
+import io
+import logging
+import threading
+import uuid
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from authentication.models import AccessKey
+from .membership import memberships
+from .models import CircleParticipant, KeyBatch
+
+logger = logging.getLogger(__name__)
+
+# Keys per batch request
+MAX_BATCH_KEYS = 10000
+
+MANIFEST_FIELDS = ('key_id', 'access_key', 'role', 'created_at')
+
+_KEY_MAX_LENGTH = AccessKey._meta.get_field('key').max_length
+
+
+class KeyBatchError(ValueError):
+    """Invalid batch request"""
+
+
+class KeyCollisionError(KeyBatchError):
+    """Keys in the batch already exist; collisions lists them (when known)"""
+
+    def __init__(self, message: str, collisions: Iterable[str] = ()):
+        super().__init__(message)
+        self.collisions = sorted(collisions)
+
+
+def validate_batch(count, keys) -> List[str]:
+    """
+    Check a batch request.
+
+    Args:
+        count: Number of keys to generate
+        keys: Custom key values to import
+
+    Returns:
+        The imported key values, stripped
+
+    Raises:
+        KeyBatchError: Bad sizes or values, or duplicates in the request
+        KeyCollisionError: Keys that already exist (one query)
+    """
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise KeyBatchError('count must be a non-negative integer')
+    if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+        raise KeyBatchError('keys must be a list of strings')
+
+    keys = [key.strip() for key in keys]
+    if not count and not keys:
+        raise KeyBatchError('Nothing to provision: give count and/or keys')
+    if count + len(keys) > MAX_BATCH_KEYS:
+        raise KeyBatchError(f'At most {MAX_BATCH_KEYS} keys per batch')
+    if any(not key or len(key) > _KEY_MAX_LENGTH for key in keys):
+        raise KeyBatchError(f'Keys must be 1 to {_KEY_MAX_LENGTH} characters')
+
+    seen, duplicates = set(), set()
+    for key in keys:
+        (duplicates if key in seen else seen).add(key)
+    if duplicates:
+        raise KeyBatchError(f"Duplicate keys in request: {', '.join(sorted(duplicates))}")
+
+    existing = set(AccessKey.objects.filter(key__in=keys).values_list('key', flat=True))
+    if existing:
+        raise KeyCollisionError('Access keys already exist', existing)
+    return keys
+
+
+def provision_keys(circle, count: int, keys: List[str]) -> List[AccessKey]:
+    """
+    Create count generated keys plus the given imported keys as
+    participants of circle, in one transaction.
+
+    Returns:
+        The new AccessKeys, imported keys first
+
+    Raises:
+        KeyBatchError: see validate_batch
+    """
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            # The unique index catches a key created after the check
+            keys = validate_batch(count, keys)
+            values = keys + [f'participant-{uuid.uuid4().hex}' for _ in range(count)]
+            access_keys = AccessKey.objects.bulk_create(
+                [AccessKey(key=value, role='participant', created_at=now) for value in values],
+                batch_size=500,
+            )
+            CircleParticipant.objects.bulk_create(
+                [CircleParticipant(circle=circle, access_key=access_key, joined_at=now)
+                 for access_key in access_keys],
+                batch_size=500,
+            )
+    except IntegrityError:
+        raise KeyCollisionError('Access keys were created concurrently; retry the batch')
+
+    # bulk_create sends no signals (see circles.membership)
+    memberships.invalidate(key_ids=[access_key.pk for access_key in access_keys])
+    return access_keys
+
+
+def manifest_rows(access_keys: Iterable[AccessKey]) -> List[Dict]:
+    return [
+        {
+            'key_id': access_key.id,
+            'access_key': access_key.key,
+            'role': access_key.role,
+            'created_at': access_key.created_at.isoformat(),
+        }
+        for access_key in access_keys
+    ]
+
+
+def iter_manifest_csv(rows: Iterable[Dict]) -> Iterator[str]:
+    """Manifest as CSV text, header first"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=MANIFEST_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def run_key_batch(batch_id: int):
+    """Provision a pending KeyBatch, recording the outcome on it"""
+    claimed = KeyBatch.objects.filter(pk=batch_id, status='pending').update(
+        status='running', started_at=timezone.now()
+    )
+    if not claimed:
+        return
+    batch = KeyBatch.objects.select_related('circle').get(pk=batch_id)
+    try:
+        access_keys = provision_keys(batch.circle, batch.generate_count, batch.imported_keys)
+    except KeyBatchError as e:
+        batch.status, batch.error = 'failed', str(e)
+        if getattr(e, 'collisions', None):
+            batch.error += f": {', '.join(e.collisions)}"
+    except Exception as e:
+        logger.exception("Key batch %s failed", batch_id)
+        batch.status, batch.error = 'failed', str(e)
+    else:
+        batch.status = 'completed'
+        batch.key_ids = [access_key.id for access_key in access_keys]
+    batch.finished_at = timezone.now()
+    batch.save(update_fields=['status', 'error', 'key_ids', 'finished_at'])
+
+
+def fail_stale_key_batches(batches=None) -> int:
+    """
+    Mark batches pending or running for longer than
+    KEY_BATCH_CONFIG['stale_after_seconds'] as failed.
+
+    Provisioning is one transaction, so a batch whose worker went away
+    created no keys unless it died between the commit and recording the
+    result.
+
+    Args:
+        batches: KeyBatch queryset to check (default: all)
+
+    Returns:
+        Number of batches failed
+    """
+    stale_after = getattr(settings, 'KEY_BATCH_CONFIG', {}).get('stale_after_seconds', 600)
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=stale_after)
+    batches = KeyBatch.objects.all() if batches is None else batches
+    return batches.filter(
+        Q(status='pending', created_at__lt=cutoff) | Q(status='running', started_at__lt=cutoff)
+    ).update(
+        status='failed',
+        error=f'Interrupted: not finished within {stale_after} seconds; retry the batch',
+        finished_at=now,
+    )
+
+
+def _run_in_thread(batch_id: int):
+    close_old_connections()
+    try:
+        run_key_batch(batch_id)
+    except Exception:
+        logger.exception("Key batch %s could not be run", batch_id)
+    finally:
+        connection.close()
+
+
+def start_key_batch(batch: KeyBatch):
+    """Run a batch in a background thread once the current transaction commits"""
+    transaction.on_commit(lambda: threading.Thread(
+        target=_run_in_thread, args=(batch.id,), name=f'key-batch-{batch.id}', daemon=True
+    ).start())
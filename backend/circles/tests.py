@@ -1,3 +1,224 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authentication.keycache import last_used_buffer, resolve_key
+from authentication.models import AccessKey
+from .membership import memberships
+from .models import Circle, CircleParticipant, KeyBatch
+from .provisioning import run_key_batch
+
+
+class MembershipIndexTests(TestCase):
+    """Cached circle membership and its invalidation"""
+
+    def setUp(self):
+        memberships.clear()
+        self.facilitator = AccessKey.objects.create(key='index-facilitator', role='facilitator')
+        self.circles = [
+            Circle.objects.create(name=f'Circle {i}', facilitator_key=self.facilitator, jitsi_room_id=f'ic-{i}')
+            for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+
+    def add_participant(self):
+        response = self.client.post(f'/api/circles/{self.circles[0].id}/keys/generate/', {}, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()['key_id']
+
+    def test_batch_lookup_is_one_query_then_cached(self):
+        ids = [circle.id for circle in self.circles]
+        with CaptureQueriesContext(connection) as queries:
+            visible = memberships.visible(self.facilitator.id, ids + [str(ids[0]), 'not-an-id', 999])
+            self.assertEqual(visible, {circle_id: 'facilitator' for circle_id in ids})
+            self.assertEqual(memberships.role(self.facilitator.id, ids[1]), 'facilitator')
+        self.assertEqual(len(queries), 1)
+
+    def test_participant_keys_and_circle_delete_invalidate(self):
+        key_id = self.add_participant()
+        self.assertEqual(memberships.circles(key_id), {self.circles[0].id: 'participant'})
+
+        response = self.client.delete(f'/api/circles/{self.circles[0].id}/keys/{key_id}/remove/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(memberships.circles(key_id), {})
+
+        key_id = self.add_participant()
+        self.assertIn(self.circles[0].id, memberships.circles(key_id))
+        self.assertIn(self.circles[0].id, memberships.circles(self.facilitator.id))
+        response = self.client.delete(f'/api/circles/{self.circles[0].id}/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(memberships.circles(key_id), {})
+        self.assertNotIn(self.circles[0].id, memberships.circles(self.facilitator.id))
+
+    def test_polling_makes_no_membership_queries(self):
+        key_id = self.add_participant()
+        participant = AccessKey.objects.get(id=key_id)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Key {participant.key}')
+        url = f'/api/messages/?circle_id={self.circles[0].id}'
+        client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        sql = ' '.join(query['sql'] for query in queries.captured_queries)
+        self.assertNotIn('circleparticipant', sql)
+
+
+class CircleListTests(TestCase):
+    """Paginated, conditional circle listing"""
+
+    def setUp(self):
+        facilitator = AccessKey.objects.create(key='list-facilitator', role='facilitator')
+        self.participant = AccessKey.objects.create(key='list-participant', role='participant')
+        self.circles = []
+        for i in range(5):
+            circle = Circle.objects.create(
+                name=f'Circle {i}', facilitator_key=facilitator, jitsi_room_id=f'ic-list-{i}',
+                circle_type='translation' if i % 2 else 'discussion',
+            )
+            CircleParticipant.objects.create(circle=circle, access_key=self.participant)
+            self.circles.append(circle)
+        # Not a member of this one
+        Circle.objects.create(name='Other', facilitator_key=facilitator, jitsi_room_id='ic-list-other')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Key {self.participant.key}')
+
+    def test_keyset_pages_in_one_query_each(self):
+        # Key lookup cached, no last_used write due
+        resolve_key(self.participant.key)
+        last_used_buffer.flush()
+
+        seen = []
+        params = {'limit': 2}
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/api/circles/', params)
+            self.assertEqual(response.status_code, 200, response.content)
+            self.assertEqual(len(queries), 1)
+            body = response.json()
+            seen += [circle['id'] for circle in body['circles']]
+            if body['next_cursor'] is None:
+                break
+            params['after'] = body['next_cursor']
+        self.assertEqual(seen, [c.id for c in self.circles])
+
+    def test_full_list_without_paging_params(self):
+        with mock.patch('circles.views.DEFAULT_PAGE_SIZE', 2):
+            body = self.client.get('/api/circles/').json()
+        self.assertEqual([c['id'] for c in body['circles']], [c.id for c in self.circles])
+        self.assertIsNone(body['next_cursor'])
+
+    def test_filters(self):
+        response = self.client.get('/api/circles/', {'circle_type': 'translation'})
+        self.assertEqual({c['id'] for c in response.json()['circles']},
+                         {self.circles[1].id, self.circles[3].id})
+        response = self.client.get('/api/circles/', {'status': 'active'})
+        self.assertEqual(response.json()['circles'], [])
+        self.assertEqual(self.client.get('/api/circles/', {'limit': 'x'}).status_code, 400)
+
+    def test_unchanged_list_is_not_modified(self):
+        etag = self.client.get('/api/circles/')['ETag']
+        response = self.client.get('/api/circles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.circles[2].name = 'Renamed'
+        self.circles[2].save()
+        response = self.client.get('/api/circles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        CircleParticipant.objects.filter(circle=self.circles[0], access_key=self.participant).delete()
+        response = self.client.get('/api/circles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['circles']), 4)
+
+
+class KeyBatchTests(TestCase):
+    """Batch participant key provisioning"""
+
+    def setUp(self):
+        self.facilitator = AccessKey.objects.create(key='batch-facilitator', role='facilitator')
+        self.circle = Circle.objects.create(name='Cohort', facilitator_key=self.facilitator, jitsi_room_id='ic-batch')
+        self.url = f'/api/circles/{self.circle.id}/keys/batch/'
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+
+    def test_batch_is_constant_queries(self):
+        resolve_key(self.facilitator.key)
+        last_used_buffer.flush()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'count': 40, 'keys': ['alice', 'bob']}, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        # circle, collision check, two inserts, savepoint and release
+        self.assertLessEqual(len(queries), 6)
+
+        body = response.json()
+        self.assertEqual(body['created'], 42)
+        self.assertEqual([row['access_key'] for row in body['keys'][:2]], ['alice', 'bob'])
+        self.assertEqual(CircleParticipant.objects.filter(circle=self.circle).count(), 42)
+        self.assertEqual(len(memberships.circles(body['keys'][0]['key_id'])), 1)
+
+    def test_collisions_and_csv(self):
+        AccessKey.objects.create(key='taken', role='participant')
+        response = self.client.post(self.url, {'keys': ['taken', 'free']}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['collisions'], ['taken'])
+        response = self.client.post(self.url, {'keys': ['a', 'a']}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(AccessKey.objects.filter(key='free').exists())
+
+        response = self.client.post(self.url + '?output=csv', {'keys': ['free'], 'count': 1}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertIn('attachment', response['Content-Disposition'])
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'key_id,access_key,role,created_at')
+        self.assertEqual(len(lines), 3)
+
+    def test_async_batch(self):
+        response = self.client.post(self.url, {'count': 5, 'async': True}, format='json')
+        self.assertEqual(response.status_code, 202, response.content)
+        batch_url = f"{self.url}{response.json()['batch_id']}/"
+        self.assertEqual(self.client.get(batch_url).json()['status'], 'pending')
+
+        # The thread starts on commit, which a TestCase never does
+        run_key_batch(response.json()['batch_id'])
+        status = self.client.get(batch_url).json()
+        self.assertEqual((status['status'], status['created']), ('completed', 5))
+        manifest = self.client.get(batch_url, {'manifest': 1}).json()
+        self.assertEqual(len(manifest['keys']), 5)
+        self.assertEqual(KeyBatch.objects.get().key_ids, [row['key_id'] for row in manifest['keys']])
+
+        participant = AccessKey.objects.get(id=manifest['keys'][0]['key_id'])
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Key {participant.key}')
+        self.assertEqual(client.post(self.url, {'count': 1}, format='json').status_code, 403)
+
+    def test_batches_of_a_lost_worker_are_recovered(self):
+        long_ago = timezone.now() - timedelta(hours=1)
+        stuck = KeyBatch.objects.create(
+            circle=self.circle, created_by=self.facilitator, status='running',
+            generate_count=3, started_at=long_ago, created_at=long_ago,
+        )
+        status = self.client.get(f'{self.url}{stuck.id}/').json()
+        self.assertEqual(status['status'], 'failed')
+        self.assertIn('Interrupted', status['error'])
 
-# Create your tests here.
+        pending = KeyBatch.objects.create(circle=self.circle, created_by=self.facilitator, generate_count=2)
+        running = KeyBatch.objects.create(
+            circle=self.circle, created_by=self.facilitator, status='running',
+            generate_count=1, started_at=long_ago,
+        )
+        call_command('recover_key_batches', stdout=io.StringIO())
+        pending.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual((pending.status, len(pending.key_ids)), ('completed', 2))
+        self.assertEqual(running.status, 'failed')
@@ -0,0 +1,108 @@
+"""
+Translation Circle Atomic File Writes
+
+Replace files so readers only ever see the old or the new version, keeping
+previous versions as <name>.1 .. <name>.N.
+
+Free of Django imports, so the standalone document scripts in the
+repository root write through it too.
+
+Functions:
+- atomic_writer: Context manager for a text file replaced on success
+- atomic_write_json: Write a JSON document atomically
+
+Status: Phase 2 - Implementation
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+
+def _rotate_generations(path: Path, generations: int):
+    """
+    Shift <name>.1 .. <name>.N-1 up by one and keep the current file as <name>.1.
+
+    The current file is hard-linked rather than copied when possible, so a
+    rotation costs no extra I/O even for large documents.
+    """
+    if generations <= 0 or not path.exists():
+        return
+
+    for i in range(generations - 1, 0, -1):
+        older = path.with_name(f"{path.name}.{i}")
+        if older.exists():
+            os.replace(older, path.with_name(f"{path.name}.{i + 1}"))
+
+    newest = path.with_name(f"{path.name}.1")
+    if newest.exists():
+        newest.unlink()
+    try:
+        os.link(path, newest)
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+@contextmanager
+def atomic_writer(path, generations: int = 0) -> Iterator[IO[str]]:
+    """
+    Open a text file whose content replaces path only if the block succeeds.
+
+    Writes go to a temporary file in the same directory, which is fsynced,
+    given the original's permissions and renamed over path after rotating
+    the previous versions. An exception in the block, a crash or a worker
+    timeout leaves the original untouched.
+
+    Args:
+        path: Destination file
+        generations: Number of previous versions to keep as <name>.1 .. <name>.N
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix='.tmp', dir=path.parent
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp creates the file 0600; keep the original's permissions
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+
+        _rotate_generations(path, generations)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_write_json(path, data, generations: int = 0):
+    """
+    Write JSON so the file at path is always either the old or the new version.
+
+    See atomic_writer; a crash or worker timeout mid-write leaves the
+    original untouched.
+
+    Args:
+        path: Destination JSON file
+        data: JSON-serializable document
+        generations: Number of previous versions to keep as <name>.1 .. <name>.N
+    """
+    with atomic_writer(path, generations) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
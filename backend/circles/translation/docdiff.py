@@ -0,0 +1,290 @@
+"""
+Translation Circle Document Diff
+
+Structural diff between two versions of a translation JSON file.
+
+Paragraphs are matched by id, not by position or line, so reformatting
+and moved paragraphs never show up as changes. Both files are walked in
+document order side by side; only paragraphs that are out of step (added,
+removed or moved) are buffered, so memory stays small when the files
+mostly line up, as consecutive generations do.
+
+Functions:
+- iter_paragraph_changes: Yield added / removed / modified paragraphs
+- iter_json_report, iter_html_report: Stream a report as text chunks
+- write_review_reports: Report the last save (<file>.1 -> <file>) to disk
+
+Status: Phase 2 - Implementation
+"""
+
+import difflib
+import html
+import json
+from itertools import zip_longest
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from .atomicfile import atomic_writer
+from .services import JSONDocumentLoader
+
+# Fields longer than this are shown whole instead of diffed inline
+INLINE_DIFF_MAX_CHARS = 20000
+
+
+def generation_path(path, generation: int) -> Path:
+    """Path of a rotated backup: 0 is the current file, N is <file>.N"""
+    path = Path(path)
+    return path if generation == 0 else path.with_name(f"{path.name}.{generation}")
+
+
+def _iter_nodes(path) -> Iterator[tuple]:
+    for node, chapter_id, _ in JSONDocumentLoader(path).iter_nodes(prefer_stream=True):
+        if node.get('id'):
+            yield node, chapter_id
+
+
+def _field_changes(old: Dict, new: Dict) -> Dict:
+    changes = {}
+    for field in sorted(old.keys() | new.keys()):
+        if field == 'id':
+            continue
+        old_value = old.get(field)
+        new_value = new.get(field)
+        if old_value != new_value:
+            changes[field] = {'old': old_value, 'new': new_value}
+    return changes
+
+
+def iter_paragraph_changes(old_path, new_path, summary: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    Yield the paragraphs that differ between two document versions.
+
+    Modified paragraphs are yielded as they are reached; removed and added
+    ones once both files have been read.
+
+    Args:
+        old_path, new_path: JSON files to compare
+        summary: Optional dict, filled with added/removed/modified/unchanged
+            counts when the generator is exhausted
+
+    Yields:
+        {"paragraph_id", "change": "added"|"removed"|"modified",
+         "chapter_id", "fields": {field: {"old", "new"}}}
+    """
+    counts = {'added': 0, 'removed': 0, 'modified': 0, 'unchanged': 0}
+    pending_old: Dict[str, tuple] = {}
+    pending_new: Dict[str, tuple] = {}
+
+    def compare(old_item, new_item):
+        (old_node, _), (new_node, chapter_id) = old_item, new_item
+        if old_node == new_node:
+            counts['unchanged'] += 1
+            return None
+        counts['modified'] += 1
+        return {
+            'paragraph_id': new_node['id'],
+            'change': 'modified',
+            'chapter_id': chapter_id,
+            'fields': _field_changes(old_node, new_node),
+        }
+
+    for old_item, new_item in zip_longest(_iter_nodes(old_path), _iter_nodes(new_path)):
+        # Fast path: both files at the same paragraph
+        if old_item and new_item and old_item[0]['id'] == new_item[0]['id']:
+            change = compare(old_item, new_item)
+            if change:
+                yield change
+            continue
+
+        if old_item:
+            match = pending_new.pop(old_item[0]['id'], None)
+            if match:
+                change = compare(old_item, match)
+                if change:
+                    yield change
+            else:
+                pending_old[old_item[0]['id']] = old_item
+        if new_item:
+            match = pending_old.pop(new_item[0]['id'], None)
+            if match:
+                change = compare(match, new_item)
+                if change:
+                    yield change
+            else:
+                pending_new[new_item[0]['id']] = new_item
+
+    for paragraph_id, (node, chapter_id) in pending_old.items():
+        counts['removed'] += 1
+        yield {
+            'paragraph_id': paragraph_id,
+            'change': 'removed',
+            'chapter_id': chapter_id,
+            'fields': {field: {'old': value, 'new': None} for field, value in node.items() if field != 'id'},
+        }
+    for paragraph_id, (node, chapter_id) in pending_new.items():
+        counts['added'] += 1
+        yield {
+            'paragraph_id': paragraph_id,
+            'change': 'added',
+            'chapter_id': chapter_id,
+            'fields': {field: {'old': None, 'new': value} for field, value in node.items() if field != 'id'},
+        }
+
+    if summary is not None:
+        summary.update(counts)
+
+
+def _changes_and_summary(old_path, new_path, changes, summary):
+    if changes is None:
+        summary = {}
+        changes = iter_paragraph_changes(old_path, new_path, summary)
+    return changes, summary
+
+
+def _json_head(old_path, new_path) -> str:
+    return '{"old": %s, "new": %s, "changes": [' % (json.dumps(str(old_path)), json.dumps(str(new_path)))
+
+
+def _json_change(change: Dict) -> str:
+    return json.dumps(change, ensure_ascii=False)
+
+
+def _json_tail(summary: Dict) -> str:
+    return '], "summary": %s}' % json.dumps(summary)
+
+
+def iter_json_report(old_path, new_path, changes: Optional[Iterable[Dict]] = None,
+                     summary: Optional[Dict] = None) -> Iterator[str]:
+    """
+    Stream {"old", "new", "changes": [...], "summary"} as JSON text.
+
+    Args:
+        old_path, new_path: JSON files to compare
+        changes, summary: Result of an earlier iter_paragraph_changes run,
+            to render without diffing again
+    """
+    changes, summary = _changes_and_summary(old_path, new_path, changes, summary)
+    yield _json_head(old_path, new_path)
+    separator = ''
+    for change in changes:
+        yield separator + _json_change(change)
+        separator = ', '
+    yield _json_tail(summary)
+
+
+def _inline_diff(old: str, new: str) -> str:
+    if len(old) + len(new) > INLINE_DIFF_MAX_CHARS:
+        return f'<del>{html.escape(old)}</del><ins>{html.escape(new)}</ins>'
+    parts = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            parts.append(html.escape(old[i1:i2]))
+            continue
+        if i2 > i1:
+            parts.append(f'<del>{html.escape(old[i1:i2])}</del>')
+        if j2 > j1:
+            parts.append(f'<ins>{html.escape(new[j1:j2])}</ins>')
+    return ''.join(parts)
+
+
+def _html_value(value) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return html.escape(value)
+    return html.escape(json.dumps(value, ensure_ascii=False))
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Translation review: {title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; }}
+table {{ border-collapse: collapse; width: 100%; margin-bottom: 1.5rem; }}
+th, td {{ border: 1px solid #e5e7eb; padding: 0.4rem; vertical-align: top; text-align: left; }}
+h2 {{ font-size: 1rem; margin-bottom: 0.3rem; }}
+.added h2 {{ color: #047857; }} .removed h2 {{ color: #b91c1c; }}
+del {{ background: #fee2e2; }} ins {{ background: #d1fae5; text-decoration: none; }}
+</style></head><body>
+<h1>Translation review</h1>
+<p>{old} &rarr; {new}</p>
+"""
+
+
+def _html_head(old_path, new_path) -> str:
+    return _HTML_HEAD.format(
+        title=html.escape(Path(new_path).name),
+        old=html.escape(str(old_path)),
+        new=html.escape(str(new_path)),
+    )
+
+
+def _html_change(change: Dict) -> str:
+    rows = []
+    for field, values in change['fields'].items():
+        old_value, new_value = values['old'], values['new']
+        if change['change'] == 'modified' and isinstance(old_value, str) and isinstance(new_value, str):
+            rendered = _inline_diff(old_value, new_value)
+        elif change['change'] == 'removed':
+            rendered = f'<del>{_html_value(old_value)}</del>'
+        elif change['change'] == 'added':
+            rendered = f'<ins>{_html_value(new_value)}</ins>'
+        else:
+            rendered = f'<del>{_html_value(old_value)}</del> <ins>{_html_value(new_value)}</ins>'
+        rows.append(f'<tr><th>{html.escape(field)}</th><td>{rendered}</td></tr>')
+    return (
+        f'<section class="{change["change"]}">'
+        f'<h2>{html.escape(str(change["paragraph_id"]))} &middot; chapter '
+        f'{html.escape(str(change["chapter_id"]))} &middot; {change["change"]}</h2>'
+        f'<table>{"".join(rows)}</table></section>\n'
+    )
+
+
+def _html_tail(summary: Dict) -> str:
+    return (
+        f'<p>{summary["modified"]} modified, {summary["added"]} added, '
+        f'{summary["removed"]} removed, {summary["unchanged"]} unchanged.</p>'
+        '</body></html>\n'
+    )
+
+
+def iter_html_report(old_path, new_path, changes: Optional[Iterable[Dict]] = None,
+                     summary: Optional[Dict] = None) -> Iterator[str]:
+    """Stream a human-readable HTML review of the changes (see iter_json_report)"""
+    changes, summary = _changes_and_summary(old_path, new_path, changes, summary)
+    yield _html_head(old_path, new_path)
+    for change in changes:
+        yield _html_change(change)
+    yield _html_tail(summary)
+
+
+def write_review_reports(path) -> Optional[Dict]:
+    """
+    Write <file>.review.json and <file>.review.html for the last save.
+
+    Compares the previous generation (<file>.1) with the current file in
+    one pass, writing each change to both reports as it is found, so the
+    changes are never held in memory together. Each report replaces its
+    predecessor atomically.
+
+    Returns:
+        Summary counts, or None when there is no previous generation
+    """
+    path = Path(path)
+    previous = generation_path(path, 1)
+    if not previous.exists():
+        return None
+
+    summary = {}
+    with atomic_writer(path.with_name(f"{path.name}.review.json")) as json_file, \
+            atomic_writer(path.with_name(f"{path.name}.review.html")) as html_file:
+        json_file.write(_json_head(previous, path))
+        html_file.write(_html_head(previous, path))
+        separator = ''
+        for change in iter_paragraph_changes(previous, path, summary):
+            json_file.write(separator + _json_change(change))
+            html_file.write(_html_change(change))
+            separator = ', '
+        json_file.write(_json_tail(summary))
+        html_file.write(_html_tail(summary))
+    return summary
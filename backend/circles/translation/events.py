@@ -0,0 +1,154 @@
+"""
+Translation Circle Change Feed
+
+Paragraph deltas for collaborators in one TranslationSession.
+
+Every paragraph write takes the next number from the session's change
+sequence (TranslationSession.change_seq) and stores it on the paragraph,
+so "what changed after N" is one indexed query and survives restarts.
+The event stream polls that index; it holds no state beyond the last
+sequence number sent.
+
+Functions:
+- paragraph_changes: Deltas for paragraphs written after a sequence number
+- session_event_stream: Async generator of Server-Sent Events for a session
+
+Status: Phase 2 - Implementation
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import AsyncIterator, Dict, List
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from .models import TranslationSession, ParagraphCorrection
+
+# Columns read per delta; the *_key lookups are joined in the same query
+DELTA_FIELDS = (
+    'id',
+    'paragraph_id',
+    'status',
+    'corrected_translation',
+    'version',
+    'change_seq',
+    'last_modified_at',
+    'last_modified_by__key',
+    'approved_by__key',
+)
+
+
+def _stream_setting(name, default):
+    return settings.TRANSLATION_CONFIG.get(name, default)
+
+
+def paragraph_changes(session_id: int, since: int, limit: int, include_text: bool = True) -> List[Dict]:
+    """
+    Deltas for paragraphs written after a change sequence number.
+
+    A paragraph written several times appears once, at its latest
+    sequence number.
+
+    Args:
+        session_id: TranslationSession ID
+        since: Last change sequence number the client has seen
+        limit: Maximum number of deltas
+        include_text: Send corrected_translation, not just its hash
+
+    Returns:
+        Deltas in change sequence order
+    """
+    rows = ParagraphCorrection.objects.filter(
+        session_id=session_id, change_seq__gt=since
+    ).order_by('change_seq').values(*DELTA_FIELDS)[:limit]
+
+    deltas = []
+    for row in rows:
+        text = row.pop('corrected_translation')
+        row['text_hash'] = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        if include_text:
+            row['corrected_translation'] = text
+        row['last_modified_by_key'] = row.pop('last_modified_by__key')
+        row['approved_by_key'] = row.pop('approved_by__key')
+        row['last_modified_at'] = row['last_modified_at'].isoformat()
+        deltas.append(row)
+    return deltas
+
+
+def _format_event(event: str, data: Dict, event_id=None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data, ensure_ascii=False)}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def _poll(session_id: int, since: int, limit: int, include_text: bool):
+    """One round trip for the stream: session status plus new deltas"""
+    try:
+        session_status = TranslationSession.objects.filter(
+            pk=session_id
+        ).values_list('status', flat=True).first()
+        return session_status, paragraph_changes(session_id, since, limit, include_text)
+    finally:
+        # Runs on a shared worker thread outside the request cycle; honour
+        # CONN_MAX_AGE the way request_finished would
+        close_old_connections()
+
+
+async def session_event_stream(session_id: int, since: int, include_text: bool = True) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for one session, starting after a change sequence.
+
+    Each paragraph event carries its sequence number as the event id, so
+    a reconnecting EventSource resumes via Last-Event-ID. The stream ends
+    when the session stops being active, or after
+    TRANSLATION_CONFIG['event_stream_max_seconds'] so connections are
+    recycled; clients reconnect from the last id.
+
+    Args:
+        session_id: TranslationSession ID
+        since: Last change sequence number the client has seen
+        include_text: Send corrected_translation, not just its hash
+
+    Yields:
+        Encoded SSE messages
+    """
+    poll_interval = _stream_setting('event_poll_interval', 1.0)
+    heartbeat = _stream_setting('event_heartbeat_seconds', 15)
+    max_seconds = _stream_setting('event_stream_max_seconds', 300)
+    batch_size = _stream_setting('event_batch_size', 200)
+    poll = sync_to_async(_poll, thread_sensitive=False)
+
+    # Ask EventSource to reconnect promptly when the stream is recycled
+    yield f'retry: {int(poll_interval * 1000)}\n\n'
+
+    started = last_sent = time.monotonic()
+    while True:
+        session_status, deltas = await poll(session_id, since, batch_size, include_text)
+        for delta in deltas:
+            since = delta['change_seq']
+            yield _format_event('paragraph', delta, event_id=since)
+        if deltas:
+            last_sent = time.monotonic()
+            # A full batch means more are waiting: fetch them without sleeping
+            if len(deltas) == batch_size:
+                continue
+
+        if session_status != 'active':
+            yield _format_event('session_ended', {'session_id': session_id, 'status': session_status})
+            return
+
+        now = time.monotonic()
+        if now - started >= max_seconds:
+            return
+        if now - last_sent >= heartbeat:
+            yield ': keepalive\n\n'
+            last_sent = now
+
+        await asyncio.sleep(poll_interval)
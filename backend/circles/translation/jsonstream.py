@@ -0,0 +1,215 @@
+"""
+Translation Circle JSON Streaming
+
+Incremental reader for translation JSON files.
+
+Walks the content -> chapters -> sections -> content -> subsection layout
+while the file is being read, materializing one content item (paragraph or
+subsection) at a time. Memory use is bounded by the largest single item
+plus the read buffer, whatever the size of the book.
+
+Functions:
+- iter_paragraph_nodes_streaming: Yield (metadata, paragraph, chapter_id, section_id)
+- iter_item_paragraphs: Paragraphs of one content item (shared with the parsed walk)
+
+Status: Phase 2 - Implementation
+"""
+
+import json
+from typing import Dict, Iterator, Tuple
+
+DEFAULT_READ_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789.eE+-'
+
+
+class _JSONStream:
+    """Character buffer over a text file with just enough JSON parsing to walk it"""
+
+    def __init__(self, f, read_size: int = DEFAULT_READ_SIZE):
+        self._file = f
+        self._read_size = read_size
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read another chunk into the buffer; return False at end of file"""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop the consumed prefix so the buffer stays bounded
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON file")
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(
+                f"Expected '{char}' but found '{self._buffer[self._pos]}' in JSON file"
+            )
+        self._pos += 1
+
+    def decode_value(self):
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number running up to the end of the buffer may continue in
+            # the next chunk: "12." decodes as 12 and "1e" as 1, so any
+            # number characters left before the end count too
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                rest = end
+                while rest < len(self._buffer) and self._buffer[rest] in _NUMBER_CHARS:
+                    rest += 1
+                if rest == len(self._buffer) and self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yield each key of the next object.
+
+        After every yield the caller must consume exactly one value
+        (decode_value, iter_object or iter_array) before resuming.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.decode_value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self.expect('}')
+            return
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Yield once per element of the next array.
+
+        After every yield the caller must consume exactly one value.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self.expect(']')
+            return
+
+
+def iter_item_paragraphs(item: Dict) -> Iterator[Dict]:
+    """
+    Yield the paragraphs of one section content item: the item itself, or
+    the paragraphs of a subsection.
+
+    The streaming reader and the walk over parsed documents
+    (services.iter_located_paragraph_nodes) both use this, so they agree
+    on what counts as a paragraph.
+    """
+    if item.get('type') == 'paragraph':
+        yield item
+    elif item.get('type') == 'subsection':
+        for sub_item in item.get('content', []):
+            if sub_item.get('type') == 'paragraph':
+                yield sub_item
+
+
+def _iter_chapter(stream: _JSONStream, section_id, is_section: bool):
+    chapter_id = None
+    for key in stream.iter_object():
+        if key == 'sections' and stream.peek() == '[':
+            for _ in stream.iter_array():
+                for sect_key in stream.iter_object():
+                    if sect_key == 'content' and stream.peek() == '[':
+                        for _ in stream.iter_array():
+                            item = stream.decode_value()
+                            if not is_section or not isinstance(item, dict):
+                                continue
+                            for para in iter_item_paragraphs(item):
+                                yield para, chapter_id, section_id
+                    else:
+                        stream.decode_value()
+        elif key == 'id':
+            chapter_id = stream.decode_value()
+        else:
+            stream.decode_value()
+
+
+def _iter_section(stream: _JSONStream):
+    section_id = None
+    section_type = None
+    for key in stream.iter_object():
+        if key == 'chapters' and stream.peek() == '[':
+            for _ in stream.iter_array():
+                yield from _iter_chapter(stream, section_id, section_type == 'section')
+        elif key == 'id':
+            section_id = stream.decode_value()
+        elif key == 'type':
+            section_type = stream.decode_value()
+        else:
+            stream.decode_value()
+
+
+def iter_paragraph_nodes_streaming(
+    path, read_size: int = DEFAULT_READ_SIZE
+) -> Iterator[Tuple[Dict, Dict, object, object]]:
+    """
+    Stream paragraphs from a translation JSON file.
+
+    Yields the same paragraphs, in the same order, as walking the fully
+    parsed document. Section and chapter "type" and "id" keys must appear
+    before their "chapters"/"sections" lists, and "metadata" before
+    "content", as in every file the pipeline produces.
+
+    Args:
+        path: Path to the JSON file
+        read_size: Characters read from the file per buffer refill
+
+    Yields:
+        Tuples of (metadata, paragraph dict, chapter_id, section_id)
+    """
+    metadata = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JSONStream(f, read_size)
+        for key in stream.iter_object():
+            if key == 'metadata':
+                metadata = stream.decode_value()
+            elif key == 'content' and stream.peek() == '[':
+                for _ in stream.iter_array():
+                    if stream.peek() != '{':
+                        stream.decode_value()
+                        continue
+                    for para, chapter_id, section_id in _iter_section(stream):
+                        yield metadata, para, chapter_id, section_id
+            else:
+                stream.decode_value()
@@ -0,0 +1,54 @@
+"""
+Backfill the translation memory from paragraphs already approved.
+
+Counts are recomputed, not added to: every approved paragraph of a
+document is counted once, at its text in the latest session that approved
+it, so the command can be run again safely.
+
+Usage: python manage.py build_translation_memory [--language thai]
+"""
+
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from circles.translation.memory import recount_approved
+from circles.translation.models import TranslationSession, ParagraphCorrection
+
+
+class Command(BaseCommand):
+    help = "Add approved paragraphs from all sessions to the translation memory"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--language', help="Only this target language")
+
+    def handle(self, *args, **options):
+        # {language: {document_id: {paragraph_id: paragraph}}}, later sessions winning
+        approved = defaultdict(lambda: defaultdict(dict))
+        documents = {}
+        sessions = TranslationSession.objects.select_related('document').order_by('id')
+        for session in sessions:
+            # Paragraphs hold each session's first language (see TranslationSession.primary_language)
+            language = session.primary_language
+            if options['language'] and language != options['language']:
+                continue
+            documents[session.document_id] = session.document
+            paragraphs = ParagraphCorrection.objects.filter(
+                session=session, status='approved'
+            ).only('paragraph_id', 'text', 'corrected_translation')
+            for paragraph in paragraphs.iterator(chunk_size=1000):
+                approved[language][session.document_id][paragraph.paragraph_id] = paragraph
+
+        created = 0
+        for language, by_document in approved.items():
+            with transaction.atomic():
+                added = recount_approved(
+                    ((documents[document_id], paragraphs.values())
+                     for document_id, paragraphs in by_document.items()),
+                    language,
+                )
+            created += added
+            self.stdout.write(f"{language}: {len(by_document)} documents, {added} new entries")
+
+        self.stdout.write(self.style.SUCCESS(f"Translation memory: {created} new entries"))
@@ -0,0 +1,310 @@
+"""
+Translation Circle Translation Memory
+
+Reuse of approved translations for repeated or near-repeated passages.
+
+Every approved paragraph is stored as a (source, translation) pair. The
+source is normalized and cut into character shingles; a MinHash signature
+over the shingles is split into bands, and each band is stored as an
+indexed key (locality-sensitive hashing). A lookup fetches only the
+entries that share a band with the query - pairs whose sources are
+likely similar - and ranks them by exact shingle Jaccard similarity.
+
+Functions:
+- normalize_source: Canonical form of a source paragraph
+- record_approved: Add approved paragraphs to the memory
+- recount_approved: Recompute counts from approved paragraphs (backfill)
+- is_recorded: Whether a paragraph's pair is in the memory
+- suggest: Top-k prior translations for a source text
+
+Status: Phase 2 - Implementation
+"""
+
+import hashlib
+import re
+import struct
+from typing import Dict, Iterable, List, Set
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .models import TranslationMemoryEntry, TranslationMemoryBand
+
+SHINGLE_SIZE = 3
+
+# 32 signature slots in 8 bands of 4: pairs with Jaccard similarity 0.5
+# share a band with probability ~0.4, at 0.8 with probability ~0.99
+SIGNATURE_SIZE = 32
+BAND_ROWS = 4
+
+# Tries of record_approved when concurrent approvals insert the same pair
+RECORD_ATTEMPTS = 3
+
+# Upper bound on candidates re-ranked per lookup
+MAX_CANDIDATES = 200
+
+_SLOT_BITS = (SIGNATURE_SIZE - 1).bit_length()
+_EMPTY = 2 ** 64
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def normalize_source(text: str) -> str:
+    """Casefold, drop punctuation and collapse whitespace"""
+    return ' '.join(_NON_WORD_RE.sub(' ', text.casefold()).split())
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def shingles(normalized: str) -> Set[str]:
+    """Overlapping character shingles of normalized text"""
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def _base_hashes(shingle_set: Set[str]) -> List[int]:
+    return [
+        struct.unpack('<Q', hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest())[0]
+        for s in shingle_set
+    ]
+
+
+def band_keys(language: str, shingle_set: Set[str]) -> List[int]:
+    """LSH band keys (signed 64-bit) of a shingle set, scoped to a language"""
+    if not shingle_set:
+        return []
+    # One-permutation MinHash: each shingle hash lands in one slot (its low
+    # bits) and each slot keeps its minimum, so the cost is one hash per
+    # shingle whatever the signature size
+    signature = [_EMPTY] * SIGNATURE_SIZE
+    for h in _base_hashes(shingle_set):
+        slot = h & (SIGNATURE_SIZE - 1)
+        value = h >> _SLOT_BITS
+        if value < signature[slot]:
+            signature[slot] = value
+
+    # Densify: an empty slot borrows the nearest following filled slot's
+    # value, tagged with the distance in the bits the slot index freed, so
+    # short texts still produce comparable bands
+    filled = signature[:]
+    for slot in range(SIGNATURE_SIZE):
+        if filled[slot] != _EMPTY:
+            continue
+        for distance in range(1, SIGNATURE_SIZE):
+            value = filled[(slot + distance) % SIGNATURE_SIZE]
+            if value != _EMPTY:
+                signature[slot] = value | (distance << (64 - _SLOT_BITS))
+                break
+
+    keys = []
+    for band in range(SIGNATURE_SIZE // BAND_ROWS):
+        rows = signature[band * BAND_ROWS:(band + 1) * BAND_ROWS]
+        digest = hashlib.blake2b(
+            struct.pack(f'<{BAND_ROWS}Q', *rows),
+            digest_size=8,
+            person=f'{band}:{language}'.encode('utf-8')[:16]
+        ).digest()
+        keys.append(struct.unpack('<q', digest)[0])
+    return keys
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _add_pairs(pairs: Dict[tuple, Dict], paragraphs: Iterable, document):
+    """Count the (source, target) pairs of paragraphs into pairs; the last occurrence names the source"""
+    for paragraph in paragraphs:
+        normalized = normalize_source(paragraph.text or '')
+        target = (paragraph.corrected_translation or '').strip()
+        if not normalized or not target:
+            continue
+        key = (_hash_text(normalized), _hash_text(target))
+        if key in pairs:
+            pairs[key]['count'] += 1
+            pairs[key]['document'] = document
+            pairs[key]['paragraph_id'] = paragraph.paragraph_id
+        else:
+            pairs[key] = {
+                'source': paragraph.text,
+                'normalized': normalized,
+                'target': target,
+                'document': document,
+                'paragraph_id': paragraph.paragraph_id,
+                'count': 1,
+            }
+
+
+def record_approved(paragraphs: Iterable, language: str, document=None) -> int:
+    """
+    Add approved paragraphs to the translation memory.
+
+    Pairs already in the memory have their occurrence count bumped, so
+    call this once per approval: not again for a paragraph that is still
+    approved with the same text. When a concurrent approval inserts the
+    same pair first, the unique constraint rejects the insert and the
+    pairs are recorded again, now as existing entries. Call inside the
+    approving transaction.
+
+    Args:
+        paragraphs: Objects with text, corrected_translation and paragraph_id
+        language: Target language of the translations
+        document: TranslationDocument the paragraphs belong to
+
+    Returns:
+        Number of new entries
+    """
+    pairs: Dict[tuple, Dict] = {}
+    _add_pairs(pairs, paragraphs, document)
+    return _save_pairs(pairs, language, replace_counts=False)
+
+
+def is_recorded(paragraph, language: str) -> bool:
+    """Whether a paragraph's current (source, target) pair is already in the memory"""
+    normalized = normalize_source(paragraph.text or '')
+    target = (paragraph.corrected_translation or '').strip()
+    return TranslationMemoryEntry.objects.filter(
+        language=language, source_hash=_hash_text(normalized), target_hash=_hash_text(target)
+    ).exists()
+
+
+def recount_approved(documents: Iterable[tuple], language: str) -> int:
+    """
+    Recompute the occurrence counts of the pairs of these paragraphs.
+
+    Existing entries get their count set to the number of paragraphs
+    given with the pair (not added to), so running this again over the
+    same paragraphs changes nothing. Each paragraph of a document must be
+    given once. Entries of pairs not given are left alone.
+
+    Args:
+        documents: (TranslationDocument, approved paragraphs) tuples
+        language: Target language of the translations
+
+    Returns:
+        Number of new entries
+    """
+    pairs: Dict[tuple, Dict] = {}
+    for document, paragraphs in documents:
+        _add_pairs(pairs, paragraphs, document)
+    return _save_pairs(pairs, language, replace_counts=True)
+
+
+def _save_pairs(pairs: Dict[tuple, Dict], language: str, replace_counts: bool) -> int:
+    if not pairs:
+        return 0
+
+    now = timezone.now()
+    for attempt in range(1, RECORD_ATTEMPTS + 1):
+        try:
+            # Savepoint: a lost insert race rolls back this attempt only
+            with transaction.atomic():
+                return _record_pairs(dict(pairs), language, now, replace_counts)
+        except IntegrityError:
+            # Another approval inserted one of the pairs first; on retry
+            # it is found and counted as an existing entry
+            if attempt == RECORD_ATTEMPTS:
+                raise
+
+
+def _record_pairs(pairs: Dict[tuple, Dict], language: str, now, replace_counts: bool) -> int:
+    existing = TranslationMemoryEntry.objects.filter(
+        language=language,
+        source_hash__in={source_hash for source_hash, _ in pairs},
+    ).values_list('id', 'source_hash', 'target_hash')
+    for entry_id, source_hash, target_hash in existing:
+        pair = pairs.pop((source_hash, target_hash), None)
+        if pair is not None:
+            TranslationMemoryEntry.objects.filter(pk=entry_id).update(
+                occurrences=pair['count'] if replace_counts else F('occurrences') + pair['count'],
+                last_approved_at=now,
+                document=pair['document'],
+                paragraph_id=pair['paragraph_id'],
+            )
+
+    entries = TranslationMemoryEntry.objects.bulk_create([
+        TranslationMemoryEntry(
+            language=language,
+            source_text=pair['source'],
+            target_text=pair['target'],
+            source_hash=source_hash,
+            target_hash=target_hash,
+            document=pair['document'],
+            paragraph_id=pair['paragraph_id'],
+            occurrences=pair['count'],
+            created_at=now,
+            last_approved_at=now,
+        )
+        for (source_hash, target_hash), pair in pairs.items()
+    ])
+    TranslationMemoryBand.objects.bulk_create([
+        TranslationMemoryBand(entry=entry, key=key)
+        for entry, pair in zip(entries, pairs.values())
+        for key in band_keys(language, shingles(pair['normalized']))
+    ], batch_size=1000)
+    return len(entries)
+
+
+def suggest(text: str, language: str, k: int = 5, min_similarity: float = 0.5,
+            exclude_document=None, exclude_paragraph_id: str = '') -> List[Dict]:
+    """
+    Top-k approved translations of sources similar to text.
+
+    Args:
+        text: Source paragraph to translate
+        language: Target language
+        k: Maximum suggestions
+        min_similarity: Minimum shingle Jaccard similarity (0..1)
+        exclude_document, exclude_paragraph_id: Skip the paragraph's own
+            entry (a suggestion for itself)
+
+    Returns:
+        Suggestions, most similar (then most often approved) first
+    """
+    normalized = normalize_source(text or '')
+    query_shingles = shingles(normalized)
+    keys = band_keys(language, query_shingles)
+    if not keys:
+        return []
+
+    candidate_ids = list(
+        TranslationMemoryBand.objects.filter(key__in=keys)
+        .values('entry')
+        .annotate(shared=Count('id'))
+        .order_by('-shared')
+        .values_list('entry', flat=True)[:MAX_CANDIDATES]
+    )
+    entries = TranslationMemoryEntry.objects.filter(
+        id__in=candidate_ids, language=language
+    ).select_related('document')
+    if exclude_document is not None and exclude_paragraph_id:
+        entries = entries.exclude(document=exclude_document, paragraph_id=exclude_paragraph_id)
+
+    source_hash = _hash_text(normalized)
+    suggestions = []
+    for entry in entries:
+        if entry.source_hash == source_hash:
+            similarity = 1.0
+        else:
+            similarity = jaccard(query_shingles, shingles(normalize_source(entry.source_text)))
+        if similarity < min_similarity:
+            continue
+        suggestions.append({
+            'entry_id': entry.id,
+            'similarity': round(similarity, 4),
+            'source_text': entry.source_text,
+            'target_text': entry.target_text,
+            'occurrences': entry.occurrences,
+            'document_title': entry.document.title if entry.document else None,
+            'paragraph_id': entry.paragraph_id,
+            'last_approved_at': entry.last_approved_at,
+        })
+
+    suggestions.sort(key=lambda s: (-s['similarity'], -s['occurrences']))
+    return suggestions[:k]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paragraphcorrection',
+            name='fingerprint',
+            field=models.CharField(blank=True, help_text='Fingerprint of the JSON-backed fields as currently stored', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='paragraphcorrection',
+            name='loaded_fingerprint',
+            field=models.CharField(blank=True, help_text='Fingerprint of the JSON-backed fields when the session was loaded', max_length=40),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('translation', '0002_paragraphcorrection_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paragraphcorrection',
+            index=models.Index(fields=['session', 'chapter_id', 'paragraph_id'], name='translation_session_478f6d_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:07
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_status_counters(apps, schema_editor):
+    """Count existing sessions' paragraphs by status"""
+    TranslationSession = apps.get_model('translation', 'TranslationSession')
+    ParagraphCorrection = apps.get_model('translation', 'ParagraphCorrection')
+
+    counts = {}
+    rows = ParagraphCorrection.objects.values('session_id', 'status').annotate(n=Count('id'))
+    for row in rows:
+        counts.setdefault(row['session_id'], {})[row['status']] = row['n']
+
+    for session_id, by_status in counts.items():
+        TranslationSession.objects.filter(pk=session_id).update(
+            paragraphs_unchecked=by_status.get('unchecked', 0),
+            paragraphs_in_progress=by_status.get('in_progress', 0),
+            paragraphs_approved=by_status.get('approved', 0),
+            paragraphs_modified=by_status.get('in_progress', 0) + by_status.get('approved', 0),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translation', '0003_paragraphcorrection_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translationsession',
+            name='paragraphs_approved',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='translationsession',
+            name='paragraphs_in_progress',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='translationsession',
+            name='paragraphs_unchecked',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_status_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translation', '0004_translationsession_status_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paragraphcorrection',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('translation', '0005_paragraphcorrection_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paragraphcorrection',
+            name='change_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='translationsession',
+            name='change_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='paragraphcorrection',
+            index=models.Index(fields=['session', 'change_seq'], name='translation_session_7b690a_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:18
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translation', '0006_change_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemoryEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=50)),
+                ('source_text', models.TextField()),
+                ('target_text', models.TextField()),
+                ('source_hash', models.CharField(help_text='SHA-1 of the normalized source text', max_length=40)),
+                ('target_hash', models.CharField(max_length=40)),
+                ('paragraph_id', models.CharField(blank=True, max_length=50)),
+                ('occurrences', models.IntegerField(default=1)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_approved_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('document', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='memory_entries', to='translation.translationdocument')),
+            ],
+            options={
+                'verbose_name': 'Translation Memory Entry',
+                'verbose_name_plural': 'Translation Memory Entries',
+                'unique_together': {('language', 'source_hash', 'target_hash')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TranslationMemoryBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.BigIntegerField(db_index=True)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bands', to='translation.translationmemoryentry')),
+            ],
+            options={
+                'verbose_name': 'Translation Memory Band',
+                'verbose_name_plural': 'Translation Memory Bands',
+            },
+        ),
+    ]
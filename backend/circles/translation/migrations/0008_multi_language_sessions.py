@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('translation', '0007_translation_memory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translationsession',
+            name='languages',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.CreateModel(
+            name='ParagraphTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=50)),
+                ('original_translation', models.TextField()),
+                ('corrected_translation', models.TextField()),
+                ('status', models.CharField(choices=[('unchecked', 'Unchecked'), ('in_progress', 'In Progress'), ('approved', 'Approved')], default='unchecked', max_length=20)),
+                ('last_modified_at', models.DateTimeField(auto_now=True)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('loaded_fingerprint', models.CharField(blank=True, max_length=40)),
+                ('fingerprint', models.CharField(blank=True, max_length=40)),
+                ('approved_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='approved_translations', to='authentication.accesskey')),
+                ('last_modified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='translation_edits', to='authentication.accesskey')),
+                ('paragraph', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='translation.paragraphcorrection')),
+            ],
+            options={
+                'verbose_name': 'Paragraph Translation',
+                'verbose_name_plural': 'Paragraph Translations',
+                'unique_together': {('paragraph', 'language')},
+            },
+        ),
+    ]
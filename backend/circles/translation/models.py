@@ -13,11 +13,17 @@ Models:
 - TranslationDocument: Metadata about JSON translation files
 - TranslationSession: Active editing sessions
 - ParagraphCorrection: Paragraph-level edits (temporary, session-scoped)
+- ParagraphTranslation: Per-language edits in multi-language sessions
+- TranslationMemoryEntry: Approved source/translation pairs, across documents
+- TranslationMemoryBand: MinHash LSH band keys for fuzzy memory lookup
 
 Status: Phase 2 - Implementation
 """
 
+import hashlib
+
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 from circles.models import Circle
 from authentication.models import AccessKey
@@ -132,15 +138,127 @@ class TranslationSession(models.Model):
     total_paragraphs = models.IntegerField(default=0)
     paragraphs_modified = models.IntegerField(default=0)
 
+    # Per-status counters, maintained from status transitions
+    paragraphs_unchecked = models.IntegerField(default=0)
+    paragraphs_in_progress = models.IntegerField(default=0)
+    paragraphs_approved = models.IntegerField(default=0)
+
+    # Last change sequence number handed out to a paragraph write
+    change_seq = models.BigIntegerField(default=0)
+
+    # Multi-language mode: target languages reviewed in this session. The
+    # first is stored on ParagraphCorrection (and drives the counters),
+    # the others in ParagraphTranslation rows. Empty means the document's
+    # own language only.
+    languages = models.JSONField(default=list, blank=True)
+
+    STATUS_COUNTER_FIELDS = {
+        'unchecked': 'paragraphs_unchecked',
+        'in_progress': 'paragraphs_in_progress',
+        'approved': 'paragraphs_approved',
+    }
+
     def __str__(self):
         return f"Session {self.id} - {self.document.title} ({self.status})"
 
+    def record_status_changes(self, transitions):
+        """
+        Apply paragraph status transitions to the counters in one UPDATE.
+
+        Uses F() expressions, so concurrent editors never overwrite each
+        other's counts. Call inside the transaction that changes the
+        paragraph rows. In-memory counter values are not refreshed.
+
+        Statuses without a counter (e.g. loaded from a document written by
+        other tools) are skipped, as in create_session; they still count
+        as modified.
+
+        Args:
+            transitions: Iterable of (old_status, new_status) pairs
+        """
+        deltas = {}
+        for old_status, new_status in transitions:
+            if old_status == new_status:
+                continue
+            for status, step in ((old_status, -1), (new_status, 1)):
+                field = self.STATUS_COUNTER_FIELDS.get(status)
+                if field is not None:
+                    deltas[field] = deltas.get(field, 0) + step
+                if status != 'unchecked':
+                    deltas['paragraphs_modified'] = deltas.get('paragraphs_modified', 0) + step
+
+        updates = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if updates:
+            TranslationSession.objects.filter(pk=self.pk).update(**updates)
+
+    @property
+    def primary_language(self):
+        """Language held on ParagraphCorrection: the first session language, else the document's"""
+        return self.languages[0] if self.languages else self.document.language
+
+    def allocate_change_seq(self, count=1):
+        """
+        Reserve count consecutive change sequence numbers.
+
+        The UPDATE locks the session row until the surrounding transaction
+        commits, so sequence numbers become visible in commit order and a
+        reader resuming after N never misses a later write. Call inside
+        the transaction that changes the paragraph rows, after locking them.
+
+        Returns: The first sequence number of the reserved range
+        """
+        TranslationSession.objects.filter(pk=self.pk).update(change_seq=F('change_seq') + count)
+        last = TranslationSession.objects.filter(pk=self.pk).values_list('change_seq', flat=True).get()
+        return last - count + 1
+
     class Meta:
         verbose_name = "Translation Session"
         verbose_name_plural = "Translation Sessions"
 
 
-class ParagraphCorrection(models.Model):
+class FingerprintedCorrectionMixin:
+    """
+    Versioning and change fingerprint shared by ParagraphCorrection and
+    ParagraphTranslation.
+
+    Expects corrected_translation, status, approved_by, approved_at,
+    version and fingerprint fields.
+    """
+
+    @staticmethod
+    def compute_fingerprint(corrected_translation: str, status: str,
+                            approved_by_id=None, approved_at=None) -> str:
+        """Hash the fields that are written back to the JSON file"""
+        parts = [
+            corrected_translation or '',
+            status or '',
+            str(approved_by_id or ''),
+            approved_at.isoformat() if approved_at else '',
+        ]
+        return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+    def refresh_fingerprint(self) -> str:
+        """Recompute fingerprint from the current field values"""
+        self.fingerprint = self.compute_fingerprint(
+            self.corrected_translation,
+            self.status,
+            self.approved_by_id,
+            self.approved_at,
+        )
+        return self.fingerprint
+
+    def save(self, *args, **kwargs):
+        """Keep fingerprint in sync and bump version on every update"""
+        self.refresh_fingerprint()
+        if not self._state.adding:
+            self.version += 1
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'fingerprint', 'version'}
+        super().save(*args, **kwargs)
+
+
+class ParagraphCorrection(FingerprintedCorrectionMixin, models.Model):
     """
     Temporary storage for paragraph corrections during active session.
 
@@ -208,6 +326,24 @@ class ParagraphCorrection(models.Model):
     )
     approved_at = models.DateTimeField(null=True, blank=True)
 
+    # Optimistic concurrency: incremented on every save
+    version = models.PositiveIntegerField(default=1)
+
+    # Session change sequence of the latest write (0 = untouched since load)
+    change_seq = models.BigIntegerField(default=0)
+
+    # Change tracking for delta saves
+    loaded_fingerprint = models.CharField(
+        max_length=40,
+        blank=True,
+        help_text="Fingerprint of the JSON-backed fields when the session was loaded"
+    )
+    fingerprint = models.CharField(
+        max_length=40,
+        blank=True,
+        help_text="Fingerprint of the JSON-backed fields as currently stored"
+    )
+
     def __str__(self):
         return f"{self.paragraph_id} - {self.session.document.title}"
 
@@ -216,3 +352,130 @@ class ParagraphCorrection(models.Model):
         verbose_name_plural = "Paragraph Corrections"
         unique_together = ['session', 'paragraph_id']
         ordering = ['paragraph_id']
+        indexes = [
+            # Keyset pagination in list_paragraphs
+            models.Index(fields=['session', 'chapter_id', 'paragraph_id']),
+            # Change feed: paragraphs written after a sequence number
+            models.Index(fields=['session', 'change_seq']),
+        ]
+
+
+class ParagraphTranslation(FingerprintedCorrectionMixin, models.Model):
+    """
+    Correction of one paragraph in an additional target language.
+
+    Multi-language sessions load the English source once into
+    ParagraphCorrection (with the session's first language) and keep one
+    of these rows per further language, written back to the same JSON
+    paragraph when the session ends.
+    """
+    paragraph = models.ForeignKey(
+        ParagraphCorrection,
+        on_delete=models.CASCADE,
+        related_name='translations'
+    )
+    language = models.CharField(max_length=50)
+
+    original_translation = models.TextField()
+    corrected_translation = models.TextField()
+    status = models.CharField(
+        max_length=20,
+        choices=ParagraphCorrection.STATUS_CHOICES,
+        default='unchecked'
+    )
+
+    last_modified_by = models.ForeignKey(
+        AccessKey,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='translation_edits'
+    )
+    last_modified_at = models.DateTimeField(auto_now=True)
+    approved_by = models.ForeignKey(
+        AccessKey,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='approved_translations'
+    )
+    approved_at = models.DateTimeField(null=True, blank=True)
+
+    version = models.PositiveIntegerField(default=1)
+    loaded_fingerprint = models.CharField(max_length=40, blank=True)
+    fingerprint = models.CharField(max_length=40, blank=True)
+
+    def __str__(self):
+        return f"{self.paragraph.paragraph_id} ({self.language})"
+
+    # Source text and paragraph ID, for code written against ParagraphCorrection
+    @property
+    def text(self):
+        return self.paragraph.text
+
+    @property
+    def paragraph_id(self):
+        return self.paragraph.paragraph_id
+
+    class Meta:
+        verbose_name = "Paragraph Translation"
+        verbose_name_plural = "Paragraph Translations"
+        unique_together = ['paragraph', 'language']
+
+
+class TranslationMemoryEntry(models.Model):
+    """
+    An approved translation of a source paragraph.
+
+    Recorded when a facilitator approves a paragraph and kept after the
+    session ends, so later sessions (of any document) can reuse it.
+    Identical pairs are stored once and counted.
+    """
+    language = models.CharField(max_length=50)
+    source_text = models.TextField()
+    target_text = models.TextField()
+    source_hash = models.CharField(
+        max_length=40,
+        help_text="SHA-1 of the normalized source text"
+    )
+    target_hash = models.CharField(max_length=40)
+
+    # Where the pair was last approved
+    document = models.ForeignKey(
+        TranslationDocument,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='memory_entries'
+    )
+    paragraph_id = models.CharField(max_length=50, blank=True)
+    occurrences = models.IntegerField(default=1)
+    created_at = models.DateTimeField(default=timezone.now)
+    last_approved_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.language}: {self.source_text[:40]}"
+
+    class Meta:
+        verbose_name = "Translation Memory Entry"
+        verbose_name_plural = "Translation Memory Entries"
+        unique_together = ['language', 'source_hash', 'target_hash']
+
+
+class TranslationMemoryBand(models.Model):
+    """
+    One locality-sensitive hashing band of an entry's MinHash signature.
+
+    Entries sharing a band key with a query are fuzzy-match candidates;
+    the key already encodes the language and band number.
+    """
+    entry = models.ForeignKey(
+        TranslationMemoryEntry,
+        on_delete=models.CASCADE,
+        related_name='bands'
+    )
+    key = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        verbose_name = "Translation Memory Band"
+        verbose_name_plural = "Translation Memory Bands"
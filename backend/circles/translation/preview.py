@@ -0,0 +1,198 @@
+"""
+Translation Circle Document Preview
+
+Read-only, paginated view of a translation JSON file, served from the
+shared document cache without creating a session or touching the
+database.
+
+The outline (chapters, paragraph offsets and per-language status counts)
+is computed once per file version and kept in a small LRU keyed like the
+document cache, so it is recomputed exactly when the file changes. It
+holds no references into the parsed tree, which stays subject to the
+document cache's memory budget. A page is read by skipping whole chapters
+up to the requested offset, then formatting only the paragraphs returned.
+
+Functions:
+- document_etag: Version tag of a JSON file, for conditional requests
+- document_outline: Chapters, paragraph count and status per language
+- preview_page: Outline plus one page of paragraphs
+
+Status: Phase 2 - Implementation
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .services import document_cache, iter_chapter_paragraph_nodes
+
+# File versions whose outline is kept per worker
+MAX_OUTLINES = 32
+
+_outlines = OrderedDict()
+_outlines_lock = threading.Lock()
+
+
+def _iter_chapters(data: Dict) -> Iterator[Tuple[Dict, Dict]]:
+    """Yield (section, chapter) in document order"""
+    for section in data.get('content', []):
+        if section.get('type') == 'section':
+            for chapter in section.get('chapters', []):
+                yield section, chapter
+
+
+def _chapter_paragraphs(chapter: Dict) -> Iterator[Dict]:
+    # Nodes without an id are not paragraphs of the document (see
+    # JSONDocumentLoader._format_paragraph)
+    for node in iter_chapter_paragraph_nodes(chapter):
+        if node.get('id'):
+            yield node
+
+
+def _node_languages(node: Dict) -> Iterator[Tuple[str, str]]:
+    """(language, status) for every <language>_status field of a paragraph"""
+    for key, value in node.items():
+        if key.endswith('_status') and key != '_status':
+            yield key[:-len('_status')], value
+
+
+def _build_outline(key: Tuple[str, int, int], data: Dict) -> Dict:
+    chapters = []
+    totals: Dict[str, Dict[str, int]] = {}
+    offset = 0
+    for section, chapter in _iter_chapters(data):
+        counts: Dict[str, Dict[str, int]] = {}
+        paragraphs = 0
+        for node in _chapter_paragraphs(chapter):
+            paragraphs += 1
+            for language, status in _node_languages(node):
+                language_counts = counts.setdefault(language, {})
+                language_counts[status] = language_counts.get(status, 0) + 1
+        for language, language_counts in counts.items():
+            language_totals = totals.setdefault(language, {})
+            for status, count in language_counts.items():
+                language_totals[status] = language_totals.get(status, 0) + count
+        chapters.append({
+            'id': str(chapter.get('id')),
+            'title': chapter.get('title', ''),
+            'section_id': str(section.get('id')),
+            'section_title': section.get('title', ''),
+            'offset': offset,
+            'paragraphs': paragraphs,
+            'status': counts,
+        })
+        offset += paragraphs
+
+    return {
+        'etag': f'"{key[1]:x}-{key[2]:x}"',
+        'metadata': data.get('metadata', {}),
+        'paragraph_count': offset,
+        'languages': sorted(totals),
+        'status': totals,
+        'chapters': chapters,
+    }
+
+
+def document_etag(json_path) -> str:
+    """ETag of the file's current version (one stat; nothing is read)"""
+    stat = os.stat(json_path)
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def document_outline(json_path) -> Tuple[Dict, Dict]:
+    """
+    Outline of the current version of a JSON file.
+
+    Returns:
+        (outline, parsed document) - the document is the shared, read-only
+        tree from the document cache; the outline's "etag" identifies the
+        version both were read from
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    key, data = document_cache.get_versioned(json_path)
+    with _outlines_lock:
+        outline = _outlines.get(key)
+        if outline is not None:
+            _outlines.move_to_end(key)
+            return outline, data
+
+    outline = _build_outline(key, data)
+    with _outlines_lock:
+        _outlines[key] = outline
+        while len(_outlines) > MAX_OUTLINES:
+            _outlines.popitem(last=False)
+    return outline, data
+
+
+def _format_preview(node: Dict, index: int, chapter_id: str, section_id: str,
+                    languages: List[str]) -> Dict:
+    translations = {}
+    for language in languages:
+        text = node.get(f'{language}_text', '')
+        translations[language] = {
+            'text': text,
+            'corrected_text': node.get(f'corrected_{language}_text', text),
+            'status': node.get(f'{language}_status', 'unchecked'),
+        }
+    return {
+        'index': index,
+        'paragraph_id': node['id'],
+        'chapter_id': chapter_id,
+        'section_id': section_id,
+        'text': node.get('text', ''),
+        'translations': translations,
+    }
+
+
+def preview_page(json_path, offset: int = 0, limit: int = 50,
+                 chapter_id: Optional[str] = None) -> Optional[Dict]:
+    """
+    One page of a document's paragraphs, with its outline.
+
+    Args:
+        json_path: Translation JSON file
+        offset: Paragraphs to skip (within the chapter when chapter_id is given)
+        limit: Maximum paragraphs returned
+        chapter_id: Restrict the page to one chapter
+
+    Returns:
+        Outline fields plus "paragraphs", "offset", "limit" and "total"
+        (paragraphs in the document or chapter); None if chapter_id is
+        not in the document
+    """
+    outline, data = document_outline(json_path)
+
+    start, total = 0, outline['paragraph_count']
+    if chapter_id is not None:
+        chapter = next((c for c in outline['chapters'] if c['id'] == str(chapter_id)), None)
+        if chapter is None:
+            return None
+        start, total = chapter['offset'], chapter['paragraphs']
+
+    first = start + min(offset, total)
+    last = start + min(offset + limit, total)
+    paragraphs = []
+    for (section, chapter_node), chapter in zip(_iter_chapters(data), outline['chapters']):
+        chapter_end = chapter['offset'] + chapter['paragraphs']
+        if chapter_end <= first:
+            continue
+        if chapter['offset'] >= last:
+            break
+        for index, node in enumerate(_chapter_paragraphs(chapter_node), chapter['offset']):
+            if index >= last:
+                break
+            if index >= first:
+                paragraphs.append(_format_preview(
+                    node, index, chapter['id'], chapter['section_id'], outline['languages']
+                ))
+
+    return {
+        **outline,
+        'offset': offset,
+        'limit': limit,
+        'total': total,
+        'paragraphs': paragraphs,
+    }
@@ -0,0 +1,312 @@
+"""
+Translation Circle Search
+
+Full-text search over the paragraphs of a translation session.
+
+Each session gets an in-process inverted index over text,
+original_translation and corrected_translation, built on first search and
+kept current by replaying paragraphs written after the change sequence it
+was built at (see events.py). Every worker process catches up from the
+database on its own, so no coordination between processes is needed.
+
+Scripts written without spaces between words (Thai, Lao, Tibetan,
+Myanmar, Khmer, Chinese, Japanese) are indexed as overlapping character
+bigrams; everything else as casefolded words. Hits are ranked with BM25
+and verified against the text, so bigram coincidences never match.
+
+Classes:
+- SessionSearchIndex: Inverted index over one session's paragraphs
+- SearchIndexCache: Process-wide LRU of session indexes
+
+Status: Phase 2 - Implementation
+"""
+
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+
+from .models import ParagraphCorrection
+
+SEARCH_FIELDS = ('text', 'original_translation', 'corrected_translation')
+
+# Runs of word characters; Python's \w misses combining vowel signs and
+# tone marks (Thai, Tibetan, ...), so the blocks that use them are listed
+_WORD_RUN_RE = re.compile(
+    r'[\w\u0300-\u036f\u0e00-\u0eff\u0f00-\u0fff\u1000-\u109f\u1780-\u17ff]+'
+)
+
+# Scripts written without spaces between words
+_NGRAM_SCRIPT_RE = re.compile(
+    r'[\u0e00-\u0eff\u0f00-\u0fff\u1000-\u109f\u1780-\u17ff'
+    r'\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]'
+)
+
+NGRAM_SIZE = 2
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def _run_tokens(run: str) -> List[str]:
+    if _NGRAM_SCRIPT_RE.search(run) is None:
+        return [run]
+    if len(run) <= NGRAM_SIZE:
+        return [run]
+    return [run[i:i + NGRAM_SIZE] for i in range(len(run) - NGRAM_SIZE + 1)]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index tokens.
+
+    Words for space-separated scripts, character bigrams for scripts
+    written without spaces. Tokens are casefolded.
+    """
+    tokens = []
+    for match in _WORD_RUN_RE.finditer(text.casefold()):
+        tokens.extend(_run_tokens(match.group()))
+    return tokens
+
+
+def _term_pattern(term: str):
+    """Regex locating a query term in original (un-normalized) text"""
+    escaped = re.escape(term)
+    if _NGRAM_SCRIPT_RE.search(term) is None:
+        # Whole words only, mirroring the word tokens that matched
+        escaped = rf'(?<!\w){escaped}(?!\w)'
+    return re.compile(escaped, re.IGNORECASE)
+
+
+def _merge_spans(spans: List[Tuple[int, int]]) -> List[List[int]]:
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class SessionSearchIndex:
+    """
+    Inverted index over the paragraphs of one session.
+
+    Postings map field -> token -> {paragraph pk: term frequency}. Only
+    corrected_translation and status change during a session; refresh()
+    re-indexes the paragraphs written since the index was last current.
+    """
+
+    ROW_FIELDS = ('id', 'paragraph_id', 'chapter_id', 'status', *SEARCH_FIELDS)
+
+    def __init__(self, session_id: int):
+        self.session_id = session_id
+        self.change_seq = 0
+        self.paragraphs: Dict[int, Dict] = {}
+        self._postings = {field: {} for field in SEARCH_FIELDS}
+        self._lengths = {field: {} for field in SEARCH_FIELDS}
+        self._total_length = {field: 0 for field in SEARCH_FIELDS}
+        self.lock = threading.Lock()
+
+    def build(self, change_seq: int):
+        """
+        Index every paragraph in the session.
+
+        Args:
+            change_seq: Session change sequence read before the paragraphs,
+                so writes racing the build are replayed by the next refresh
+        """
+        rows = ParagraphCorrection.objects.filter(
+            session_id=self.session_id
+        ).values(*self.ROW_FIELDS)
+        for row in rows.iterator(chunk_size=2000):
+            self._add(row)
+        self.change_seq = change_seq
+
+    def refresh(self, change_seq: int):
+        """Re-index paragraphs written after the sequence the index is current to"""
+        if change_seq <= self.change_seq:
+            return
+        rows = ParagraphCorrection.objects.filter(
+            session_id=self.session_id, change_seq__gt=self.change_seq
+        ).values('id', 'status', 'corrected_translation')
+        for row in rows:
+            paragraph = self.paragraphs.get(row['id'])
+            if paragraph is None:
+                continue
+            paragraph['status'] = row['status']
+            if paragraph['corrected_translation'] != row['corrected_translation']:
+                self._remove_field(row['id'], 'corrected_translation')
+                paragraph['corrected_translation'] = row['corrected_translation']
+                self._add_field(row['id'], 'corrected_translation', row['corrected_translation'])
+        self.change_seq = change_seq
+
+    def _add(self, row: Dict):
+        self.paragraphs[row['id']] = row
+        for field in SEARCH_FIELDS:
+            self._add_field(row['id'], field, row[field] or '')
+
+    def _add_field(self, pk: int, field: str, text: str):
+        counts = Counter(tokenize(text))
+        postings = self._postings[field]
+        for token, tf in counts.items():
+            postings.setdefault(token, {})[pk] = tf
+        length = sum(counts.values())
+        self._lengths[field][pk] = length
+        self._total_length[field] += length
+
+    def _remove_field(self, pk: int, field: str):
+        text = self.paragraphs[pk][field] or ''
+        postings = self._postings[field]
+        for token in set(tokenize(text)):
+            docs = postings.get(token)
+            if docs is not None:
+                docs.pop(pk, None)
+                if not docs:
+                    del postings[token]
+        self._total_length[field] -= self._lengths[field].pop(pk, 0)
+
+    def _field_hits(self, field: str, tokens: List[str]) -> Dict[int, float]:
+        """BM25 score of every paragraph whose field contains all tokens"""
+        postings = self._postings[field]
+        token_docs = [postings.get(token) for token in set(tokens)]
+        if not token_docs or any(docs is None for docs in token_docs):
+            return {}
+        token_docs.sort(key=len)
+        candidates = set(token_docs[0])
+        for docs in token_docs[1:]:
+            candidates &= docs.keys()
+            if not candidates:
+                return {}
+
+        doc_count = len(self.paragraphs)
+        average_length = self._total_length[field] / doc_count if doc_count else 0
+        lengths = self._lengths[field]
+        scores = {}
+        for pk in candidates:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[pk] / (average_length or 1))
+            score = 0.0
+            for docs in token_docs:
+                idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                tf = docs[pk]
+                score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            scores[pk] = score
+        return scores
+
+    def search(self, query: str, fields: Iterable[str] = SEARCH_FIELDS) -> List[Dict]:
+        """
+        Ranked hits for a query.
+
+        A paragraph matches when one of the fields contains every query
+        term (whitespace-separated); terms in spaced scripts match whole
+        words, case-insensitively.
+
+        Returns:
+            Hits sorted by descending score, each with highlight offsets
+            (Unicode code points into the field text) per matched field
+        """
+        terms = [term for term in query.split() if tokenize(term)]
+        tokens = tokenize(' '.join(terms))
+        if not tokens:
+            return []
+        patterns = [_term_pattern(term) for term in terms]
+
+        scores: Dict[int, float] = {}
+        highlights: Dict[int, Dict[str, List[List[int]]]] = {}
+        for field in fields:
+            for pk, score in self._field_hits(field, tokens).items():
+                text = self.paragraphs[pk][field]
+                spans = []
+                for pattern in patterns:
+                    term_spans = [match.span() for match in pattern.finditer(text)]
+                    if not term_spans:
+                        break
+                    spans.extend(term_spans)
+                else:
+                    scores[pk] = scores.get(pk, 0.0) + score
+                    highlights.setdefault(pk, {})[field] = _merge_spans(spans)
+
+        hits = []
+        for pk in sorted(scores, key=lambda pk: (-scores[pk], pk)):
+            paragraph = self.paragraphs[pk]
+            hits.append({
+                'id': pk,
+                'paragraph_id': paragraph['paragraph_id'],
+                'chapter_id': paragraph['chapter_id'],
+                'status': paragraph['status'],
+                'score': round(scores[pk], 4),
+                'highlights': highlights[pk],
+            })
+        return hits
+
+
+class SearchIndexCache:
+    """
+    Process-wide LRU of session search indexes.
+
+    Indexes are built on first use and brought up to date with the
+    session's change sequence on every lookup.
+    """
+
+    def __init__(self, max_sessions: int):
+        self.max_sessions = max_sessions
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.evictions = 0
+
+    def search(self, session, query: str, fields: Iterable[str] = SEARCH_FIELDS) -> List[Dict]:
+        """
+        Search a session's paragraphs, building or refreshing its index first.
+
+        Args:
+            session: TranslationSession (its change_seq must be freshly read)
+            query: Search terms
+            fields: Subset of SEARCH_FIELDS to search
+        """
+        # started_at guards against a recycled primary key
+        key = (session.id, session.started_at)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = SessionSearchIndex(session.id)
+                self._indexes[key] = index
+                while len(self._indexes) > self.max_sessions:
+                    self._indexes.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self._indexes.move_to_end(key)
+
+        # Per-index lock: a build or refresh never blocks other sessions
+        with index.lock:
+            if not index.paragraphs:
+                index.build(session.change_seq)
+                with self._lock:
+                    self.builds += 1
+            else:
+                index.refresh(session.change_seq)
+            return index.search(query, fields)
+
+    def discard(self, session):
+        """Drop a session's index (e.g. when the session ends)"""
+        with self._lock:
+            self._indexes.pop((session.id, session.started_at), None)
+
+    def stats(self) -> Dict:
+        """Index count and build/eviction counters, for monitoring"""
+        with self._lock:
+            return {
+                'sessions': len(self._indexes),
+                'max_sessions': self.max_sessions,
+                'builds': self.builds,
+                'evictions': self.evictions,
+            }
+
+
+search_indexes = SearchIndexCache(
+    max_sessions=settings.TRANSLATION_CONFIG.get('search_index_max_sessions', 8)
+)
@@ -7,13 +7,19 @@ Serializers:
 - TranslationDocumentSerializer: Document metadata
 - TranslationSessionSerializer: Active session info
 - ParagraphCorrectionSerializer: Paragraph data and corrections
+- ParagraphTranslationSerializer: Per-language corrections (multi-language sessions)
 - ParagraphUpdateSerializer: For updating corrections
+- BulkParagraphUpdateSerializer: For updating many corrections at once
+- BulkApproveSerializer: For approving many paragraphs at once
 
 Status: Phase 2 - Implementation
 """
 
+import re
+
+from django.db.models import F
 from rest_framework import serializers
-from .models import TranslationDocument, TranslationSession, ParagraphCorrection
+from .models import TranslationDocument, TranslationSession, ParagraphCorrection, ParagraphTranslation
 
 
 class TranslationDocumentSerializer(serializers.ModelSerializer):
@@ -47,6 +53,11 @@ class TranslationDocumentSerializer(serializers.ModelSerializer):
             'last_saved_at',
         ]
 
+    @staticmethod
+    def optimize_queryset(queryset):
+        """Fetch the relations this serializer reads in the same query"""
+        return queryset.select_related('circle', 'created_by')
+
 
 class TranslationSessionSerializer(serializers.ModelSerializer):
     """Serialize translation session data"""
@@ -75,28 +86,40 @@ class TranslationSessionSerializer(serializers.ModelSerializer):
             'ended_by_key',
             'total_paragraphs',
             'paragraphs_modified',
+            'paragraphs_unchecked',
+            'paragraphs_in_progress',
+            'paragraphs_approved',
+            'change_seq',
+            'languages',
         ]
         read_only_fields = [
             'id',
             'started_at',
             'ended_at',
             'total_paragraphs',
+            'paragraphs_modified',
+            'paragraphs_unchecked',
+            'paragraphs_in_progress',
+            'paragraphs_approved',
+            'change_seq',
+            'languages',
         ]
 
+    @staticmethod
+    def optimize_queryset(queryset):
+        """Fetch the relations this serializer reads in the same query"""
+        return queryset.select_related('document', 'circle', 'started_by', 'ended_by')
+
 
 class ParagraphCorrectionSerializer(serializers.ModelSerializer):
-    """Serialize paragraph correction data"""
+    """
+    Serialize paragraph correction data.
 
-    last_modified_by_key = serializers.CharField(
-        source='last_modified_by.key',
-        read_only=True,
-        allow_null=True
-    )
-    approved_by_key = serializers.CharField(
-        source='approved_by.key',
-        read_only=True,
-        allow_null=True
-    )
+    Pass fields=[...] to serialize only a subset of Meta.fields.
+    """
+
+    last_modified_by_key = serializers.SerializerMethodField()
+    approved_by_key = serializers.SerializerMethodField()
 
     class Meta:
         model = ParagraphCorrection
@@ -116,6 +139,8 @@ class ParagraphCorrectionSerializer(serializers.ModelSerializer):
             'approved_by',
             'approved_by_key',
             'approved_at',
+            'version',
+            'change_seq',
         ]
         read_only_fields = [
             'id',
@@ -126,8 +151,87 @@ class ParagraphCorrectionSerializer(serializers.ModelSerializer):
             'text',
             'original_translation',
             'last_modified_at',
+            'version',
+            'change_seq',
         ]
 
+    # Serializer-only fields and the model fields they read
+    RELATED_SOURCE_FIELDS = {
+        'last_modified_by_key': 'last_modified_by',
+        'approved_by_key': 'approved_by',
+    }
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def model_fields_for(cls, fields):
+        """Model fields needed to serialize the given serializer fields"""
+        return [cls.RELATED_SOURCE_FIELDS.get(name, name) for name in fields]
+
+    @classmethod
+    def optimize_queryset(cls, queryset):
+        """
+        Annotate the related access key strings onto each row.
+
+        Works together with .only() projections, unlike select_related.
+        """
+        return queryset.annotate(**{
+            name: F(f'{relation}__key')
+            for name, relation in cls.RELATED_SOURCE_FIELDS.items()
+        })
+
+    @staticmethod
+    def _related_key(obj, relation):
+        """Key of a related AccessKey, preferring loaded data over a new query"""
+        descriptor = getattr(type(obj), relation)
+        if not descriptor.is_cached(obj) and f'{relation}_key' in obj.__dict__:
+            return obj.__dict__[f'{relation}_key']
+        related = getattr(obj, relation)
+        return related.key if related else None
+
+    def get_last_modified_by_key(self, obj):
+        return self._related_key(obj, 'last_modified_by')
+
+    def get_approved_by_key(self, obj):
+        return self._related_key(obj, 'approved_by')
+
+
+class ParagraphTranslationSerializer(serializers.ModelSerializer):
+    """Serialize one language's correction of a paragraph"""
+
+    last_modified_by_key = serializers.CharField(
+        source='last_modified_by.key', read_only=True, allow_null=True
+    )
+    approved_by_key = serializers.CharField(
+        source='approved_by.key', read_only=True, allow_null=True
+    )
+
+    class Meta:
+        model = ParagraphTranslation
+        fields = [
+            'id',
+            'paragraph',
+            'language',
+            'original_translation',
+            'corrected_translation',
+            'status',
+            'last_modified_by_key',
+            'last_modified_at',
+            'approved_by_key',
+            'approved_at',
+            'version',
+        ]
+        read_only_fields = fields
+
+    @staticmethod
+    def optimize_queryset(queryset):
+        """Fetch the relations this serializer reads in the same query"""
+        return queryset.select_related('last_modified_by', 'approved_by')
+
 
 class ParagraphUpdateSerializer(serializers.Serializer):
     """Serializer for updating paragraph corrections"""
@@ -138,6 +242,7 @@ class ParagraphUpdateSerializer(serializers.Serializer):
         required=False,
         default='in_progress'
     )
+    version = serializers.IntegerField(required=False, min_value=1)
 
     def validate_corrected_translation(self, value):
         """Ensure corrected translation is not empty"""
@@ -146,11 +251,114 @@ class ParagraphUpdateSerializer(serializers.Serializer):
         return value
 
 
+class BulkParagraphUpdateSerializer(serializers.Serializer):
+    """
+    Envelope for bulk paragraph updates.
+
+    Items are validated one by one (with ParagraphUpdateSerializer) by the
+    view, so each can succeed or fail independently.
+    """
+
+    MAX_ITEMS = 500
+
+    paragraphs = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_ITEMS
+    )
+
+
+class BulkApproveSerializer(serializers.Serializer):
+    """
+    Select paragraphs to approve, by ID or by filter.
+
+    Either paragraph_ids, or status and/or chapter (e.g. all in_progress
+    paragraphs in chapter 9) must be given.
+    """
+
+    MAX_ITEMS = 500
+
+    paragraph_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_ITEMS
+    )
+    # Approved paragraphs are never re-approved
+    status = serializers.ChoiceField(
+        choices=['unchecked', 'in_progress'],
+        required=False
+    )
+    chapter = serializers.CharField(required=False)
+
+    def validate(self, data):
+        """Require exactly one way of selecting paragraphs"""
+        has_ids = 'paragraph_ids' in data
+        has_filter = 'status' in data or 'chapter' in data
+        if has_ids == has_filter:
+            raise serializers.ValidationError(
+                "Provide either paragraph_ids or a status/chapter filter"
+            )
+        return data
+
+
+class TerminologyScanSerializer(serializers.Serializer):
+    """
+    Glossary for a terminology consistency scan.
+
+    Each entry maps a source term to one approved rendering or a list of
+    acceptable ones: {"source": "Dharma", "target": ["ธรรมะ", "ธรรม"]}
+    """
+
+    MAX_TERMS = 10000
+
+    glossary = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_TERMS
+    )
+
+    def validate_glossary(self, value):
+        """Require a source string and at least one rendering per entry"""
+        for index, entry in enumerate(value):
+            source = entry.get('source')
+            target = entry.get('target')
+            if isinstance(target, str):
+                target = [target]
+            if not isinstance(source, str) or not source.strip():
+                raise serializers.ValidationError(f"Entry {index}: source must be a non-empty string")
+            if (not isinstance(target, list) or not target
+                    or not all(isinstance(t, str) and t.strip() for t in target)):
+                raise serializers.ValidationError(
+                    f"Entry {index}: target must be a non-empty string or list of strings"
+                )
+        return value
+
+
 class SessionStartSerializer(serializers.Serializer):
     """Serializer for starting a translation session"""
 
+    MAX_LANGUAGES = 10
+
     document_id = serializers.IntegerField(required=True)
     circle_id = serializers.IntegerField(required=True)
+    dry_run = serializers.BooleanField(required=False, default=False)
+    # Multi-language mode, e.g. ["thai", "vietnamese", "korean"]
+    languages = serializers.ListField(
+        child=serializers.CharField(max_length=50),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_LANGUAGES
+    )
+
+    def validate_languages(self, value):
+        """Language names become JSON keys (<language>_text): keep them plain"""
+        for language in value:
+            if not re.fullmatch(r'[A-Za-z][A-Za-z_]*', language):
+                raise serializers.ValidationError(f"Invalid language name: {language}")
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Languages must be unique")
+        return value
 
     def validate(self, data):
         """Validate that document belongs to circle"""
@@ -4,18 +4,175 @@ Translation Circle Services
 Business logic for translation circle operations.
 
 Services:
-- JSONDocumentLoader: Load JSON and populate database
+- DocumentCache: Process-wide cache of parsed JSON documents
+- JSONDocumentLoader: Load JSON (or its binary sidecar) and populate database
 - JSONDocumentWriter: Save corrections back to JSON
 - ParagraphNavigator: Navigate hierarchical JSON structure
 
 Status: Phase 2 - Implementation
 """
 
+import itertools
 import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
 from django.utils import timezone
-from .models import TranslationDocument, TranslationSession, ParagraphCorrection
+from .atomicfile import atomic_write_json
+from .jsonstream import iter_item_paragraphs, iter_paragraph_nodes_streaming
+from .sidecar import DocumentSidecar, file_signature, open_sidecar, sidecar_path, write_sidecar
+from .models import TranslationDocument, TranslationSession, ParagraphCorrection, ParagraphTranslation
+
+# Default paragraphs per bulk_create batch when loading a session
+PARAGRAPH_CHUNK_SIZE = 500
+
+
+def iter_located_paragraph_nodes(content: List) -> Iterator[Tuple[Dict, object, object]]:
+    """
+    Yield (paragraph dict, chapter_id, section_id) for every paragraph in
+    the hierarchical JSON content, in document order.
+
+    Walks section -> chapter -> section -> content, descending one level
+    into subsections (the same layout iter_paragraph_nodes_streaming reads
+    from a file). The yielded dicts belong to the parsed document.
+    """
+    for section in content:
+        if section.get('type') != 'section':
+            continue
+        for chapter in section.get('chapters', []):
+            for node in iter_chapter_paragraph_nodes(chapter):
+                yield node, chapter.get('id'), section.get('id')
+
+
+def iter_chapter_paragraph_nodes(chapter: Dict) -> Iterator[Dict]:
+    """Yield the paragraph dicts of one chapter, including subsection paragraphs"""
+    for sect in chapter.get('sections', []):
+        for item in sect.get('content', []):
+            yield from iter_item_paragraphs(item)
+
+
+def iter_paragraph_nodes(content: List) -> Iterator[Dict]:
+    """Yield every paragraph dict in the hierarchical JSON content"""
+    for node, _, _ in iter_located_paragraph_nodes(content):
+        yield node
+
+
+class DocumentCache:
+    """
+    Process-wide LRU cache of parsed translation documents.
+
+    Entries are keyed on (resolved path, st_mtime_ns, st_size), so any write
+    to the file - including atomic_write_json renames - produces a new key
+    and the stale tree is never served. The size budget is approximate: each
+    entry is charged the size of its file on disk.
+
+    Cached trees are shared between callers and must be treated as
+    read-only. JSONDocumentWriter patches copies of the nodes it changes
+    instead of mutating the cached tree.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(path) -> Tuple[str, int, int]:
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return str(resolved), stat.st_mtime_ns, stat.st_size
+
+    def get(self, path) -> Dict:
+        """
+        Return the parsed document at path, reading it only on a cache miss.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        return self.get_versioned(path)[1]
+
+    def get_versioned(self, path) -> Tuple[Tuple[str, int, int], Dict]:
+        """
+        Like get(), also returning the (resolved path, st_mtime_ns, st_size)
+        version key the document was cached under.
+        """
+        key = self._key(path)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return key, data
+            self.misses += 1
+
+        with open(key[0], 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self._store(key, data)
+        return key, data
+
+    def contains(self, path) -> bool:
+        """Whether the file's current version is cached (does not count as a hit)"""
+        try:
+            key = self._key(path)
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            return key in self._entries
+
+    def put(self, path, data: Dict):
+        """Cache an already-parsed document for the file's current version"""
+        self._store(self._key(path), data)
+
+    def _store(self, key: Tuple[str, int, int], data: Dict):
+        with self._lock:
+            # Drop older versions of the same file
+            for stale in [k for k in self._entries if k[0] == key[0] and k != key]:
+                del self._entries[stale]
+                self.current_bytes -= stale[2]
+
+            if key not in self._entries:
+                self.current_bytes += key[2]
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+                evicted, _ = self._entries.popitem(last=False)
+                self.current_bytes -= evicted[2]
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all cached documents (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size, for monitoring"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+document_cache = DocumentCache(
+    max_bytes=settings.TRANSLATION_CONFIG.get('document_cache_max_bytes', 64 * 1024 * 1024)
+)
 
 
 class JSONDocumentLoader:
@@ -36,18 +193,159 @@ class JSONDocumentLoader:
         self.json_path = Path(json_path)
         self.data = None
         self.metadata = None
+        self.load_stats = None
+        self.paragraph_source = None
+        # Set once the sidecar could not be written; paragraphs then come from the JSON
+        self.sidecar_unavailable = False
 
     def load_json(self) -> Dict:
-        """Load and parse JSON file"""
+        """Load parsed JSON (shared and read-only) from the document cache"""
         if not self.json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {self.json_path}")
 
-        with open(self.json_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        self.data = document_cache.get(self.json_path)
 
         self.metadata = self.data.get('metadata', {})
         return self.data
 
+    def _should_stream(self) -> bool:
+        """Stream files above the configured size unless they are already parsed"""
+        if self.data is not None:
+            return False
+        threshold = settings.TRANSLATION_CONFIG.get('stream_threshold_bytes')
+        if threshold is None or self.json_path.stat().st_size < threshold:
+            return False
+        return not document_cache.contains(self.json_path)
+
+    def iter_nodes(self, prefer_stream: bool = False) -> Iterator[Tuple[Dict, object, object]]:
+        """
+        Yield (raw paragraph node, chapter_id, section_id) in document order.
+
+        Large files (TRANSLATION_CONFIG['stream_threshold_bytes']) that are
+        not already in the document cache are parsed incrementally, so only
+        one content item is held in memory at a time. Everything else is
+        walked from the cached document.
+
+        Args:
+            prefer_stream: Stream any file that is not cached, whatever its
+                size (for one-off reads such as backups, which should not
+                displace cached documents)
+        """
+        if not self.json_path.exists():
+            raise FileNotFoundError(f"JSON file not found: {self.json_path}")
+
+        stream = self._should_stream()
+        if prefer_stream and self.data is None:
+            stream = not document_cache.contains(self.json_path)
+        if stream:
+            for metadata, node, chapter_id, section_id in iter_paragraph_nodes_streaming(self.json_path):
+                self.metadata = metadata
+                yield node, chapter_id, section_id
+            return
+
+        if not self.data:
+            self.load_json()
+
+        yield from iter_located_paragraph_nodes(self.data.get('content', []))
+
+    def iter_paragraphs(self, languages: Optional[List[str]] = None,
+                        sidecar: Optional[DocumentSidecar] = None) -> Iterator[Dict]:
+        """
+        Yield formatted paragraphs in document order.
+
+        Read from the binary sidecar (<file>.sidecar) unless the document is
+        already parsed; a missing or stale sidecar is rebuilt first.
+        self.paragraph_source records where the paragraphs came from.
+
+        Args:
+            languages: Target languages of a multi-language session. The
+                first fills the usual translation fields, the others are
+                added as "translations": {language: fields}. Read from the
+                JSON, since the sidecar holds one language only.
+            sidecar: Sidecar already opened by the caller (see open_sidecar);
+                closed once read
+        """
+        if languages:
+            self.paragraph_source = 'json'
+            for node, chapter_id, section_id in self.iter_nodes():
+                para = self._format_paragraph(node, chapter_id, section_id, languages[0])
+                if para:
+                    para['translations'] = {
+                        language: self._translation_fields(node, language)
+                        for language in languages[1:]
+                    }
+                    yield para
+            return
+
+        if sidecar is None and self._use_sidecar():
+            sidecar = self.open_sidecar()
+        if sidecar is not None:
+            with sidecar:
+                self.metadata = sidecar.metadata
+                yield from sidecar.paragraphs()
+            return
+
+        self.paragraph_source = 'json'
+        yield from self._iter_formatted()
+
+    def _iter_formatted(self) -> Iterator[Dict]:
+        for node, chapter_id, section_id in self.iter_nodes():
+            para = self._format_paragraph(node, chapter_id, section_id)
+            if para:
+                yield para
+
+    def _use_sidecar(self) -> bool:
+        return (self.data is None and not self.sidecar_unavailable
+                and settings.TRANSLATION_CONFIG.get('document_sidecar', True))
+
+    def open_sidecar(self) -> Optional[DocumentSidecar]:
+        """
+        Open the document's sidecar, rebuilding it if missing or stale.
+
+        Returns:
+            Open DocumentSidecar, or None if it could not be written (e.g.
+            a read-only directory)
+        """
+        if not self.json_path.exists():
+            raise FileNotFoundError(f"JSON file not found: {self.json_path}")
+
+        sidecar, _ = open_sidecar(self.json_path)
+        if sidecar is not None:
+            self.paragraph_source = 'sidecar'
+            return sidecar
+
+        try:
+            self.write_sidecar()
+            sidecar = DocumentSidecar(sidecar_path(self.json_path))
+        except (OSError, ValueError):
+            self.sidecar_unavailable = True
+            return None
+        self.paragraph_source = 'sidecar_rebuilt'
+        return sidecar
+
+    def write_sidecar(self) -> int:
+        """Write <file>.sidecar from the JSON file (or the already-parsed document)"""
+        signature = file_signature(self.json_path)
+        return write_sidecar(
+            self.json_path,
+            signature,
+            self._iter_formatted(),
+            lambda: self.metadata or {},
+        )
+
+    def iter_paragraph_chunks(self, chunk_size: int = PARAGRAPH_CHUNK_SIZE,
+                              languages: Optional[List[str]] = None,
+                              sidecar: Optional[DocumentSidecar] = None) -> Iterator[List[Dict]]:
+        """Yield formatted paragraphs (see iter_paragraphs) in lists of at most chunk_size"""
+        chunk = []
+        for para in self.iter_paragraphs(languages, sidecar):
+            chunk.append(para)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     def extract_paragraphs(self) -> List[Dict]:
         """
         Extract all paragraphs from hierarchical JSON structure.
@@ -55,110 +353,149 @@ class JSONDocumentLoader:
         Returns:
             List of paragraph dictionaries with flattened structure
         """
-        if not self.data:
-            self.load_json()
+        return list(self.iter_paragraphs())
 
-        paragraphs = []
-        content = self.data.get('content', [])
-
-        for section in content:
-            if section.get('type') == 'section':
-                section_id = section.get('id')
-                chapters = section.get('chapters', [])
-
-                for chapter in chapters:
-                    chapter_id = chapter.get('id')
-                    self._extract_from_sections(
-                        chapter.get('sections', []),
-                        chapter_id,
-                        section_id,
-                        paragraphs
-                    )
+    @staticmethod
+    def _translation_fields(para: Dict, language: str) -> Dict:
+        """One language's translation fields of a paragraph node"""
+        original = para.get(f"{language}_text", '')
+        return {
+            'original_translation': original,
+            'corrected_translation': para.get(f"corrected_{language}_text", original),
+            'status': para.get(f'{language}_status', 'unchecked'),
+        }
 
-        return paragraphs
-
-    def _extract_from_sections(self, sections: List, chapter_id, section_id, paragraphs: List):
-        """Recursively extract paragraphs from sections"""
-        for section in sections:
-            for content_item in section.get('content', []):
-                if content_item.get('type') == 'paragraph':
-                    para = self._format_paragraph(content_item, chapter_id, section_id)
-                    if para:
-                        paragraphs.append(para)
-                elif content_item.get('type') == 'subsection':
-                    # Recurse into subsections
-                    for sub_item in content_item.get('content', []):
-                        if sub_item.get('type') == 'paragraph':
-                            para = self._format_paragraph(sub_item, chapter_id, section_id)
-                            if para:
-                                paragraphs.append(para)
-
-    def _format_paragraph(self, para: Dict, chapter_id, section_id) -> Optional[Dict]:
+    def _format_paragraph(self, para: Dict, chapter_id, section_id,
+                          language: Optional[str] = None) -> Optional[Dict]:
         """Format paragraph data for database storage"""
         paragraph_id = para.get('id')
         if not paragraph_id:
             return None
 
         # Get language from metadata
-        language = self.metadata.get('language', 'thai')
-        lang_text_field = f"{language}_text"
-        corrected_field = f"corrected_{language}_text"
+        if language is None:
+            language = self.metadata.get('language', 'thai')
 
         return {
             'paragraph_id': paragraph_id,
             'chapter_id': str(chapter_id),
             'section_id': str(section_id),
             'text': para.get('text', ''),
-            'original_translation': para.get(lang_text_field, ''),
-            'corrected_translation': para.get(corrected_field, para.get(lang_text_field, '')),
-            'status': para.get(f'{language}_status', 'unchecked'),
+            **self._translation_fields(para, language),
         }
 
-    def create_session(self, document: TranslationDocument, started_by) -> TranslationSession:
+    def create_session(self, document: TranslationDocument, started_by,
+                       batch_size: Optional[int] = None,
+                       dry_run: bool = False,
+                       languages: Optional[List[str]] = None) -> TranslationSession:
         """
         Create a new translation session and load paragraphs into database.
 
+        The session row, all paragraphs and the document status update are
+        written in one transaction, so a failed load never leaves an active
+        session without paragraphs. The sidecar is opened (and rebuilt if
+        stale) before that transaction starts, so hashing the JSON and
+        writing the sidecar never hold the database write lock. Timing is
+        recorded in self.load_stats.
+
         Args:
             document: TranslationDocument instance
             started_by: AccessKey of user starting session
+            batch_size: Paragraphs per bulk_create batch
+                (defaults to TRANSLATION_CONFIG['load_batch_size'])
+            dry_run: Perform the full load, then roll it back (for timing)
+            languages: Target languages for a multi-language session; the
+                English source is loaded once, the first language into
+                ParagraphCorrection and the rest into ParagraphTranslation
 
         Returns:
-            TranslationSession instance with loaded paragraphs
+            TranslationSession instance with loaded paragraphs (not persisted
+            when dry_run is set)
         """
-        # Load JSON
-        self.load_json()
-        paragraphs = self.extract_paragraphs()
-
-        # Create session
-        session = TranslationSession.objects.create(
-            document=document,
-            circle=document.circle,
-            started_by=started_by,
-            total_paragraphs=len(paragraphs)
-        )
-
-        # Create ParagraphCorrection records
-        corrections = []
-        for para_data in paragraphs:
-            correction = ParagraphCorrection(
-                session=session,
-                paragraph_id=para_data['paragraph_id'],
-                chapter_id=para_data['chapter_id'],
-                section_id=para_data['section_id'],
-                text=para_data['text'],
-                original_translation=para_data['original_translation'],
-                corrected_translation=para_data['corrected_translation'],
-                status=para_data['status']
+        if batch_size is None:
+            batch_size = settings.TRANSLATION_CONFIG.get('load_batch_size', PARAGRAPH_CHUNK_SIZE)
+
+        started = time.perf_counter()
+        sidecar = self.open_sidecar() if not languages and self._use_sidecar() else None
+        with sidecar or nullcontext(), transaction.atomic():
+            # Create session (total filled in once all paragraphs are loaded)
+            session = TranslationSession.objects.create(
+                document=document,
+                circle=document.circle,
+                started_by=started_by,
+                total_paragraphs=0,
+                languages=list(languages or [])
             )
-            corrections.append(correction)
 
-        # Bulk create for performance
-        ParagraphCorrection.objects.bulk_create(corrections)
+            # Create ParagraphCorrection records batch by batch, so a large
+            # document never needs all of its rows in memory at once
+            total = 0
+            status_counts = dict.fromkeys(TranslationSession.STATUS_COUNTER_FIELDS, 0)
+            for chunk in self.iter_paragraph_chunks(batch_size, languages, sidecar):
+                corrections = []
+                for para_data in chunk:
+                    correction = ParagraphCorrection(
+                        session=session,
+                        paragraph_id=para_data['paragraph_id'],
+                        chapter_id=para_data['chapter_id'],
+                        section_id=para_data['section_id'],
+                        text=para_data['text'],
+                        original_translation=para_data['original_translation'],
+                        corrected_translation=para_data['corrected_translation'],
+                        status=para_data['status']
+                    )
+                    # bulk_create skips save(), so fingerprint the loaded state here
+                    correction.loaded_fingerprint = correction.refresh_fingerprint()
+                    corrections.append(correction)
+                    # Statuses without a counter only count as modified
+                    # (see TranslationSession.record_status_changes)
+                    if correction.status in status_counts:
+                        status_counts[correction.status] += 1
+
+                # Django further caps batch_size at the backend's variable limit
+                ParagraphCorrection.objects.bulk_create(corrections, batch_size=batch_size)
+                total += len(corrections)
+
+                translations = []
+                for correction, para_data in zip(corrections, chunk):
+                    for language, fields in para_data.get('translations', {}).items():
+                        translation = ParagraphTranslation(paragraph=correction, language=language, **fields)
+                        translation.loaded_fingerprint = translation.refresh_fingerprint()
+                        translations.append(translation)
+                if translations:
+                    ParagraphTranslation.objects.bulk_create(translations, batch_size=batch_size)
+
+            session.total_paragraphs = total
+            for status, field in TranslationSession.STATUS_COUNTER_FIELDS.items():
+                setattr(session, field, status_counts[status])
+            session.paragraphs_modified = total - status_counts['unchecked']
+            session.save(update_fields=[
+                'total_paragraphs',
+                'paragraphs_modified',
+                *TranslationSession.STATUS_COUNTER_FIELDS.values(),
+            ])
+
+            # Update document status
+            document.status = 'in_session'
+            document.last_loaded_at = timezone.now()
+            document.save()
+
+            if dry_run:
+                transaction.set_rollback(True)
+
+        elapsed = time.perf_counter() - started
+        self.load_stats = {
+            'source': self.paragraph_source,
+            'languages': session.languages,
+            'rows': total,
+            'batch_size': batch_size,
+            'seconds': round(elapsed, 4),
+            'rows_per_second': round(total / elapsed, 1) if elapsed > 0 else None,
+            'dry_run': dry_run,
+        }
 
-        # Update document status
-        document.status = 'in_session'
-        document.last_loaded_at = timezone.now()
-        document.save()
+        if dry_run:
+            document.refresh_from_db(fields=['status', 'last_loaded_at'])
 
         return session
 
@@ -168,6 +505,10 @@ class JSONDocumentWriter:
     Write corrections from database back to JSON file.
 
     Updates corrected_<language>_text fields and metadata in JSON file.
+
+    The parsed document comes from the shared document cache and is never
+    mutated: updated paragraphs are copied on first write, and save_json
+    assembles the output tree from the cached nodes plus those copies.
     """
 
     def __init__(self, json_path: str):
@@ -179,16 +520,33 @@ class JSONDocumentWriter:
         """
         self.json_path = Path(json_path)
         self.data = None
+        self._paragraph_index = {}
+        self._patched = {}
 
     def load_json(self) -> Dict:
-        """Load current JSON file"""
-        with open(self.json_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        """Load current JSON file from the document cache and index its paragraphs"""
+        self.data = document_cache.get(self.json_path)
+        self._patched = {}
+        self._build_paragraph_index()
         return self.data
 
+    def _build_paragraph_index(self):
+        """
+        Build a paragraph_id -> paragraph node index in one pass.
+
+        The nodes are the (read-only) dicts inside self.data. If an ID
+        appears more than once, the first occurrence wins (matching the old
+        top-down search).
+        """
+        self._paragraph_index = {}
+        for node in iter_paragraph_nodes(self.data.get('content', [])):
+            self._paragraph_index.setdefault(node.get('id'), node)
+        return self._paragraph_index
+
     def update_paragraph(self, paragraph_id: str, corrected_text: str,
                         status: str, approved_by_name: Optional[str] = None,
-                        approved_by_id: Optional[str] = None):
+                        approved_by_id: Optional[str] = None,
+                        language: Optional[str] = None):
         """
         Update a single paragraph in the JSON data structure.
 
@@ -198,20 +556,27 @@ class JSONDocumentWriter:
             status: Paragraph status ('unchecked', 'in_progress', 'approved')
             approved_by_name: Name of approver (for approved status)
             approved_by_id: ID of approver (for approved status)
+            language: Language whose fields are written (defaults to the
+                document's metadata language)
         """
         if not self.data:
             self.load_json()
 
-        language = self.data.get('metadata', {}).get('language', 'thai')
-        corrected_field = f"corrected_{language}_text"
-        status_field = f"{language}_status"
+        node = self._paragraph_index.get(paragraph_id)
+        if node is None:
+            raise ValueError(f"Paragraph {paragraph_id} not found in JSON")
 
-        # Find and update paragraph
-        found = self._find_and_update_paragraph(
-            self.data.get('content', []),
-            paragraph_id,
-            corrected_field,
-            status_field,
+        # Copy on first write so the cached tree is never modified
+        para = self._patched.get(id(node))
+        if para is None:
+            para = self._patched[id(node)] = dict(node)
+
+        if language is None:
+            language = self.data.get('metadata', {}).get('language', 'thai')
+        self._update_paragraph_fields(
+            para,
+            f"corrected_{language}_text",
+            f"{language}_status",
             corrected_text,
             status,
             approved_by_name,
@@ -219,38 +584,40 @@ class JSONDocumentWriter:
             language
         )
 
-        if not found:
-            raise ValueError(f"Paragraph {paragraph_id} not found in JSON")
+    def update_paragraphs(self, updates: Iterable[Dict]) -> int:
+        """
+        Apply many paragraph updates against the paragraph index.
+
+        Args:
+            updates: Iterable of dicts with the keyword arguments of
+                update_paragraph (paragraph_id, corrected_text, status,
+                approved_by_name, approved_by_id, language); updates of
+                several languages of one paragraph patch the same copy
 
-    def _find_and_update_paragraph(self, content: List, paragraph_id: str,
-                                   corrected_field: str, status_field: str,
-                                   corrected_text: str, status: str,
-                                   approved_by_name: Optional[str],
-                                   approved_by_id: Optional[str],
-                                   language: str) -> bool:
-        """Recursively find and update paragraph in JSON structure"""
-        for section in content:
-            if section.get('type') == 'section':
-                for chapter in section.get('chapters', []):
-                    for sect in chapter.get('sections', []):
-                        for item in sect.get('content', []):
-                            # Check paragraph
-                            if item.get('type') == 'paragraph' and item.get('id') == paragraph_id:
-                                return self._update_paragraph_fields(
-                                    item, corrected_field, status_field,
-                                    corrected_text, status, approved_by_name,
-                                    approved_by_id, language
-                                )
-                            # Check subsections
-                            elif item.get('type') == 'subsection':
-                                for sub_item in item.get('content', []):
-                                    if sub_item.get('type') == 'paragraph' and sub_item.get('id') == paragraph_id:
-                                        return self._update_paragraph_fields(
-                                            sub_item, corrected_field, status_field,
-                                            corrected_text, status, approved_by_name,
-                                            approved_by_id, language
-                                        )
-        return False
+        Returns:
+            Number of paragraphs updated
+
+        Raises:
+            ValueError: Listing every unknown paragraph ID, after all known
+                paragraphs have been updated
+        """
+        if not self.data:
+            self.load_json()
+
+        missing = []
+        updated = 0
+        for update in updates:
+            try:
+                self.update_paragraph(**update)
+                updated += 1
+            except ValueError:
+                missing.append(update['paragraph_id'])
+
+        if missing:
+            raise ValueError(
+                f"{len(missing)} paragraph(s) not found in JSON: {', '.join(missing)}"
+            )
+        return updated
 
     def _update_paragraph_fields(self, para: Dict, corrected_field: str,
                                 status_field: str, corrected_text: str,
@@ -267,14 +634,53 @@ class JSONDocumentWriter:
 
         return True
 
+    def _materialize(self, node):
+        """Copy the document's containers, substituting patched paragraphs"""
+        if isinstance(node, dict):
+            patched = self._patched.get(id(node))
+            if patched is not None:
+                return patched
+            return {key: self._materialize(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self._materialize(item) for item in node]
+        return node
+
     def save_json(self):
-        """Write updated data back to JSON file"""
-        with open(self.json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        """Write updated data back to JSON file (atomically, with rotated backups)"""
+        data = self._materialize(self.data) if self._patched else self.data
+        atomic_write_json(
+            self.json_path, data,
+            generations=settings.TRANSLATION_CONFIG.get('json_backup_generations', 0),
+        )
+
+        # The new version is already parsed; seed the cache with it
+        document_cache.put(self.json_path, data)
+        self._write_sidecar(data)
+        self.data = data
+        self._patched = {}
+        self._build_paragraph_index()
+
+    def _write_sidecar(self, data: Dict):
+        """Refresh the sidecar from the tree just written, so the next load needn't parse"""
+        if not settings.TRANSLATION_CONFIG.get('document_sidecar', True):
+            return
+        loader = JSONDocumentLoader(self.json_path)
+        loader.data = data
+        loader.metadata = data.get('metadata', {})
+        try:
+            loader.write_sidecar()
+        except (OSError, ValueError):
+            # The JSON is saved; a stale sidecar is rebuilt on the next load
+            pass
 
     def save_session(self, session: TranslationSession, ended_by):
         """
-        Save all corrections from a session back to JSON file.
+        Save corrections from a session back to JSON file.
+
+        Only paragraphs whose fingerprint differs from the one recorded at
+        load time are queried and patched; untouched paragraphs already
+        match the JSON file. In a multi-language session every language's
+        changes are applied in the same pass and written once.
 
         Args:
             session: TranslationSession instance
@@ -282,33 +688,60 @@ class JSONDocumentWriter:
         """
         self.load_json()
 
-        # Get all modified paragraphs
-        paragraphs = session.paragraphs.all()
-
-        for para in paragraphs:
-            approved_by_name = None
-            approved_by_id = None
-
-            if para.approved_by:
-                approved_by_name = para.approved_by.key
-                approved_by_id = str(para.approved_by.id)
-
-            self.update_paragraph(
-                paragraph_id=para.paragraph_id,
-                corrected_text=para.corrected_translation,
-                status=para.status,
-                approved_by_name=approved_by_name,
-                approved_by_id=approved_by_id
+        # Get paragraphs changed since load (rows loaded before fingerprints
+        # existed have an empty loaded_fingerprint and are always written)
+        changed = Q(loaded_fingerprint='') | ~Q(fingerprint=F('loaded_fingerprint'))
+        paragraphs = session.paragraphs.filter(changed).select_related('approved_by')
+        primary_language = session.languages[0] if session.languages else None
+
+        updates = (
+            {
+                'paragraph_id': para.paragraph_id,
+                'corrected_text': para.corrected_translation,
+                'status': para.status,
+                'approved_by_name': para.approved_by.key if para.approved_by else None,
+                'approved_by_id': str(para.approved_by.id) if para.approved_by else None,
+                'language': primary_language,
+            }
+            for para in paragraphs
+        )
+        if session.languages[1:]:
+            translations = ParagraphTranslation.objects.filter(
+                changed, paragraph__session=session
+            ).values(
+                'language', 'corrected_translation', 'status',
+                'paragraph__paragraph_id', 'approved_by_id', 'approved_by__key'
             )
+            updates = itertools.chain(updates, (
+                {
+                    'paragraph_id': row['paragraph__paragraph_id'],
+                    'corrected_text': row['corrected_translation'],
+                    'status': row['status'],
+                    'approved_by_name': row['approved_by__key'],
+                    'approved_by_id': str(row['approved_by_id']) if row['approved_by_id'] else None,
+                    'language': row['language'],
+                }
+                for row in translations.iterator(chunk_size=2000)
+            ))
+
+        self.update_paragraphs(updates)
 
         # Save to file
         self.save_json()
 
+        # The file now matches the rows: later delta saves start from here
+        session.paragraphs.filter(changed).update(loaded_fingerprint=F('fingerprint'))
+        if session.languages[1:]:
+            ParagraphTranslation.objects.filter(changed, paragraph__session=session).update(
+                loaded_fingerprint=F('fingerprint')
+            )
+
         # Update session and document status
         session.status = 'completed'
         session.ended_at = timezone.now()
         session.ended_by = ended_by
-        session.save()
+        # Leave the paragraph counters to their F() updates
+        session.save(update_fields=['status', 'ended_at', 'ended_by'])
 
         session.document.status = 'saved'
         session.document.last_saved_at = timezone.now()
@@ -0,0 +1,267 @@
+"""
+Translation Circle Document Sidecar
+
+Compact binary copy of a translation JSON file's paragraphs.
+
+Parsing a multi-megabyte JSON document dominates session start. The
+sidecar (<file>.sidecar, next to the JSON) stores the formatted paragraphs
+as one UTF-8 blob plus a fixed-width table giving each paragraph's byte
+offset and its field lengths, so reading a run of paragraphs means mapping
+the file, decoding their span of the blob once and slicing - paragraph i
+of a large book is read without touching the others.
+
+The JSON file stays the source of truth. The sidecar header records the
+JSON file's mtime, size and SHA-1; a sidecar whose mtime or size is stale
+is only reused when the hash still matches.
+
+Layout (little-endian):
+    header    magic, format version, JSON mtime_ns / size / sha1,
+              metadata offset / length, table offset, paragraph count
+    blob      UTF-8 field values
+    metadata  JSON-encoded document metadata
+    table     count x (u64 byte offset into the blob, FIELDS x u32 length
+              in characters)
+
+Version 1 used u32 offsets, which capped the blob at 4 GiB; such sidecars
+fail the version check and are rebuilt.
+
+Classes:
+- DocumentSidecar: Memory-mapped reader
+
+Functions:
+- sidecar_path: Sidecar location for a JSON file
+- file_signature: (mtime_ns, size, sha1) of a JSON file
+- write_sidecar: Write a sidecar from formatted paragraphs
+- open_sidecar: Open a sidecar if it matches the JSON file
+
+Status: Phase 2 - Implementation
+"""
+
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+MAGIC = b'ICSC'
+FORMAT_VERSION = 2
+
+# Formatted paragraph fields, in table order (see JSONDocumentLoader._format_paragraph)
+FIELDS = (
+    'paragraph_id',
+    'chapter_id',
+    'section_id',
+    'text',
+    'original_translation',
+    'corrected_translation',
+    'status',
+)
+
+_HEADER = struct.Struct('<4sHHqQ20sQQQQ')
+_ROW = struct.Struct('<Q' + 'I' * len(FIELDS))
+_HASH_READ_SIZE = 1024 * 1024
+
+
+def sidecar_path(json_path) -> Path:
+    json_path = Path(json_path)
+    return json_path.with_name(f"{json_path.name}.sidecar")
+
+
+def file_signature(json_path) -> Tuple[int, int, bytes]:
+    """(st_mtime_ns, st_size, sha1 digest) of a file, stat taken before hashing"""
+    stat = os.stat(json_path)
+    digest = hashlib.sha1()
+    with open(json_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_READ_SIZE), b''):
+            digest.update(chunk)
+    return stat.st_mtime_ns, stat.st_size, digest.digest()
+
+
+def write_sidecar(json_path, signature: Tuple[int, int, bytes], paragraphs: Iterable[Dict],
+                  metadata: Callable[[], Dict]) -> int:
+    """
+    Write <file>.sidecar atomically.
+
+    The blob is written as paragraphs arrive; only the offset table is
+    kept in memory.
+
+    Args:
+        json_path: JSON file the paragraphs were read from
+        signature: file_signature() of the JSON file, taken before reading it
+        paragraphs: Formatted paragraphs (dicts with FIELDS)
+        metadata: Returns the document metadata; called once the paragraphs
+            are consumed (a streaming reader knows it only then)
+
+    Returns:
+        Number of paragraphs written
+
+    Raises:
+        ValueError: A field too long for the table (no sidecar is written)
+    """
+    path = sidecar_path(json_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'\0' * _HEADER.size)
+            offset = 0
+            table = bytearray()
+            count = 0
+            for paragraph in paragraphs:
+                row = [offset]
+                for field in FIELDS:
+                    value = paragraph[field] or ''
+                    encoded = value.encode('utf-8')
+                    f.write(encoded)
+                    row.append(len(value))
+                    offset += len(encoded)
+                try:
+                    table += _ROW.pack(*row)
+                except struct.error:
+                    # A single field of 4G characters or more
+                    raise ValueError(f"Paragraph too large for a sidecar: {json_path}")
+                count += 1
+
+            encoded_metadata = json.dumps(metadata(), ensure_ascii=False).encode('utf-8')
+            metadata_offset = _HEADER.size + offset
+            f.write(encoded_metadata)
+            f.write(table)
+
+            mtime_ns, size, sha1 = signature
+            f.seek(0)
+            f.write(_HEADER.pack(
+                MAGIC, FORMAT_VERSION, 0, mtime_ns, size, sha1,
+                metadata_offset, len(encoded_metadata),
+                metadata_offset + len(encoded_metadata), count,
+            ))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return count
+
+
+class DocumentSidecar:
+    """
+    Memory-mapped sidecar reader.
+
+    Use as a context manager, or call close(); paragraphs already returned
+    stay valid after closing.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, _, self.mtime_ns, self.size, self.sha1,
+             self._metadata_offset, metadata_length, self._table_offset, self.count) = _HEADER.unpack_from(self._map)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"Not a version {FORMAT_VERSION} sidecar: {self.path}")
+            if self._table_offset + self.count * _ROW.size != len(self._map):
+                raise ValueError(f"Truncated sidecar: {self.path}")
+            self.metadata = json.loads(self._map[self._metadata_offset:self._metadata_offset + metadata_length])
+        except BaseException:
+            self._map.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        self._map.close()
+
+    def paragraphs(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        """Yield formatted paragraphs start..stop-1, reading only their rows and values"""
+        stop = self.count if stop is None else min(stop, self.count)
+        if start >= stop:
+            return
+        data = self._map
+        rows = _ROW.iter_unpack(data[self._table_offset + start * _ROW.size:self._table_offset + stop * _ROW.size])
+        first = next(rows)
+
+        # The paragraphs' values are contiguous: decode their span in one go
+        if stop < self.count:
+            end = _HEADER.size + _ROW.unpack_from(data, self._table_offset + stop * _ROW.size)[0]
+        else:
+            end = self._metadata_offset
+        text = data[_HEADER.size + first[0]:end].decode('utf-8')
+
+        position = 0
+        for row in itertools.chain((first,), rows):
+            values = []
+            for length in row[1:]:
+                values.append(text[position:position + length])
+                position += length
+            yield dict(zip(FIELDS, values))
+
+
+def _read_header(path: Path) -> Optional[tuple]:
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(header) < _HEADER.size:
+        return None
+    return _HEADER.unpack(header)
+
+
+def open_sidecar(json_path) -> Tuple[Optional[DocumentSidecar], bool]:
+    """
+    Open the JSON file's sidecar if it is current.
+
+    A sidecar recorded with the file's current mtime and size is used
+    as-is. Otherwise the file is hashed; if the contents are unchanged
+    (the file was only touched or copied), the sidecar's recorded mtime
+    and size are updated and it is used.
+
+    Returns:
+        (sidecar or None, whether the JSON file had to be hashed)
+    """
+    path = sidecar_path(json_path)
+    header = _read_header(path)
+    if header is None or header[0] != MAGIC or header[1] != FORMAT_VERSION:
+        return None, False
+
+    stat = os.stat(json_path)
+    if (header[3], header[4]) == (stat.st_mtime_ns, stat.st_size):
+        try:
+            return DocumentSidecar(path), False
+        except (OSError, ValueError):
+            return None, False
+
+    signature = file_signature(json_path)
+    if signature[1:] != (header[4], header[5]):
+        return None, True
+    try:
+        _restamp(path, header, signature)
+        return DocumentSidecar(path), True
+    except (OSError, ValueError):
+        return None, True
+
+
+def _restamp(path: Path, header: tuple, signature: Tuple[int, int, bytes]):
+    """Rewrite a sidecar with a new source mtime (via a copy, so open maps are unaffected)"""
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as out, open(path, 'rb') as src:
+            src.seek(_HEADER.size)
+            out.write(_HEADER.pack(*header[:3], signature[0], *header[4:]))
+            for chunk in iter(lambda: src.read(_HASH_READ_SIZE), b''):
+                out.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,219 @@
+"""
+Translation Circle Terminology
+
+Glossary consistency checks over a translated document or session.
+
+A glossary maps source terms ("Four Noble Truths") to their approved
+renderings. The scanner reports every paragraph whose source text
+contains a term while its translation contains none of the term's
+renderings.
+
+Source terms are matched with an Aho-Corasick automaton over index tokens
+(search.tokenize), so the cost per paragraph does not grow with the size
+of the glossary. Results are cached per paragraph content hash: rescanning
+a session after a few edits only re-examines the edited paragraphs.
+
+Classes:
+- TermAutomaton: Multi-pattern matcher over token sequences
+- TerminologyScanner: Glossary scanner with a per-paragraph result cache
+
+Functions:
+- get_scanner: Shared scanner for a glossary
+
+Status: Phase 2 - Implementation
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from django.conf import settings
+
+from .search import tokenize
+
+# Distinct glossaries whose scanners (and result caches) are kept
+MAX_SCANNERS = 16
+
+
+class TermAutomaton:
+    """
+    Aho-Corasick automaton over token sequences.
+
+    Each pattern is a tuple of tokens; matches() walks a token list once
+    and returns the indexes of every pattern that occurs in it.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, ...]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for token in pattern:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Breadth-first: a state's failure target is always shallower, so
+        # its outputs are complete by the time they are merged in
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def matches(self, tokens: Iterable[str]) -> Set[int]:
+        """Indexes of all patterns occurring in the token sequence"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+def normalize_glossary(glossary: Iterable[Dict]) -> List[Tuple[str, Tuple[str, ...]]]:
+    """
+    Canonical (source, renderings) entries, sorted, with duplicates merged.
+
+    Args:
+        glossary: Entries of {"source": str, "target": str or [str, ...]}
+    """
+    merged: Dict[str, Set[str]] = {}
+    for entry in glossary:
+        targets = entry['target']
+        if isinstance(targets, str):
+            targets = [targets]
+        merged.setdefault(entry['source'].strip(), set()).update(
+            target.strip() for target in targets if target.strip()
+        )
+    return sorted((source, tuple(sorted(targets))) for source, targets in merged.items())
+
+
+class TerminologyScanner:
+    """
+    Scans paragraphs against one glossary.
+
+    Safe to share between threads; the result cache is bounded by
+    TRANSLATION_CONFIG['terminology_cache_paragraphs'].
+    """
+
+    def __init__(self, entries: List[Tuple[str, Tuple[str, ...]]]):
+        self.entries = entries
+        patterns = [tuple(tokenize(source)) for source, _ in entries]
+        self._pattern_entries = [index for index, pattern in enumerate(patterns) if pattern]
+        self._automaton = TermAutomaton([patterns[index] for index in self._pattern_entries])
+        self._targets = [tuple(target.casefold() for target in targets) for _, targets in entries]
+        self._results = OrderedDict()
+        self._max_results = settings.TRANSLATION_CONFIG.get('terminology_cache_paragraphs', 20000)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _content_hash(text: str, translation: str) -> str:
+        return hashlib.sha1(f'{text}\x1f{translation}'.encode('utf-8')).hexdigest()
+
+    def missing_terms(self, text: str, translation: str) -> Tuple[int, ...]:
+        """Entry indexes whose source is in text but no rendering is in translation"""
+        key = self._content_hash(text, translation)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        found = self._automaton.matches(tokenize(text))
+        folded = translation.casefold() if found else ''
+        missing = tuple(sorted(
+            entry for entry in (self._pattern_entries[i] for i in found)
+            if not any(target in folded for target in self._targets[entry])
+        ))
+
+        with self._lock:
+            self._results[key] = missing
+            while len(self._results) > self._max_results:
+                self._results.popitem(last=False)
+        return missing
+
+    def scan(self, paragraphs: Iterable[Dict]) -> Dict:
+        """
+        Report paragraphs whose translation misses a glossary rendering.
+
+        Args:
+            paragraphs: Dicts with at least paragraph_id, text and
+                corrected_translation; any other keys are passed through
+
+        Returns:
+            Dict with the per-paragraph issues, per-term counts and timing
+        """
+        started = time.perf_counter()
+        issues = []
+        term_counts: Dict[str, int] = {}
+        scanned = 0
+        for paragraph in paragraphs:
+            scanned += 1
+            missing = self.missing_terms(paragraph['text'] or '', paragraph['corrected_translation'] or '')
+            if not missing:
+                continue
+            report = {key: value for key, value in paragraph.items()
+                      if key not in ('text', 'corrected_translation', 'original_translation')}
+            report['missing'] = [
+                {'source': self.entries[entry][0], 'target': list(self.entries[entry][1])}
+                for entry in missing
+            ]
+            issues.append(report)
+            for entry in missing:
+                source = self.entries[entry][0]
+                term_counts[source] = term_counts.get(source, 0) + 1
+
+        return {
+            'terms': len(self.entries),
+            'paragraphs_scanned': scanned,
+            'paragraphs_with_issues': len(issues),
+            'term_counts': term_counts,
+            'issues': issues,
+            'seconds': round(time.perf_counter() - started, 4),
+        }
+
+
+_scanners = OrderedDict()
+_scanners_lock = threading.Lock()
+
+
+def get_scanner(glossary: Iterable[Dict]) -> TerminologyScanner:
+    """
+    Shared scanner for a glossary, so repeated scans reuse its automaton
+    and cached paragraph results.
+    """
+    entries = normalize_glossary(glossary)
+    key = hashlib.sha1(repr(entries).encode('utf-8')).hexdigest()
+    with _scanners_lock:
+        scanner = _scanners.get(key)
+        if scanner is not None:
+            _scanners.move_to_end(key)
+            return scanner
+
+    scanner = TerminologyScanner(entries)
+    with _scanners_lock:
+        _scanners[key] = scanner
+        while len(_scanners) > MAX_SCANNERS:
+            _scanners.popitem(last=False)
+    return scanner
@@ -0,0 +1,989 @@
+import copy
+import io
+import json
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.db.models import F
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from authentication.keycache import last_used_buffer, resolve_key
+from authentication.models import AccessKey
+from circles.membership import memberships
+from circles.models import Circle, CircleParticipant
+from .atomicfile import atomic_write_json
+from .docdiff import iter_paragraph_changes
+from .events import paragraph_changes
+from .jsonstream import iter_paragraph_nodes_streaming
+from .memory import record_approved
+from .models import (
+    ParagraphCorrection, TranslationDocument, TranslationMemoryBand, TranslationMemoryEntry, TranslationSession,
+)
+from .search import tokenize
+from .services import (
+    DocumentCache, JSONDocumentLoader, JSONDocumentWriter, document_cache, iter_paragraph_nodes,
+)
+from .sidecar import open_sidecar, sidecar_path
+from .terminology import TermAutomaton
+
+
+def build_document(paragraph_count):
+    """Minimal Thai translation document with paragraph_count paragraphs"""
+    return {
+        'metadata': {'title': 'Test Book', 'language': 'thai'},
+        'content': [{
+            'type': 'section',
+            'id': 1,
+            'chapters': [{
+                'type': 'chapter',
+                'id': 9,
+                'sections': [{
+                    'type': 'section',
+                    'id': 1,
+                    'content': [
+                        {
+                            'type': 'paragraph',
+                            'id': f'p9-{i}',
+                            'text': f'English {i}',
+                            'thai_text': f'Thai {i}',
+                            'corrected_thai_text': f'Thai {i}',
+                            'thai_status': 'unchecked',
+                        }
+                        for i in range(1, paragraph_count + 1)
+                    ],
+                }],
+            }],
+        }],
+    }
+
+
+class TranslationAPITestCase(TestCase):
+    """Translation circle with a loaded session, authenticated as the participant"""
+
+    PARAGRAPHS = 25
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.facilitator = AccessKey.objects.create(key='facilitator-key', role='facilitator')
+        cls.participant = AccessKey.objects.create(key='participant-key', role='participant')
+        cls.circle = Circle.objects.create(
+            name='Thai Review',
+            facilitator_key=cls.facilitator,
+            circle_type='translation',
+            jitsi_room_id='ic-test',
+        )
+        CircleParticipant.objects.create(circle=cls.circle, access_key=cls.participant)
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        json_path = Path(self.tmpdir) / 'book.json'
+        json_path.write_text(json.dumps(build_document(self.PARAGRAPHS)), encoding='utf-8')
+
+        self.document = TranslationDocument.objects.create(
+            circle=self.circle,
+            file_path=str(json_path),
+            language='thai',
+            title='Test Book',
+            created_by=self.facilitator,
+        )
+        self.session = JSONDocumentLoader(json_path).create_session(self.document, self.facilitator)
+
+        # Attribute every paragraph so the *_key fields have relations to follow
+        self.session.paragraphs.update(
+            last_modified_by=self.participant,
+            approved_by=self.facilitator,
+        )
+
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Key {self.participant.key}')
+
+    def counters(self):
+        """(unchecked, in_progress, approved, modified) counters of the session"""
+        self.session.refresh_from_db()
+        return (self.session.paragraphs_unchecked, self.session.paragraphs_in_progress,
+                self.session.paragraphs_approved, self.session.paragraphs_modified)
+
+
+class QueryBudgetTests(TranslationAPITestCase):
+    """
+    Query-count budgets for the translation API.
+
+    Budgets are independent of the number of paragraphs; exceeding one
+    usually means a serializer started following a relation per row.
+    """
+
+    def assertQueryBudget(self, budget, url, params=None):
+        # Measure the steady state: key and memberships cached, no last_used write due
+        resolve_key(self.participant.key)
+        memberships.circles(self.participant.id)
+        last_used_buffer.flush()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertLessEqual(
+            len(queries), budget,
+            '\n'.join(query['sql'] for query in queries.captured_queries)
+        )
+        return response
+
+    def test_list_paragraphs(self):
+        response = self.assertQueryBudget(
+            3, f'/api/translation/sessions/{self.session.id}/paragraphs/'
+        )
+        paragraphs = response.json()['paragraphs']
+        self.assertEqual(len(paragraphs), self.PARAGRAPHS)
+        self.assertEqual(paragraphs[0]['last_modified_by_key'], self.participant.key)
+        self.assertEqual(paragraphs[0]['approved_by_key'], self.facilitator.key)
+
+    def test_list_paragraphs_paginated_with_fields(self):
+        self.assertQueryBudget(
+            4,
+            f'/api/translation/sessions/{self.session.id}/paragraphs/',
+            {'limit': 10, 'fields': 'id,paragraph_id,status,approved_by_key'},
+        )
+
+    def test_get_session(self):
+        self.assertQueryBudget(2, f'/api/translation/sessions/{self.session.id}/')
+
+    def test_list_paragraph_changes(self):
+        self.session.paragraphs.update(change_seq=1)
+        response = self.assertQueryBudget(
+            3, f'/api/translation/sessions/{self.session.id}/changes/', {'since': 0}
+        )
+        self.assertEqual(len(response.json()['paragraphs']), self.PARAGRAPHS)
+
+    def test_get_paragraph(self):
+        paragraph = self.session.paragraphs.first()
+        self.assertQueryBudget(2, f'/api/translation/paragraphs/{paragraph.id}/')
+
+    def test_list_documents(self):
+        response = self.assertQueryBudget(1, '/api/translation/documents/')
+        self.assertEqual(response.json()[0]['created_by_key'], self.facilitator.key)
+
+
+class ParagraphVersionTests(TranslationAPITestCase):
+    """Conditional paragraph writes via If-Match / version"""
+
+    PARAGRAPHS = 2
+
+    def setUp(self):
+        super().setUp()
+        self.paragraph = self.session.paragraphs.order_by('id').first()
+        self.url = f'/api/translation/paragraphs/{self.paragraph.id}/update/'
+
+    def test_update_increments_version_and_sets_etag(self):
+        response = self.client.patch(self.url, {'corrected_translation': 'A'}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['version'], 2)
+        self.assertEqual(response['ETag'], '"2"')
+
+    def test_stale_if_match_returns_conflict_with_current_copy(self):
+        self.client.patch(self.url, {'corrected_translation': 'A'}, format='json')
+        response = self.client.patch(
+            self.url, {'corrected_translation': 'B'}, format='json', HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['current']['corrected_translation'], 'A')
+        self.assertEqual(response.json()['current']['version'], 2)
+
+    def test_body_version_precondition(self):
+        response = self.client.patch(
+            self.url, {'corrected_translation': 'B', 'version': 1}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        response = self.client.patch(
+            self.url, {'corrected_translation': 'C', 'version': 1}, format='json'
+        )
+        self.assertEqual(response.status_code, 409)
+
+
+class ChangeSequenceTests(TranslationAPITestCase):
+    """Paragraph writes take consecutive numbers from the session change sequence"""
+
+    PARAGRAPHS = 3
+
+    def test_writes_are_sequenced_and_replayed_once(self):
+        first, second, third = self.session.paragraphs.order_by('id')
+        update_url = '/api/translation/paragraphs/{}/update/'
+
+        self.client.patch(update_url.format(first.id), {'corrected_translation': 'A'}, format='json')
+        self.client.patch(update_url.format(second.id), {'corrected_translation': 'B'}, format='json')
+        self.client.patch(update_url.format(first.id), {'corrected_translation': 'C'}, format='json')
+
+        changes = paragraph_changes(self.session.id, since=0, limit=10)
+        self.assertEqual([(c['id'], c['change_seq']) for c in changes], [(second.id, 2), (first.id, 3)])
+        self.assertEqual(changes[1]['corrected_translation'], 'C')
+        self.assertEqual(paragraph_changes(self.session.id, since=3, limit=10), [])
+
+        response = self.client.get(f'/api/translation/sessions/{self.session.id}/paragraphs/')
+        self.assertEqual(response.json()['change_seq'], 3)
+
+    def test_event_stream_needs_asgi(self):
+        # The test client is WSGI, where the stream would be buffered whole
+        response = self.client.get(f'/api/translation/sessions/{self.session.id}/events/')
+        self.assertEqual(response.status_code, 501)
+
+    def test_changes_endpoint_pages_by_sequence(self):
+        first, second, third = self.session.paragraphs.order_by('id')
+        for paragraph in (third, first):
+            self.client.patch(
+                f'/api/translation/paragraphs/{paragraph.id}/update/',
+                {'corrected_translation': 'edited'}, format='json'
+            )
+        url = f'/api/translation/sessions/{self.session.id}/changes/'
+
+        page = self.client.get(url, {'since': 0, 'limit': 1}).json()
+        self.assertEqual([p['id'] for p in page['paragraphs']], [third.id])
+        self.assertTrue(page['has_more'])
+
+        page = self.client.get(url, {'since': page['next_since']}).json()
+        self.assertEqual([p['id'] for p in page['paragraphs']], [first.id])
+        self.assertFalse(page['has_more'])
+        self.assertEqual(page['next_since'], 2)
+
+        self.assertEqual(self.client.get(url).status_code, 400)
+
+
+class BulkParagraphTests(TranslationAPITestCase):
+    """Bulk update and bulk approve endpoints"""
+
+    PARAGRAPHS = 5
+
+    def setUp(self):
+        super().setUp()
+        self.paragraphs = list(self.session.paragraphs.order_by('id'))
+        self.facilitator_client = APIClient()
+        self.facilitator_client.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+
+    def test_bulk_update_reports_each_item(self):
+        first, second, third = self.paragraphs[:3]
+        url = f'/api/translation/sessions/{self.session.id}/paragraphs/bulk-update/'
+        response = self.client.post(url, {'paragraphs': [
+            {'id': first.id, 'corrected_translation': 'Edited 1'},
+            {'id': second.id, 'corrected_translation': 'Edited 2', 'version': second.version + 1},
+            {'id': 999999, 'corrected_translation': 'Nowhere'},
+            {'id': third.id, 'corrected_translation': ' '},
+            {'corrected_translation': 'No id'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        self.assertEqual(body['updated'], 1)
+        self.assertEqual([r['result'] for r in body['results']],
+                         ['updated', 'conflict', 'not_found', 'invalid', 'invalid'])
+        self.assertEqual(body['results'][0]['version'], first.version + 1)
+        self.assertEqual(body['results'][1]['current']['version'], second.version)
+
+        first.refresh_from_db()
+        self.assertEqual((first.corrected_translation, first.status), ('Edited 1', 'in_progress'))
+        self.assertEqual(self.counters(), (self.PARAGRAPHS - 1, 1, 0, 1))
+
+    def test_bulk_update_approval_is_for_facilitators(self):
+        url = f'/api/translation/sessions/{self.session.id}/paragraphs/bulk-update/'
+        items = [{'id': p.id, 'corrected_translation': f'Final {p.id}', 'status': 'approved'}
+                 for p in self.paragraphs[:2]]
+        response = self.client.post(url, {'paragraphs': items}, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.counters(), (self.PARAGRAPHS, 0, 0, 0))
+
+        response = self.facilitator_client.post(url, {'paragraphs': items}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        paragraph = self.session.paragraphs.get(id=self.paragraphs[0].id)
+        self.assertEqual(paragraph.approved_by_id, self.facilitator.id)
+        self.assertIsNotNone(paragraph.approved_at)
+        self.assertEqual(TranslationMemoryEntry.objects.count(), 2)
+        self.assertEqual(self.counters(), (self.PARAGRAPHS - 2, 0, 2, 2))
+
+    def test_bulk_approve_and_revert(self):
+        first, second = self.paragraphs[:2]
+        url = f'/api/translation/sessions/{self.session.id}/paragraphs/bulk-approve/'
+        response = self.client.post(url, {'paragraph_ids': [first.id]}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+        response = self.facilitator_client.post(
+            url, {'paragraph_ids': [first.id, second.id, 999999]}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        self.assertEqual(body['approved'], 2)
+        self.assertEqual({r['id']: r['result'] for r in body['results']},
+                         {first.id: 'approved', second.id: 'approved', 999999: 'not_found'})
+        self.assertEqual(self.counters(), (self.PARAGRAPHS - 2, 0, 2, 2))
+
+        # Approving again changes nothing
+        second.refresh_from_db()
+        response = self.facilitator_client.post(url, {'paragraph_ids': [second.id]}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['approved'], 0)
+        self.assertEqual(response.json()['results'],
+                         [{'id': second.id, 'paragraph_id': second.paragraph_id,
+                           'result': 'already_approved', 'version': second.version}])
+        unchanged = self.session.paragraphs.get(id=second.id)
+        self.assertEqual((unchanged.version, unchanged.approved_at), (second.version, second.approved_at))
+        self.assertEqual(sorted(TranslationMemoryEntry.objects.values_list('occurrences', flat=True)), [1, 1])
+        response = self.facilitator_client.post(url, {'status': 'approved'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        # Back to unchecked: the paragraph no longer counts as modified
+        response = self.client.patch(
+            f'/api/translation/paragraphs/{first.id}/update/',
+            {'corrected_translation': 'Thai 1', 'status': 'unchecked'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.counters(), (self.PARAGRAPHS - 1, 0, 1, 1))
+
+
+class StatusCounterTests(TranslationAPITestCase):
+    """Session counters follow single-paragraph status changes"""
+
+    PARAGRAPHS = 4
+
+    def setUp(self):
+        super().setUp()
+        self.paragraph = self.session.paragraphs.order_by('id').first()
+        self.facilitator_client = APIClient()
+        self.facilitator_client.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+
+    def update(self, status=None):
+        body = {'corrected_translation': 'Edited'}
+        if status:
+            body['status'] = status
+        response = self.client.patch(f'/api/translation/paragraphs/{self.paragraph.id}/update/', body, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def test_update_approve_and_revert_to_unchecked(self):
+        self.assertEqual(self.counters(), (4, 0, 0, 0))
+        self.update()
+        self.assertEqual(self.counters(), (3, 1, 0, 1))
+        self.update()
+        self.assertEqual(self.counters(), (3, 1, 0, 1))
+
+        response = self.facilitator_client.post(f'/api/translation/paragraphs/{self.paragraph.id}/approve/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.counters(), (3, 0, 1, 1))
+
+        self.update('unchecked')
+        self.assertEqual(self.counters(), (4, 0, 0, 0))
+
+    def test_unknown_status_counts_only_as_modified(self):
+        data = build_document(2)
+        data['content'][0]['chapters'][0]['sections'][0]['content'][0]['thai_status'] = 'needs_review'
+        json_path = Path(self.tmpdir) / 'other.json'
+        json_path.write_text(json.dumps(data), encoding='utf-8')
+        document = TranslationDocument.objects.create(
+            circle=self.circle, file_path=str(json_path), language='thai',
+            title='Other Book', created_by=self.facilitator,
+        )
+        self.session = JSONDocumentLoader(json_path).create_session(document, self.facilitator)
+        self.assertEqual(self.counters(), (1, 0, 0, 1))
+
+        self.paragraph = self.session.paragraphs.get(status='needs_review')
+        self.update()
+        self.assertEqual(self.counters(), (1, 1, 0, 1))
+        self.update('unchecked')
+        self.assertEqual(self.counters(), (2, 0, 0, 0))
+
+
+class JSONStreamingTests(TestCase):
+    """The streaming reader agrees with json.load at any buffer size"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def write(self, data, **dump_kwargs):
+        path = Path(self.tmpdir) / 'stream.json'
+        path.write_text(json.dumps(data, ensure_ascii=False, **dump_kwargs), encoding='utf-8')
+        return path
+
+    def parsed_nodes(self, path):
+        loader = JSONDocumentLoader(path)
+        loader.data = json.loads(path.read_text(encoding='utf-8'))
+        return list(loader.iter_nodes())
+
+    def assertStreamsLikeJsonLoad(self, path):
+        expected = self.parsed_nodes(path)
+        self.assertTrue(expected)
+        metadata = json.loads(path.read_text(encoding='utf-8'))['metadata']
+        for read_size in (1, 2, 3, 5, 10, 13, 26, 65, 130, 4096):
+            with self.subTest(read_size=read_size):
+                streamed = list(iter_paragraph_nodes_streaming(path, read_size=read_size))
+                self.assertEqual([(node, chapter, section) for _, node, chapter, section in streamed], expected)
+                self.assertEqual(streamed[0][0], metadata)
+
+    def test_numbers_split_across_reads(self):
+        data = build_document(3)
+        data['metadata']['edition'] = 1.5e3
+        data['content'][0]['id'] = -7
+        chapter = data['content'][0]['chapters'][0]
+        chapter['id'] = 12.5
+        chapter['sections'][0]['content'][0]['score'] = 2.25e-10
+        # Subsections, non-section entries and unicode text
+        chapter['sections'][0]['content'].append({
+            'type': 'subsection', 'id': 's1',
+            'content': [{'type': 'paragraph', 'id': 'p9-x', 'text': 'ข้อความ', 'n': 1E+2}],
+        })
+        data['content'].append({'type': 'appendix', 'id': 3.0, 'chapters': []})
+        for indent in (None, 2):
+            with self.subTest(indent=indent):
+                self.assertStreamsLikeJsonLoad(self.write(data, indent=indent))
+
+
+class AtomicWriteTests(TestCase):
+    """atomic_write_json replaces the file whole and keeps N previous versions"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.path = Path(self.tmpdir) / 'book.json'
+
+    def read(self, path):
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def test_generations_rotate_and_oldest_is_dropped(self):
+        for version in range(1, 6):
+            atomic_write_json(self.path, {'version': version}, generations=3)
+        self.assertEqual(self.read(self.path), {'version': 5})
+        for generation, version in ((1, 4), (2, 3), (3, 2)):
+            self.assertEqual(self.read(Path(f'{self.path}.{generation}')), {'version': version})
+        self.assertFalse(Path(f'{self.path}.4').exists())
+        self.assertEqual(sorted(os.listdir(self.tmpdir)),
+                         ['book.json', 'book.json.1', 'book.json.2', 'book.json.3'])
+
+    def test_permissions_are_kept(self):
+        atomic_write_json(self.path, {'version': 1}, generations=0)
+        os.chmod(self.path, 0o640)
+        atomic_write_json(self.path, {'version': 2}, generations=0)
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(self.read(self.path), {'version': 2})
+
+    def test_failed_write_leaves_original_intact(self):
+        atomic_write_json(self.path, {'version': 1}, generations=2)
+        original = self.path.read_bytes()
+        with self.assertRaises(TypeError):
+            atomic_write_json(self.path, {'version': 2, 'bad': object()}, generations=2)
+        self.assertEqual(self.path.read_bytes(), original)
+        # No temporary file or rotated copy is left behind
+        self.assertEqual(os.listdir(self.tmpdir), ['book.json'])
+
+
+class DocumentCacheTests(TestCase):
+    """DocumentCache serves a file's current version only, within its byte budget"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def write(self, name, data):
+        path = Path(self.tmpdir) / name
+        path.write_text(json.dumps(data), encoding='utf-8')
+        return path
+
+    def test_hit_and_miss_on_mtime_or_size_change(self):
+        cache = DocumentCache(max_bytes=1024 * 1024)
+        path = self.write('book.json', {'version': 1})
+        first = cache.get(path)
+        self.assertIs(cache.get(path), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Same size, new mtime
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertIsNot(cache.get(path), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # New size
+        self.write('book.json', {'version': 22})
+        self.assertEqual(cache.get(path), {'version': 22})
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        # Older versions of the file are dropped
+        self.assertEqual(cache.stats()['entries'], 1)
+
+    def test_least_recently_used_is_evicted(self):
+        paths = [self.write(f'{name}.json', {'name': name * 40}) for name in 'abc']
+        size = paths[0].stat().st_size
+        cache = DocumentCache(max_bytes=size * 2)
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])  # b is now least recently used
+        cache.get(paths[2])
+        self.assertTrue(cache.contains(paths[0]))
+        self.assertFalse(cache.contains(paths[1]))
+        self.assertTrue(cache.contains(paths[2]))
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertLessEqual(cache.stats()['bytes'], size * 2)
+
+    def test_writer_does_not_mutate_cached_tree(self):
+        document_cache.clear()
+        self.addCleanup(document_cache.clear)
+        path = self.write('book.json', build_document(3))
+        cached = document_cache.get(path)
+        snapshot = copy.deepcopy(cached)
+
+        writer = JSONDocumentWriter(path)
+        writer.update_paragraph('p9-1', 'Edited', 'approved', 'Facilitator', '1')
+        self.assertEqual(cached, snapshot)
+        writer.save_json()
+        self.assertEqual(cached, snapshot)
+
+        # The saved version is served from the cache with the edit
+        saved = document_cache.get(path)
+        self.assertIsNot(saved, cached)
+        node = next(node for node in iter_paragraph_nodes(saved['content']) if node['id'] == 'p9-1')
+        self.assertEqual(node['corrected_thai_text'], 'Edited')
+
+
+class CreateSessionTests(TranslationAPITestCase):
+    """Loading a session is all or nothing"""
+
+    PARAGRAPHS = 6
+
+    def setUp(self):
+        super().setUp()
+        json_path = Path(self.tmpdir) / 'second.json'
+        shutil.copy(self.document.file_path, json_path)
+        self.new_document = TranslationDocument.objects.create(
+            circle=self.circle,
+            file_path=str(json_path),
+            language='thai',
+            title='Second Load',
+            created_by=self.facilitator,
+        )
+        self.loader = JSONDocumentLoader(json_path)
+
+    def assertNothingLoaded(self):
+        self.assertFalse(TranslationSession.objects.filter(document=self.new_document).exists())
+        self.assertEqual(ParagraphCorrection.objects.count(), self.PARAGRAPHS)
+        self.new_document.refresh_from_db()
+        self.assertEqual(self.new_document.status, 'uploaded')
+        self.assertIsNone(self.new_document.last_loaded_at)
+
+    def test_dry_run_rolls_back(self):
+        session = self.loader.create_session(self.new_document, self.facilitator, batch_size=2, dry_run=True)
+        self.assertEqual(session.total_paragraphs, self.PARAGRAPHS)
+        self.assertEqual(self.loader.load_stats['rows'], self.PARAGRAPHS)
+        self.assertTrue(self.loader.load_stats['dry_run'])
+        self.assertNothingLoaded()
+
+    def test_failure_between_batches_leaves_nothing_behind(self):
+        bulk_create = ParagraphCorrection.objects.bulk_create
+        calls = []
+
+        def fail_on_second_batch(objs, **kwargs):
+            calls.append(len(objs))
+            if len(calls) == 2:
+                raise IntegrityError('simulated failure')
+            return bulk_create(objs, **kwargs)
+
+        with mock.patch.object(ParagraphCorrection.objects, 'bulk_create', side_effect=fail_on_second_batch):
+            with self.assertRaises(IntegrityError):
+                self.loader.create_session(self.new_document, self.facilitator, batch_size=2)
+        self.assertEqual(calls, [2, 2])
+        self.assertNothingLoaded()
+
+
+class DeltaSaveTests(TranslationAPITestCase):
+    """Ending a session patches only the paragraphs that changed"""
+
+    PARAGRAPHS = 6
+
+    def test_only_changed_paragraphs_are_patched(self):
+        json_path = Path(self.document.file_path)
+        before = json.loads(json_path.read_text(encoding='utf-8'))
+        edited = list(self.session.paragraphs.order_by('id'))[1:3]
+        for paragraph in edited:
+            response = self.client.patch(
+                f'/api/translation/paragraphs/{paragraph.id}/update/',
+                {'corrected_translation': f'Edited {paragraph.paragraph_id}'}, format='json'
+            )
+            self.assertEqual(response.status_code, 200, response.content)
+
+        writer = JSONDocumentWriter(json_path)
+        with mock.patch.object(writer, 'update_paragraph', wraps=writer.update_paragraph) as update:
+            writer.save_session(self.session, self.facilitator)
+        self.assertEqual(sorted(call.kwargs['paragraph_id'] for call in update.call_args_list),
+                         sorted(p.paragraph_id for p in edited))
+
+        after = json.loads(json_path.read_text(encoding='utf-8'))
+        before_nodes = {node['id']: node for node in iter_paragraph_nodes(before['content'])}
+        after_nodes = {node['id']: node for node in iter_paragraph_nodes(after['content'])}
+        self.assertEqual(before_nodes.keys(), after_nodes.keys())
+        edited_ids = {p.paragraph_id for p in edited}
+        for paragraph_id, node in after_nodes.items():
+            if paragraph_id in edited_ids:
+                self.assertEqual(node['corrected_thai_text'], f'Edited {paragraph_id}')
+                self.assertEqual(node['thai_status'], 'in_progress')
+            else:
+                self.assertEqual(node, before_nodes[paragraph_id])
+        self.assertEqual(after['metadata'], before['metadata'])
+
+        # Rows match the file again
+        self.assertFalse(self.session.paragraphs.exclude(loaded_fingerprint=F('fingerprint')).exists())
+
+    def test_unknown_paragraphs_are_reported_together(self):
+        writer = JSONDocumentWriter(self.document.file_path)
+        updates = [
+            {'paragraph_id': paragraph_id, 'corrected_text': f'Edited {paragraph_id}', 'status': 'in_progress'}
+            for paragraph_id in ('p9-1', 'p9-missing', 'p9-2', 'p9-gone')
+        ]
+        with self.assertRaisesMessage(ValueError, '2 paragraph(s) not found in JSON: p9-missing, p9-gone'):
+            writer.update_paragraphs(updates)
+
+        # The known paragraphs were still updated
+        writer.save_json()
+        saved = json.loads(Path(self.document.file_path).read_text(encoding='utf-8'))
+        edited = {node['id']: node['corrected_thai_text'] for node in iter_paragraph_nodes(saved['content'])}
+        self.assertEqual((edited['p9-1'], edited['p9-2'], edited['p9-3']), ('Edited p9-1', 'Edited p9-2', 'Thai 3'))
+
+
+class SearchTests(TranslationAPITestCase):
+    """Ranked paragraph search across source and target text"""
+
+    PARAGRAPHS = 3
+
+    def search(self, **params):
+        response = self.client.get(f'/api/translation/sessions/{self.session.id}/search/', params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_thai_is_tokenized_into_bigrams(self):
+        self.assertEqual(tokenize('ธรรมะ Dharma'), ['ธร', 'รร', 'รม', 'มะ', 'dharma'])
+
+    def test_search_finds_words_and_reflects_later_edits(self):
+        result = self.search(q='english 2')
+        self.assertEqual([hit['paragraph_id'] for hit in result['hits']], ['p9-2'])
+        self.assertEqual(result['hits'][0]['highlights'], {'text': [[0, 7], [8, 9]]})
+
+        paragraph = self.session.paragraphs.get(paragraph_id='p9-3')
+        self.client.patch(
+            f'/api/translation/paragraphs/{paragraph.id}/update/',
+            {'corrected_translation': 'การปฏิบัติธรรมะทุกวัน'}, format='json'
+        )
+        result = self.search(q='ธรรมะ', fields='corrected_translation')
+        self.assertEqual([hit['id'] for hit in result['hits']], [paragraph.id])
+        self.assertEqual(result['hits'][0]['highlights'], {'corrected_translation': [[10, 15]]})
+
+
+class TerminologyTests(TranslationAPITestCase):
+    """Glossary consistency scans"""
+
+    PARAGRAPHS = 3
+
+    def test_automaton_finds_overlapping_patterns(self):
+        automaton = TermAutomaton([('noble', 'truths'), ('four', 'noble', 'truths'), ('truths',), ('path',)])
+        self.assertEqual(automaton.matches(['the', 'four', 'noble', 'truths']), {0, 1, 2})
+        self.assertEqual(automaton.matches(['four', 'noble', 'path']), {3})
+
+    def test_session_scan_reports_missing_renderings(self):
+        paragraph = self.session.paragraphs.get(paragraph_id='p9-2')
+        self.client.patch(
+            f'/api/translation/paragraphs/{paragraph.id}/update/',
+            {'corrected_translation': 'แปล 2'}, format='json'
+        )
+        response = self.client.post(
+            f'/api/translation/sessions/{self.session.id}/terminology/',
+            {'glossary': [{'source': 'English', 'target': ['Thai', 'ไทย']}]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        report = response.json()
+        self.assertEqual(report['paragraphs_scanned'], self.PARAGRAPHS)
+        self.assertEqual([issue['paragraph_id'] for issue in report['issues']], ['p9-2'])
+        self.assertEqual(report['issues'][0]['missing'], [{'source': 'English', 'target': ['Thai', 'ไทย']}])
+
+
+class TranslationMemoryTests(TranslationAPITestCase):
+    """Approved paragraphs feed fuzzy suggestions for similar ones"""
+
+    PARAGRAPHS = 3
+
+    def test_approval_feeds_suggestions_for_similar_paragraphs(self):
+        approved, similar, _ = self.session.paragraphs.order_by('id')
+        facilitator = APIClient()
+        facilitator.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+        response = facilitator.post(f'/api/translation/paragraphs/{approved.id}/approve/')
+        self.assertEqual(response.status_code, 200, response.content)
+
+        response = self.client.get(f'/api/translation/paragraphs/{similar.id}/suggestions/')
+        self.assertEqual(response.status_code, 200, response.content)
+        suggestions = response.json()['suggestions']
+        self.assertEqual([s['target_text'] for s in suggestions], ['Thai 1'])
+        self.assertGreaterEqual(suggestions[0]['similarity'], 0.5)
+
+        # A paragraph is not suggested to itself
+        response = self.client.get(f'/api/translation/paragraphs/{approved.id}/suggestions/')
+        self.assertEqual(response.json()['suggestions'], [])
+
+    def test_reapproval_and_backfill_do_not_inflate_counts(self):
+        first, second, _ = self.session.paragraphs.order_by('id')
+        facilitator = APIClient()
+        facilitator.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+        for paragraph in (first, first, second):
+            response = facilitator.post(f'/api/translation/paragraphs/{paragraph.id}/approve/')
+            self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(sorted(TranslationMemoryEntry.objects.values_list('occurrences', flat=True)), [1, 1])
+
+        for _ in range(2):
+            call_command('build_translation_memory', stdout=io.StringIO())
+            self.assertEqual(sorted(TranslationMemoryEntry.objects.values_list('occurrences', flat=True)), [1, 1])
+
+    def test_concurrent_insert_of_the_same_pair_is_counted(self):
+        paragraph = self.session.paragraphs.order_by('id').first()
+        record_approved([paragraph], 'thai', self.document)
+        bands = TranslationMemoryBand.objects.count()
+
+        # The other approval commits after this one looked for the pair
+        lookup = TranslationMemoryEntry.objects.filter
+        calls = []
+
+        def filter_after_race(*args, **kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return TranslationMemoryEntry.objects.none()
+            return lookup(*args, **kwargs)
+
+        with mock.patch.object(TranslationMemoryEntry.objects, 'filter', side_effect=filter_after_race):
+            self.assertEqual(record_approved([paragraph], 'thai', self.document), 0)
+        entry = TranslationMemoryEntry.objects.get()
+        self.assertEqual(entry.occurrences, 2)
+        self.assertEqual(TranslationMemoryBand.objects.count(), bands)
+
+
+class DocumentDiffTests(TranslationAPITestCase):
+    """Paragraph diffs between JSON generations"""
+
+    PARAGRAPHS = 4
+
+    def test_changes_are_matched_by_paragraph_id(self):
+        old_path = Path(self.document.file_path)
+        data = build_document(self.PARAGRAPHS)
+        paragraphs = data['content'][0]['chapters'][0]['sections'][0]['content']
+        # Move p9-1 to the end, edit p9-2, drop p9-3, add p9-5
+        paragraphs.append(paragraphs.pop(0))
+        paragraphs[0]['corrected_thai_text'] = 'แปล 2'
+        del paragraphs[1]
+        paragraphs.append({'type': 'paragraph', 'id': 'p9-5', 'text': 'English 5'})
+        new_path = Path(self.tmpdir) / 'new.json'
+        new_path.write_text(json.dumps(data), encoding='utf-8')
+
+        summary = {}
+        changes = list(iter_paragraph_changes(old_path, new_path, summary))
+        self.assertEqual(summary, {'added': 1, 'removed': 1, 'modified': 1, 'unchanged': 2})
+        self.assertEqual(
+            [(c['paragraph_id'], c['change']) for c in changes],
+            [('p9-2', 'modified'), ('p9-3', 'removed'), ('p9-5', 'added')]
+        )
+        self.assertEqual(changes[0]['fields'], {'corrected_thai_text': {'old': 'Thai 2', 'new': 'แปล 2'}})
+
+    def test_end_session_writes_review_and_diff_endpoint(self):
+        paragraph = self.session.paragraphs.get(paragraph_id='p9-2')
+        self.client.patch(
+            f'/api/translation/paragraphs/{paragraph.id}/update/',
+            {'corrected_translation': 'แปล 2'}, format='json'
+        )
+        response = self.client.post(f'/api/translation/sessions/{self.session.id}/end/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['review']['modified'], 1)
+        self.assertTrue(Path(f'{self.document.file_path}.review.html').exists())
+
+        response = self.client.get(f'/api/translation/documents/{self.document.id}/diff/')
+        self.assertEqual(response.status_code, 200)
+        report = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([c['paragraph_id'] for c in report['changes']], ['p9-2'])
+        # The review written at save time is the same report
+        written = json.loads(Path(f'{self.document.file_path}.review.json').read_text(encoding='utf-8'))
+        self.assertEqual(written, report)
+
+        response = self.client.get(f'/api/translation/documents/{self.document.id}/diff/?from=3')
+        self.assertEqual(response.status_code, 404)
+
+
+class DocumentSidecarTests(TranslationAPITestCase):
+    """Binary sidecar mirrors the JSON file and follows its changes"""
+
+    PARAGRAPHS = 5
+
+    def load(self):
+        loader = JSONDocumentLoader(self.document.file_path)
+        return loader, list(loader.iter_paragraphs())
+
+    def test_sidecar_matches_json_and_tracks_changes(self):
+        # setUp's session load wrote the sidecar
+        loader, paragraphs = self.load()
+        self.assertEqual(loader.paragraph_source, 'sidecar')
+        self.assertEqual(paragraphs, list(JSONDocumentLoader(self.document.file_path)._iter_formatted()))
+        self.assertEqual(loader.metadata['language'], 'thai')
+
+        # Touched but unchanged: still reused
+        os.utime(self.document.file_path)
+        loader, _ = self.load()
+        self.assertEqual(loader.paragraph_source, 'sidecar')
+
+        data = build_document(self.PARAGRAPHS)
+        data['content'][0]['chapters'][0]['sections'][0]['content'][2]['corrected_thai_text'] = 'แปล 3'
+        Path(self.document.file_path).write_text(json.dumps(data), encoding='utf-8')
+        loader, paragraphs = self.load()
+        self.assertEqual(loader.paragraph_source, 'sidecar_rebuilt')
+        self.assertEqual(paragraphs[2]['corrected_translation'], 'แปล 3')
+
+        with open_sidecar(self.document.file_path)[0] as sidecar:
+            self.assertEqual(len(sidecar), self.PARAGRAPHS)
+            self.assertEqual([p['paragraph_id'] for p in sidecar.paragraphs(2, 4)], ['p9-3', 'p9-4'])
+
+    def test_older_format_is_rebuilt(self):
+        # Version 1 sidecars had 32-bit blob offsets
+        path = sidecar_path(self.document.file_path)
+        with open(path, 'r+b') as f:
+            f.seek(4)
+            f.write(struct.pack('<H', 1))
+        self.assertEqual(open_sidecar(self.document.file_path), (None, False))
+
+        loader, paragraphs = self.load()
+        self.assertEqual(loader.paragraph_source, 'sidecar_rebuilt')
+        self.assertEqual(len(paragraphs), self.PARAGRAPHS)
+        with open_sidecar(self.document.file_path)[0] as sidecar:
+            self.assertEqual([p['paragraph_id'] for p in sidecar.paragraphs(4)], ['p9-5'])
+
+    def test_stale_sidecar_is_rebuilt_before_the_session_transaction(self):
+        data = build_document(self.PARAGRAPHS)
+        data['content'][0]['chapters'][0]['sections'][0]['content'][0]['corrected_thai_text'] = 'แปล 1'
+        Path(self.document.file_path).write_text(json.dumps(data), encoding='utf-8')
+
+        loader = JSONDocumentLoader(self.document.file_path)
+        outside = len(connection.atomic_blocks)
+        depths = []
+        write_sidecar = loader.write_sidecar
+
+        def record_depth():
+            depths.append(len(connection.atomic_blocks))
+            return write_sidecar()
+
+        with mock.patch.object(loader, 'write_sidecar', side_effect=record_depth):
+            loader.create_session(self.document, self.facilitator, dry_run=True)
+        self.assertEqual(depths, [outside])
+        self.assertEqual(loader.load_stats['source'], 'sidecar_rebuilt')
+        self.assertEqual(loader.load_stats['rows'], self.PARAGRAPHS)
+
+
+class DocumentPreviewTests(TranslationAPITestCase):
+    """Read-only browsing straight from the JSON file"""
+
+    PARAGRAPHS = 5
+
+    def test_preview_pages_without_writes_and_honours_etag(self):
+        url = f'/api/translation/documents/{self.document.id}/preview/'
+        resolve_key(self.participant.key)
+        last_used_buffer.flush()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'offset': 3, 'limit': 10})
+        self.assertEqual(response.status_code, 200, response.content)
+        writes = [q['sql'] for q in queries.captured_queries if not q['sql'].startswith('SELECT')]
+        self.assertEqual(writes, [])
+
+        page = response.json()
+        self.assertEqual(page['total'], self.PARAGRAPHS)
+        self.assertEqual([p['paragraph_id'] for p in page['paragraphs']], ['p9-4', 'p9-5'])
+        self.assertEqual(page['paragraphs'][0]['translations']['thai']['status'], 'unchecked')
+        self.assertEqual(page['status'], {'thai': {'unchecked': self.PARAGRAPHS}})
+        self.assertEqual(page['chapters'][0]['id'], '9')
+
+        response = self.client.get(url, {'offset': 3}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(url, {'chapter': 'missing'})
+        self.assertEqual(response.status_code, 404)
+
+
+class MultiLanguageSessionTests(TranslationAPITestCase):
+    """One session over several target languages of a multi-language file"""
+
+    PARAGRAPHS = 3
+
+    def setUp(self):
+        super().setUp()
+        data = build_document(self.PARAGRAPHS)
+        for node in data['content'][0]['chapters'][0]['sections'][0]['content']:
+            number = node['id'].split('-')[1]
+            node['vietnamese_text'] = f'Viet {number}'
+            node['korean_text'] = f'Korean {number}'
+        path = Path(self.tmpdir) / 'multi.json'
+        path.write_text(json.dumps(data), encoding='utf-8')
+        self.multi_document = TranslationDocument.objects.create(
+            circle=self.circle, file_path=str(path), language='thai',
+            title='Multi', created_by=self.facilitator,
+        )
+        self.facilitator_client = APIClient()
+        self.facilitator_client.credentials(HTTP_AUTHORIZATION=f'Key {self.facilitator.key}')
+
+    def test_edit_and_save_several_languages(self):
+        response = self.facilitator_client.post('/api/translation/sessions/start/', {
+            'document_id': self.multi_document.id,
+            'circle_id': self.circle.id,
+            'languages': ['thai', 'vietnamese', 'korean'],
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        session_id = response.json()['id']
+        self.assertEqual(response.json()['languages'], ['thai', 'vietnamese', 'korean'])
+
+        response = self.client.get(f'/api/translation/sessions/{session_id}/paragraphs/', {'limit': 2})
+        first = response.json()['paragraphs'][0]
+        self.assertEqual(first['original_translation'], 'Thai 1')
+        self.assertEqual(
+            [(t['language'], t['original_translation']) for t in first['translations']],
+            [('vietnamese', 'Viet 1'), ('korean', 'Korean 1')]
+        )
+
+        paragraph_id = first['id']
+        response = self.client.patch(
+            f'/api/translation/paragraphs/{paragraph_id}/translations/vietnamese/update/',
+            {'corrected_translation': 'Việt 1'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        response = self.facilitator_client.post(
+            f'/api/translation/paragraphs/{paragraph_id}/translations/korean/approve/'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        response = self.client.post(
+            f'/api/translation/paragraphs/{paragraph_id}/translations/korean/approve/'
+        )
+        self.assertEqual(response.status_code, 403)
+
+        response = self.facilitator_client.post(f'/api/translation/sessions/{session_id}/end/')
+        self.assertEqual(response.status_code, 200, response.content)
+
+        saved = json.loads(Path(self.multi_document.file_path).read_text(encoding='utf-8'))
+        node = saved['content'][0]['chapters'][0]['sections'][0]['content'][0]
+        self.assertEqual(node['corrected_vietnamese_text'], 'Việt 1')
+        self.assertEqual(node['vietnamese_status'], 'in_progress')
+        self.assertEqual(node['korean_status'], 'approved')
+        self.assertEqual(node['thai_status'], 'unchecked')
+
+    def test_primary_language_feeds_translation_memory(self):
+        response = self.facilitator_client.post('/api/translation/sessions/start/', {
+            'document_id': self.multi_document.id,
+            'circle_id': self.circle.id,
+            'languages': ['vietnamese', 'korean'],
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        session_id = response.json()['id']
+        paragraph_id = self.client.get(
+            f'/api/translation/sessions/{session_id}/paragraphs/', {'limit': 1}
+        ).json()['paragraphs'][0]['id']
+
+        response = self.facilitator_client.post(f'/api/translation/paragraphs/{paragraph_id}/approve/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(
+            list(TranslationMemoryEntry.objects.values_list('language', 'target_text')),
+            [('vietnamese', 'Viet 1')]
+        )
+        response = self.client.get(f'/api/translation/paragraphs/{paragraph_id}/suggestions/')
+        self.assertEqual(response.json()['language'], 'vietnamese')
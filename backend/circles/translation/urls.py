@@ -17,11 +17,21 @@ urlpatterns = [
     path('sessions/<int:session_id>/', views.get_session, name='translation-session-detail'),
     path('sessions/<int:session_id>/end/', views.end_session, name='translation-session-end'),
     path('sessions/<int:session_id>/paragraphs/', views.list_paragraphs, name='translation-session-paragraphs'),
+    path('sessions/<int:session_id>/paragraphs/bulk-update/', views.bulk_update_paragraphs, name='translation-session-paragraphs-bulk-update'),
+    path('sessions/<int:session_id>/paragraphs/bulk-approve/', views.bulk_approve_paragraphs, name='translation-session-paragraphs-bulk-approve'),
 
     # Paragraph operations
+    path('sessions/<int:session_id>/search/', views.search_paragraphs, name='translation-session-search'),
+    path('sessions/<int:session_id>/terminology/', views.scan_session_terminology, name='translation-session-terminology'),
+    path('sessions/<int:session_id>/changes/', views.list_paragraph_changes, name='translation-session-changes'),
+    path('sessions/<int:session_id>/events/', views.session_events, name='translation-session-events'),
     path('paragraphs/<int:paragraph_id>/', views.get_paragraph, name='translation-paragraph-detail'),
+    path('paragraphs/<int:paragraph_id>/suggestions/', views.paragraph_suggestions, name='translation-paragraph-suggestions'),
     path('paragraphs/<int:paragraph_id>/update/', views.update_paragraph, name='translation-paragraph-update'),
     path('paragraphs/<int:paragraph_id>/approve/', views.approve_paragraph, name='translation-paragraph-approve'),
+    path('paragraphs/<int:paragraph_id>/translations/', views.paragraph_translations, name='translation-paragraph-translations'),
+    path('paragraphs/<int:paragraph_id>/translations/<str:language>/update/', views.update_paragraph_translation, name='translation-paragraph-translation-update'),
+    path('paragraphs/<int:paragraph_id>/translations/<str:language>/approve/', views.approve_paragraph_translation, name='translation-paragraph-translation-approve'),
 
     # Include router URLs (for documents)
     path('', include(router.urls)),
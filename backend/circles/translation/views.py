@@ -7,33 +7,72 @@ Endpoints:
 - POST /api/translation/sessions/start/ - Start new translation session
 - POST /api/translation/sessions/<id>/end/ - End session and save to JSON
 - GET /api/translation/sessions/<id>/ - Get session details
-- GET /api/translation/sessions/<id>/paragraphs/ - List all paragraphs in session
+- GET /api/translation/sessions/<id>/paragraphs/ - List paragraphs in session (optionally paginated)
 - GET /api/translation/paragraphs/<id>/ - Get single paragraph
+- GET /api/translation/paragraphs/<id>/suggestions/ - Translation memory matches
 - PATCH /api/translation/paragraphs/<id>/ - Update paragraph correction
 - POST /api/translation/paragraphs/<id>/approve/ - Approve paragraph (facilitator)
+- GET /api/translation/paragraphs/<id>/translations/ - Other languages of a paragraph (multi-language sessions)
+- PATCH /api/translation/paragraphs/<id>/translations/<language>/update/ - Update one language
+- POST /api/translation/paragraphs/<id>/translations/<language>/approve/ - Approve one language (facilitator)
+- POST /api/translation/sessions/<id>/paragraphs/bulk-update/ - Update many paragraphs
+- POST /api/translation/sessions/<id>/paragraphs/bulk-approve/ - Approve many paragraphs (facilitator)
+- GET /api/translation/sessions/<id>/search/?q=<terms> - Ranked full-text paragraph search
+- POST /api/translation/sessions/<id>/terminology/ - Glossary consistency scan of a session
+- POST /api/translation/documents/<id>/terminology/ - Glossary consistency scan of a JSON document
+- GET /api/translation/documents/<id>/diff/?from=1&to=0 - Paragraph diff between JSON generations
+- GET /api/translation/documents/<id>/preview/ - Read-only paragraphs and outline (no session)
+- GET /api/translation/sessions/<id>/changes/?since=<seq> - Paragraphs changed after a sequence number
+- GET /api/translation/sessions/<id>/events/ - Live paragraph changes (Server-Sent Events)
 
 Status: Phase 2 - Implementation
 """
 
+import base64
+import json
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 
-from authentication.views import get_key_from_request
-from circles.models import Circle, CircleParticipant
-from .models import TranslationDocument, TranslationSession, ParagraphCorrection
+from authentication.principal import get_principal
+from circles.http import if_none_match
+from circles.models import Circle
+from .models import TranslationDocument, TranslationSession, ParagraphCorrection, ParagraphTranslation
 from .serializers import (
     TranslationDocumentSerializer,
     TranslationSessionSerializer,
     ParagraphCorrectionSerializer,
+    ParagraphTranslationSerializer,
     ParagraphUpdateSerializer,
+    BulkParagraphUpdateSerializer,
+    BulkApproveSerializer,
+    TerminologyScanSerializer,
     SessionStartSerializer,
     SessionEndSerializer,
 )
 from .services import JSONDocumentLoader, JSONDocumentWriter
+from .events import session_event_stream
+from .search import SEARCH_FIELDS, search_indexes
+from .terminology import get_scanner
+from .memory import is_recorded, record_approved, suggest
+from .preview import document_etag, preview_page
+from .docdiff import generation_path, iter_html_report, iter_json_report, write_review_reports
+
+# Paragraph list pagination
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Rows per UPDATE statement in the bulk paragraph endpoints
+BULK_UPDATE_BATCH_SIZE = 100
 
 
 def check_circle_access(request, circle_id):
@@ -44,10 +83,10 @@ def check_circle_access(request, circle_id):
     - On success: (access_key, circle, None)
     - On failure: (None, None, JsonResponse with error)
     """
-    # Verify authentication
-    access_key, error = get_key_from_request(request)
-    if not access_key:
-        return None, None, JsonResponse({'error': error}, status=401)
+    # Verify authentication (resolved once per request)
+    principal = get_principal(request)
+    if not principal:
+        return None, None, JsonResponse({'error': principal.error}, status=401)
 
     # Get circle and verify it's a translation circle
     try:
@@ -59,22 +98,13 @@ def check_circle_access(request, circle_id):
         )
 
     # Check membership
-    if access_key.role == 'facilitator':
-        if circle.facilitator_key != access_key:
-            return None, None, JsonResponse(
-                {'error': 'Access denied'},
-                status=403
-            )
-    else:
-        if not CircleParticipant.objects.filter(
-            circle=circle,
-            access_key=access_key
-        ).exists():
-            return None, None, JsonResponse(
-                {'error': 'Access denied'},
-                status=403
-            )
+    if not principal.can_access(circle):
+        return None, None, JsonResponse(
+            {'error': 'Access denied'},
+            status=403
+        )
 
+    access_key = principal.access_key
     return access_key, circle, None
 
 
@@ -88,7 +118,8 @@ def start_session(request):
     POST /api/translation/sessions/start/
     Body: {
         "document_id": 1,
-        "circle_id": 1
+        "circle_id": 1,
+        "dry_run": false  // optional: time the load, then roll it back
     }
     """
     serializer = SessionStartSerializer(data=request.data)
@@ -103,6 +134,21 @@ def start_session(request):
 
     document = serializer.validated_data['document']
 
+    # Dry run: time a full load without keeping anything
+    if serializer.validated_data['dry_run']:
+        try:
+            loader = JSONDocumentLoader(document.file_path)
+            loader.create_session(
+                document, access_key, dry_run=True,
+                languages=serializer.validated_data.get('languages')
+            )
+            return Response({'dry_run': True, 'load_stats': loader.load_stats})
+        except FileNotFoundError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
     # Check if there's already an active session
     existing_session = TranslationSession.objects.filter(
         document=document,
@@ -124,10 +170,15 @@ def start_session(request):
         started_by = access_key
 
         loader = JSONDocumentLoader(document.file_path)
-        session = loader.create_session(document, started_by)
+        session = loader.create_session(
+            document, started_by,
+            languages=serializer.validated_data.get('languages')
+        )
 
         session_serializer = TranslationSessionSerializer(session)
-        return Response(session_serializer.data, status=status.HTTP_201_CREATED)
+        data = dict(session_serializer.data)
+        data['load_stats'] = loader.load_stats
+        return Response(data, status=status.HTTP_201_CREATED)
 
     except FileNotFoundError as e:
         return Response(
@@ -141,6 +192,21 @@ def start_session(request):
         )
 
 
+def _write_review(file_path):
+    """
+    Report what the save changed (<file>.review.json / .html).
+
+    The corrections are already saved, so a failed report is returned as
+    an error note instead of failing the request.
+    """
+    if not settings.TRANSLATION_CONFIG.get('review_reports', True):
+        return None
+    try:
+        return write_review_reports(file_path)
+    except (OSError, ValueError) as e:
+        return {'error': f'Review report failed: {e}'}
+
+
 @api_view(['POST'])
 def end_session(request, session_id):
     """
@@ -148,7 +214,10 @@ def end_session(request, session_id):
 
     POST /api/translation/sessions/<id>/end/
     """
-    session = get_object_or_404(TranslationSession, id=session_id)
+    session = get_object_or_404(
+        TranslationSessionSerializer.optimize_queryset(TranslationSession.objects.all()),
+        id=session_id
+    )
 
     # Check circle access
     access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
@@ -168,11 +237,13 @@ def end_session(request, session_id):
         # Save to JSON using writer service
         writer = JSONDocumentWriter(session.document.file_path)
         writer.save_session(session, ended_by)
+        search_indexes.discard(session)
 
         session_serializer = TranslationSessionSerializer(session)
         return Response({
             'message': 'Session ended and corrections saved to JSON',
-            'session': session_serializer.data
+            'session': session_serializer.data,
+            'review': _write_review(session.document.file_path)
         })
 
     except Exception as e:
@@ -189,7 +260,10 @@ def get_session(request, session_id):
 
     GET /api/translation/sessions/<id>/
     """
-    session = get_object_or_404(TranslationSession, id=session_id)
+    session = get_object_or_404(
+        TranslationSessionSerializer.optimize_queryset(TranslationSession.objects.all()),
+        id=session_id
+    )
 
     # Check circle access
     access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
@@ -200,24 +274,72 @@ def get_session(request, session_id):
     return Response(serializer.data)
 
 
+def _encode_cursor(paragraph):
+    """Opaque keyset cursor for the position after paragraph"""
+    raw = json.dumps([paragraph.chapter_id, paragraph.paragraph_id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """Return (chapter_id, paragraph_id) from a cursor, or None if invalid"""
+    try:
+        chapter_id, paragraph_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(chapter_id, str) or not isinstance(paragraph_id, str):
+        return None
+    return chapter_id, paragraph_id
+
+
+def _attach_translations(paragraphs, data, translations):
+    """
+    Add each paragraph's other languages to its serialized row.
+
+    Args:
+        paragraphs: ParagraphCorrection instances, in the order of data
+        data: Their serialized rows
+        translations: ParagraphTranslation queryset covering the paragraphs
+    """
+    by_paragraph = {}
+    rows = ParagraphTranslationSerializer(
+        ParagraphTranslationSerializer.optimize_queryset(translations).order_by('id'), many=True
+    ).data
+    for row in rows:
+        by_paragraph.setdefault(row['paragraph'], []).append(row)
+    for paragraph, row in zip(paragraphs, data):
+        row['translations'] = by_paragraph.get(paragraph.id, [])
+
+
 @api_view(['GET'])
 def list_paragraphs(request, session_id):
     """
-    List all paragraphs in a session.
+    List paragraphs in a session.
 
     GET /api/translation/sessions/<id>/paragraphs/
     Query params:
     - status: Filter by status (unchecked, in_progress, approved)
     - chapter: Filter by chapter_id
+    - fields: Comma-separated paragraph fields to return (e.g. id,paragraph_id,status)
+    - limit: Page size; enables keyset pagination on (chapter_id, paragraph_id)
+    - cursor: next_cursor from the previous page
+
+    Without limit or cursor, all matching paragraphs are returned.
+    In multi-language sessions each paragraph also carries its other
+    languages under "translations" (one extra query).
+    change_seq is the session's change sequence before the paragraphs were
+    read; resume the event stream from it to see every later write.
     """
-    session = get_object_or_404(TranslationSession, id=session_id)
+    session = get_object_or_404(
+        TranslationSessionSerializer.optimize_queryset(TranslationSession.objects.all()),
+        id=session_id
+    )
 
     # Check circle access
     access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
     if error_response:
         return error_response
 
-    paragraphs = session.paragraphs.all()
+    paragraphs = ParagraphCorrectionSerializer.optimize_queryset(session.paragraphs.all())
 
     # Apply filters
     status_filter = request.query_params.get('status')
@@ -228,11 +350,218 @@ def list_paragraphs(request, session_id):
     if chapter_filter:
         paragraphs = paragraphs.filter(chapter_id=chapter_filter)
 
-    serializer = ParagraphCorrectionSerializer(paragraphs, many=True)
+    # Field projection: skip loading columns that are not returned
+    fields = None
+    fields_param = request.query_params.get('fields')
+    if fields_param:
+        fields = [name.strip() for name in fields_param.split(',') if name.strip()]
+        unknown = set(fields) - set(ParagraphCorrectionSerializer.Meta.fields) - {'translations'}
+        if unknown:
+            return Response(
+                {'error': f"Unknown fields: {', '.join(sorted(unknown))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # session is always loaded: the related manager attaches it to each row
+        paragraphs = paragraphs.only(
+            'id', 'session', 'chapter_id', 'paragraph_id',
+            *ParagraphCorrectionSerializer.model_fields_for(
+                [name for name in fields if name != 'translations']
+            )
+        )
+    with_translations = bool(session.languages[1:]) and (fields is None or 'translations' in fields)
+
+    limit_param = request.query_params.get('limit')
+    cursor = request.query_params.get('cursor')
+    if limit_param is None and cursor is None:
+        paragraphs = list(paragraphs)
+        serializer = ParagraphCorrectionSerializer(paragraphs, many=True, fields=fields)
+        data = serializer.data
+        if with_translations:
+            _attach_translations(
+                paragraphs, data,
+                ParagraphTranslation.objects.filter(paragraph__session=session)
+            )
+        return Response({
+            'session_id': session_id,
+            'change_seq': session.change_seq,
+            'total_paragraphs': len(data),
+            'paragraphs': data
+        })
+
+    try:
+        limit = int(limit_param) if limit_param is not None else DEFAULT_PAGE_SIZE
+    except ValueError:
+        return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    # Total over the filtered set, before the cursor narrows it
+    total = paragraphs.count()
+
+    paragraphs = paragraphs.order_by('chapter_id', 'paragraph_id')
+    if cursor:
+        position = _decode_cursor(cursor)
+        if position is None:
+            return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+        after_chapter, after_paragraph = position
+        paragraphs = paragraphs.filter(
+            Q(chapter_id__gt=after_chapter) |
+            Q(chapter_id=after_chapter, paragraph_id__gt=after_paragraph)
+        )
+
+    page = list(paragraphs[:limit + 1])
+    next_cursor = _encode_cursor(page[limit - 1]) if len(page) > limit else None
+    page = page[:limit]
+
+    serializer = ParagraphCorrectionSerializer(page, many=True, fields=fields)
+    data = serializer.data
+    if with_translations:
+        _attach_translations(page, data, ParagraphTranslation.objects.filter(paragraph__in=page))
     return Response({
         'session_id': session_id,
-        'total_paragraphs': paragraphs.count(),
-        'paragraphs': serializer.data
+        'change_seq': session.change_seq,
+        'total_paragraphs': total,
+        'paragraphs': data,
+        'next_cursor': next_cursor
+    })
+
+
+@api_view(['GET'])
+def search_paragraphs(request, session_id):
+    """
+    Search paragraphs in a session.
+
+    GET /api/translation/sessions/<id>/search/?q=<terms>
+    Query params:
+    - q: Search terms; every term must appear in one field
+    - fields: Comma-separated subset of text, original_translation,
+      corrected_translation (default: all)
+    - limit, offset: Page of the ranked hits (default limit 100)
+
+    Hits carry a BM25 score and highlight offsets ([start, end) in Unicode
+    code points) per matched field.
+    """
+    session = get_object_or_404(
+        TranslationSessionSerializer.optimize_queryset(TranslationSession.objects.all()),
+        id=session_id
+    )
+
+    # Check circle access
+    access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
+    if error_response:
+        return error_response
+
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    fields = SEARCH_FIELDS
+    fields_param = request.query_params.get('fields')
+    if fields_param:
+        fields = [name.strip() for name in fields_param.split(',') if name.strip()]
+        unknown = set(fields) - set(SEARCH_FIELDS)
+        if unknown:
+            return Response(
+                {'error': f"Unknown fields: {', '.join(sorted(unknown))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    try:
+        limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+        offset = int(request.query_params.get('offset', 0))
+    except ValueError:
+        return Response({'error': 'limit and offset must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+
+    hits = search_indexes.search(session, query, fields)
+    return Response({
+        'session_id': session_id,
+        'query': query,
+        'total': len(hits),
+        'offset': offset,
+        'hits': hits[offset:offset + limit]
+    })
+
+
+@api_view(['POST'])
+def scan_session_terminology(request, session_id):
+    """
+    Check glossary renderings across a session's current corrections.
+
+    POST /api/translation/sessions/<id>/terminology/
+    Body: {"glossary": [{"source": "Dharma", "target": "ธรรมะ"}, ...]}
+
+    Lists every paragraph whose English text contains a glossary term
+    while its corrected translation contains none of the term's renderings.
+    """
+    session = get_object_or_404(
+        TranslationSessionSerializer.optimize_queryset(TranslationSession.objects.all()),
+        id=session_id
+    )
+
+    # Check circle access
+    access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
+    if error_response:
+        return error_response
+
+    serializer = TerminologyScanSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    paragraphs = session.paragraphs.order_by('chapter_id', 'paragraph_id').values(
+        'id', 'paragraph_id', 'chapter_id', 'status', 'text', 'corrected_translation'
+    )
+    report = get_scanner(serializer.validated_data['glossary']).scan(paragraphs.iterator(chunk_size=2000))
+    return Response({'session_id': session_id, **report})
+
+
+@api_view(['GET'])
+def list_paragraph_changes(request, session_id):
+    """
+    List paragraphs written after a change sequence number.
+
+    GET /api/translation/sessions/<id>/changes/?since=<seq>
+    Query params:
+    - since: change_seq from list_paragraphs or the previous call (required)
+    - limit: Maximum paragraphs per call (default 100)
+
+    Sequence numbers are stored with the paragraphs, so a cursor stays
+    valid across server restarts. Call again with next_since while
+    has_more is true.
+    """
+    session = get_object_or_404(
+        TranslationSessionSerializer.optimize_queryset(TranslationSession.objects.all()),
+        id=session_id
+    )
+
+    # Check circle access
+    access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
+    if error_response:
+        return error_response
+
+    try:
+        since = int(request.query_params['since'])
+        limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+    except KeyError:
+        return Response({'error': 'since is required'}, status=status.HTTP_400_BAD_REQUEST)
+    except ValueError:
+        return Response({'error': 'since and limit must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    paragraphs = ParagraphCorrectionSerializer.optimize_queryset(
+        session.paragraphs.filter(change_seq__gt=since)
+    ).order_by('change_seq')
+    page = list(paragraphs[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    serializer = ParagraphCorrectionSerializer(page, many=True)
+    return Response({
+        'session_id': session_id,
+        'status': session.status,
+        'paragraphs': serializer.data,
+        'next_since': page[-1].change_seq if page else since,
+        'has_more': has_more
     })
 
 
@@ -243,7 +572,12 @@ def get_paragraph(request, paragraph_id):
 
     GET /api/translation/paragraphs/<id>/
     """
-    paragraph = get_object_or_404(ParagraphCorrection, id=paragraph_id)
+    paragraph = get_object_or_404(
+        ParagraphCorrection.objects.select_related(
+            'session__document', 'last_modified_by', 'approved_by'
+        ),
+        id=paragraph_id
+    )
 
     # Check circle access
     access_key, circle, error_response = check_circle_access(request, paragraph.session.document.circle_id)
@@ -251,7 +585,109 @@ def get_paragraph(request, paragraph_id):
         return error_response
 
     serializer = ParagraphCorrectionSerializer(paragraph)
-    return Response(serializer.data)
+    response = Response(serializer.data)
+    response['ETag'] = _paragraph_etag(paragraph)
+    return response
+
+
+@api_view(['GET'])
+def paragraph_suggestions(request, paragraph_id):
+    """
+    Suggest prior approved translations for a paragraph.
+
+    GET /api/translation/paragraphs/<id>/suggestions/
+    Query params:
+    - k: Maximum suggestions (default 5, at most 20)
+    - min_similarity: Minimum source similarity, 0..1 (default 0.5)
+
+    Draws on paragraphs approved in any session of any document with the
+    same target language (the session's first language).
+    """
+    paragraph = get_object_or_404(
+        ParagraphCorrection.objects.select_related('session__document'),
+        id=paragraph_id
+    )
+
+    # Check circle access
+    access_key, circle, error_response = check_circle_access(request, paragraph.session.document.circle_id)
+    if error_response:
+        return error_response
+
+    try:
+        k = max(1, min(int(request.query_params.get('k', 5)), 20))
+        min_similarity = float(request.query_params.get('min_similarity', 0.5))
+    except ValueError:
+        return Response({'error': 'k and min_similarity must be numbers'}, status=status.HTTP_400_BAD_REQUEST)
+
+    document = paragraph.session.document
+    language = paragraph.session.primary_language
+    suggestions = suggest(
+        paragraph.text,
+        language,
+        k=k,
+        min_similarity=min_similarity,
+        exclude_document=document,
+        exclude_paragraph_id=paragraph.paragraph_id,
+    )
+    return Response({
+        'paragraph_id': paragraph.id,
+        'language': language,
+        'suggestions': suggestions
+    })
+
+
+def _lock_paragraph(paragraph_pk):
+    """Re-read a paragraph, locking its row until the transaction commits"""
+    return ParagraphCorrection.objects.select_for_update(of=('self',)).select_related(
+        'session__document', 'last_modified_by', 'approved_by'
+    ).get(pk=paragraph_pk)
+
+
+def _paragraph_etag(paragraph):
+    return f'"{paragraph.version}"'
+
+
+def _expected_versions(request, body_version=None):
+    """
+    Versions the client's write is conditional on.
+
+    Taken from the If-Match header (ETags as returned by the paragraph
+    endpoints) or, failing that, a "version" body field.
+
+    Returns: tuple (versions or None if unconditional, error_response)
+    """
+    if_match = request.headers.get('If-Match')
+    if if_match is None:
+        return ({body_version} if body_version is not None else None), None
+
+    versions = set()
+    for tag in if_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return None, None
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        try:
+            versions.add(int(tag.strip('"')))
+        except ValueError:
+            return None, Response(
+                {'error': 'If-Match must contain paragraph version ETags'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    return versions, None
+
+
+def _version_conflict(paragraph, serializer_class=ParagraphCorrectionSerializer):
+    """409 carrying the server's current copy of the paragraph (or translation)"""
+    response = Response(
+        {
+            'error': 'Paragraph was modified by someone else',
+            'current': serializer_class(paragraph).data
+        },
+        status=status.HTTP_409_CONFLICT
+    )
+    response['ETag'] = _paragraph_etag(paragraph)
+    return response
 
 
 @api_view(['PATCH'])
@@ -259,13 +695,20 @@ def update_paragraph(request, paragraph_id):
     """
     Update paragraph correction.
 
-    PATCH /api/translation/paragraphs/<id>/
+    PATCH /api/translation/paragraphs/<id>/update/
+    Headers: If-Match: "<version>"  // optional precondition
     Body: {
         "corrected_translation": "...",
-        "status": "in_progress"  // optional
+        "status": "in_progress",  // optional
+        "version": 3  // optional, alternative to If-Match
     }
+
+    Returns 409 with the current paragraph if the precondition fails.
     """
-    paragraph = get_object_or_404(ParagraphCorrection, id=paragraph_id)
+    paragraph = get_object_or_404(
+        ParagraphCorrection.objects.select_related('session__document'),
+        id=paragraph_id
+    )
 
     # Check circle access
     access_key, circle, error_response = check_circle_access(request, paragraph.session.document.circle_id)
@@ -277,23 +720,36 @@ def update_paragraph(request, paragraph_id):
     if not update_serializer.is_valid():
         return Response(update_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    # Update paragraph
-    paragraph.corrected_translation = update_serializer.validated_data['corrected_translation']
-    paragraph.status = update_serializer.validated_data.get('status', 'in_progress')
+    expected_versions, error_response = _expected_versions(
+        request, update_serializer.validated_data.get('version')
+    )
+    if error_response:
+        return error_response
 
-    # Use authenticated user
-    paragraph.last_modified_by = access_key
-    paragraph.save()
+    with transaction.atomic():
+        # Re-read under the write lock: precondition, counters and save all
+        # see the same row
+        paragraph = _lock_paragraph(paragraph.pk)
+        if expected_versions is not None and paragraph.version not in expected_versions:
+            return _version_conflict(paragraph)
+        previous_status = paragraph.status
 
-    # Update session statistics
-    session = paragraph.session
-    session.paragraphs_modified = session.paragraphs.exclude(
-        status='unchecked'
-    ).count()
-    session.save()
+        # Update paragraph
+        paragraph.corrected_translation = update_serializer.validated_data['corrected_translation']
+        paragraph.status = update_serializer.validated_data.get('status', 'in_progress')
+
+        # Use authenticated user
+        paragraph.last_modified_by = access_key
+        paragraph.change_seq = paragraph.session.allocate_change_seq()
+        paragraph.save()
+
+        # Update session statistics from the transition alone
+        paragraph.session.record_status_changes([(previous_status, paragraph.status)])
 
     serializer = ParagraphCorrectionSerializer(paragraph)
-    return Response(serializer.data)
+    response = Response(serializer.data)
+    response['ETag'] = _paragraph_etag(paragraph)
+    return response
 
 
 @api_view(['POST'])
@@ -302,8 +758,15 @@ def approve_paragraph(request, paragraph_id):
     Approve paragraph (facilitator only).
 
     POST /api/translation/paragraphs/<id>/approve/
+    Headers: If-Match: "<version>"  // optional precondition
+    Body: {"version": 3}  // optional, alternative to If-Match
+
+    Returns 409 with the current paragraph if the precondition fails.
     """
-    paragraph = get_object_or_404(ParagraphCorrection, id=paragraph_id)
+    paragraph = get_object_or_404(
+        ParagraphCorrection.objects.select_related('session__document'),
+        id=paragraph_id
+    )
 
     # Check circle access and verify facilitator role
     access_key, circle, error_response = check_circle_access(request, paragraph.session.document.circle_id)
@@ -316,16 +779,421 @@ def approve_paragraph(request, paragraph_id):
             status=403
         )
 
+    body_version = request.data.get('version') if hasattr(request.data, 'get') else None
+    if body_version is not None and not isinstance(body_version, int):
+        return Response({'version': ['A valid integer is required.']}, status=status.HTTP_400_BAD_REQUEST)
+    expected_versions, error_response = _expected_versions(request, body_version)
+    if error_response:
+        return error_response
+
     # Use authenticated user
     approved_by = access_key
 
-    paragraph.status = 'approved'
-    paragraph.approved_by = approved_by
-    paragraph.approved_at = timezone.now()
-    paragraph.save()
+    with transaction.atomic():
+        paragraph = _lock_paragraph(paragraph.pk)
+        if expected_versions is not None and paragraph.version not in expected_versions:
+            return _version_conflict(paragraph)
+        previous_status = paragraph.status
+
+        paragraph.status = 'approved'
+        paragraph.approved_by = approved_by
+        paragraph.approved_at = timezone.now()
+        paragraph.change_seq = paragraph.session.allocate_change_seq()
+        paragraph.save()
+
+        paragraph.session.record_status_changes([(previous_status, paragraph.status)])
+        # Re-approving unchanged text must not count the pair again
+        language = paragraph.session.primary_language
+        if previous_status != 'approved' or not is_recorded(paragraph, language):
+            record_approved([paragraph], language, paragraph.session.document)
 
     serializer = ParagraphCorrectionSerializer(paragraph)
-    return Response(serializer.data)
+    response = Response(serializer.data)
+    response['ETag'] = _paragraph_etag(paragraph)
+    return response
+
+
+def _get_translation_with_access(request, paragraph_id, language):
+    """
+    Load a paragraph's translation in one language and check circle access.
+
+    Returns: tuple (access_key, translation, error_response)
+    """
+    translation = get_object_or_404(
+        ParagraphTranslation.objects.select_related('paragraph__session__document'),
+        paragraph_id=paragraph_id,
+        language=language
+    )
+    access_key, circle, error_response = check_circle_access(
+        request, translation.paragraph.session.document.circle_id
+    )
+    if error_response:
+        return None, None, error_response
+    return access_key, translation, None
+
+
+def _lock_translation(translation_pk):
+    """Re-read a translation, locking its row until the transaction commits"""
+    return ParagraphTranslation.objects.select_for_update(of=('self',)).select_related(
+        'paragraph__session__document', 'last_modified_by', 'approved_by'
+    ).get(pk=translation_pk)
+
+
+def _touch_paragraph(paragraph):
+    """
+    Give a paragraph the next change sequence number without a new version,
+    so change feeds report it when one of its translations is written.
+    """
+    paragraph.change_seq = paragraph.session.allocate_change_seq()
+    ParagraphCorrection.objects.filter(pk=paragraph.pk).update(change_seq=paragraph.change_seq)
+
+
+@api_view(['GET'])
+def paragraph_translations(request, paragraph_id):
+    """
+    List a paragraph's additional languages (multi-language sessions).
+
+    GET /api/translation/paragraphs/<id>/translations/
+
+    The session's first language is the paragraph itself.
+    """
+    paragraph = get_object_or_404(
+        ParagraphCorrection.objects.select_related('session__document'),
+        id=paragraph_id
+    )
+
+    # Check circle access
+    access_key, circle, error_response = check_circle_access(request, paragraph.session.document.circle_id)
+    if error_response:
+        return error_response
+
+    translations = ParagraphTranslationSerializer.optimize_queryset(paragraph.translations.order_by('id'))
+    return Response({
+        'paragraph_id': paragraph.id,
+        'languages': paragraph.session.languages,
+        'translations': ParagraphTranslationSerializer(translations, many=True).data
+    })
+
+
+@api_view(['PATCH'])
+def update_paragraph_translation(request, paragraph_id, language):
+    """
+    Update one language's correction of a paragraph.
+
+    PATCH /api/translation/paragraphs/<id>/translations/<language>/update/
+    Headers: If-Match: "<version>"  // optional precondition
+    Body: same as the paragraph update endpoint
+
+    Returns 409 with the current translation if the precondition fails.
+    """
+    access_key, translation, error_response = _get_translation_with_access(request, paragraph_id, language)
+    if error_response:
+        return error_response
+
+    update_serializer = ParagraphUpdateSerializer(data=request.data)
+    if not update_serializer.is_valid():
+        return Response(update_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    expected_versions, error_response = _expected_versions(
+        request, update_serializer.validated_data.get('version')
+    )
+    if error_response:
+        return error_response
+
+    with transaction.atomic():
+        translation = _lock_translation(translation.pk)
+        if expected_versions is not None and translation.version not in expected_versions:
+            return _version_conflict(translation, ParagraphTranslationSerializer)
+
+        translation.corrected_translation = update_serializer.validated_data['corrected_translation']
+        translation.status = update_serializer.validated_data.get('status', 'in_progress')
+        translation.last_modified_by = access_key
+        translation.save()
+        _touch_paragraph(translation.paragraph)
+
+    response = Response(ParagraphTranslationSerializer(translation).data)
+    response['ETag'] = _paragraph_etag(translation)
+    return response
+
+
+@api_view(['POST'])
+def approve_paragraph_translation(request, paragraph_id, language):
+    """
+    Approve one language's correction of a paragraph (facilitator only).
+
+    POST /api/translation/paragraphs/<id>/translations/<language>/approve/
+    Headers: If-Match: "<version>"  // optional precondition
+    """
+    access_key, translation, error_response = _get_translation_with_access(request, paragraph_id, language)
+    if error_response:
+        return error_response
+
+    if access_key.role != 'facilitator':
+        return JsonResponse(
+            {'error': 'Only facilitators can approve paragraphs'},
+            status=403
+        )
+
+    expected_versions, error_response = _expected_versions(request)
+    if error_response:
+        return error_response
+
+    with transaction.atomic():
+        translation = _lock_translation(translation.pk)
+        if expected_versions is not None and translation.version not in expected_versions:
+            return _version_conflict(translation, ParagraphTranslationSerializer)
+
+        previous_status = translation.status
+        translation.status = 'approved'
+        translation.approved_by = access_key
+        translation.approved_at = timezone.now()
+        translation.save()
+        _touch_paragraph(translation.paragraph)
+        if previous_status != 'approved' or not is_recorded(translation, language):
+            record_approved([translation], language, translation.paragraph.session.document)
+
+    response = Response(ParagraphTranslationSerializer(translation).data)
+    response['ETag'] = _paragraph_etag(translation)
+    return response
+
+
+def _get_active_session_with_access(request, session_id):
+    """
+    Load an active session and check circle access once for a bulk request.
+
+    Returns: tuple (access_key, session, error_response)
+    """
+    session = get_object_or_404(TranslationSession.objects.select_related('document'), id=session_id)
+
+    access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
+    if error_response:
+        return None, None, error_response
+
+    if session.status != 'active':
+        return None, None, Response(
+            {'error': f'Session is not active (status: {session.status})'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return access_key, session, None
+
+
+@api_view(['POST'])
+def bulk_update_paragraphs(request, session_id):
+    """
+    Update many paragraph corrections in one transaction.
+
+    POST /api/translation/sessions/<id>/paragraphs/bulk-update/
+    Body: {
+        "paragraphs": [
+            {"id": 12, "corrected_translation": "...", "status": "in_progress",
+             "version": 3},  // version is an optional precondition
+            ...
+        ]
+    }
+
+    Each item is validated on its own; the response lists a result per item
+    ("updated", "invalid", "not_found" or "conflict" with the current
+    paragraph) in request order. Setting "approved" is for facilitators
+    only (403) and is recorded like the approve endpoints.
+    """
+    access_key, session, error_response = _get_active_session_with_access(request, session_id)
+    if error_response:
+        return error_response
+
+    envelope = BulkParagraphUpdateSerializer(data=request.data)
+    if not envelope.is_valid():
+        return Response(envelope.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    results = []
+    valid_items = []
+    for item in envelope.validated_data['paragraphs']:
+        item_serializer = ParagraphUpdateSerializer(data=item)
+        paragraph_pk = item.get('id')
+        if not isinstance(paragraph_pk, int):
+            results.append({'id': paragraph_pk, 'result': 'invalid', 'errors': {'id': ['A paragraph id is required']}})
+        elif not item_serializer.is_valid():
+            results.append({'id': paragraph_pk, 'result': 'invalid', 'errors': item_serializer.errors})
+        else:
+            results.append({'id': paragraph_pk, 'result': None})
+            valid_items.append((len(results) - 1, paragraph_pk, item_serializer.validated_data))
+
+    if access_key.role != 'facilitator' and any(data['status'] == 'approved' for _, _, data in valid_items):
+        return JsonResponse(
+            {'error': 'Only facilitators can approve paragraphs'},
+            status=403
+        )
+
+    now = timezone.now()
+    with transaction.atomic():
+        paragraphs = session.paragraphs.select_for_update().in_bulk(
+            [paragraph_pk for _, paragraph_pk, _ in valid_items]
+        )
+
+        transitions = []
+        changed = {}
+        approved = []
+        for index, paragraph_pk, data in valid_items:
+            paragraph = paragraphs.get(paragraph_pk)
+            if paragraph is None:
+                results[index]['result'] = 'not_found'
+                continue
+            if 'version' in data and paragraph.version != data['version']:
+                results[index].update({
+                    'result': 'conflict',
+                    'current': ParagraphCorrectionSerializer(paragraph).data,
+                })
+                continue
+
+            transitions.append((paragraph.status, data['status']))
+            # Only a new approval, or a new approved text, feeds the memory
+            newly_approved = data['status'] == 'approved' and (
+                paragraph.status != 'approved'
+                or paragraph.corrected_translation != data['corrected_translation']
+            )
+            paragraph.corrected_translation = data['corrected_translation']
+            paragraph.status = data['status']
+            paragraph.last_modified_by = access_key
+            paragraph.last_modified_at = now
+            if paragraph.status == 'approved':
+                # Same attribution as the approve endpoints
+                paragraph.approved_by = access_key
+                paragraph.approved_at = now
+            if newly_approved:
+                approved.append(paragraph)
+            paragraph.refresh_fingerprint()
+            paragraph.version += 1
+            changed[paragraph.pk] = paragraph
+
+            results[index].update({
+                'result': 'updated',
+                'paragraph_id': paragraph.paragraph_id,
+                'status': paragraph.status,
+                'version': paragraph.version,
+            })
+
+        if changed:
+            next_seq = session.allocate_change_seq(len(changed))
+            for paragraph in changed.values():
+                paragraph.change_seq = next_seq
+                next_seq += 1
+
+        ParagraphCorrection.objects.bulk_update(
+            changed.values(),
+            ['corrected_translation', 'status', 'last_modified_by', 'last_modified_at', 'approved_by',
+             'approved_at', 'fingerprint', 'version', 'change_seq'],
+            batch_size=BULK_UPDATE_BATCH_SIZE
+        )
+        session.record_status_changes(transitions)
+        record_approved(approved, session.primary_language, session.document)
+
+    return Response({
+        'session_id': session.id,
+        'updated': len(changed),
+        'results': results
+    })
+
+
+@api_view(['POST'])
+def bulk_approve_paragraphs(request, session_id):
+    """
+    Approve many paragraphs in one transaction (facilitator only).
+
+    POST /api/translation/sessions/<id>/paragraphs/bulk-approve/
+    Body: {"paragraph_ids": [12, 13, 14]}
+       or {"status": "in_progress", "chapter": "9"}
+
+    Paragraphs that are already approved are left as they are (approver,
+    version and translation memory unchanged) and reported as
+    "already_approved".
+    """
+    access_key, session, error_response = _get_active_session_with_access(request, session_id)
+    if error_response:
+        return error_response
+
+    if access_key.role != 'facilitator':
+        return JsonResponse(
+            {'error': 'Only facilitators can approve paragraphs'},
+            status=403
+        )
+
+    selector = BulkApproveSerializer(data=request.data)
+    if not selector.is_valid():
+        return Response(selector.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    # Only the columns needed for the fingerprint and the results
+    paragraphs = session.paragraphs.only(
+        'id', 'session', 'paragraph_id', 'text', 'corrected_translation', 'status', 'version', 'change_seq'
+    )
+    requested_ids = selector.validated_data.get('paragraph_ids')
+    if requested_ids is not None:
+        paragraphs = paragraphs.filter(id__in=requested_ids)
+    else:
+        if 'status' in selector.validated_data:
+            paragraphs = paragraphs.filter(status=selector.validated_data['status'])
+        if 'chapter' in selector.validated_data:
+            paragraphs = paragraphs.filter(chapter_id=selector.validated_data['chapter'])
+
+    now = timezone.now()
+    with transaction.atomic():
+        approved, already_approved = [], []
+        for paragraph in paragraphs.select_for_update():
+            (already_approved if paragraph.status == 'approved' else approved).append(paragraph)
+
+        transitions = []
+        for paragraph in approved:
+            transitions.append((paragraph.status, 'approved'))
+            paragraph.status = 'approved'
+            paragraph.approved_by = access_key
+            paragraph.approved_at = now
+            paragraph.last_modified_at = now
+            paragraph.refresh_fingerprint()
+            paragraph.version += 1
+
+        if approved:
+            next_seq = session.allocate_change_seq(len(approved))
+            for paragraph in approved:
+                paragraph.change_seq = next_seq
+                next_seq += 1
+
+        ParagraphCorrection.objects.bulk_update(
+            approved,
+            ['status', 'approved_by', 'approved_at', 'last_modified_at', 'fingerprint', 'version', 'change_seq'],
+            batch_size=BULK_UPDATE_BATCH_SIZE
+        )
+        session.record_status_changes(transitions)
+        record_approved(approved, session.primary_language, session.document)
+
+    results = [
+        {
+            'id': paragraph.id,
+            'paragraph_id': paragraph.paragraph_id,
+            'result': 'approved',
+            'version': paragraph.version,
+        }
+        for paragraph in approved
+    ]
+    results.extend(
+        {
+            'id': paragraph.id,
+            'paragraph_id': paragraph.paragraph_id,
+            'result': 'already_approved',
+            'version': paragraph.version,
+        }
+        for paragraph in already_approved
+    )
+    if requested_ids is not None:
+        found = {paragraph.id for paragraph in approved + already_approved}
+        results.extend(
+            {'id': paragraph_pk, 'result': 'not_found'}
+            for paragraph_pk in dict.fromkeys(requested_ids) if paragraph_pk not in found
+        )
+
+    return Response({
+        'session_id': session.id,
+        'approved': len(approved),
+        'results': results
+    })
 
 
 # ViewSet for TranslationDocument (optional - for document management)
@@ -336,14 +1204,14 @@ class TranslationDocumentViewSet(viewsets.ReadOnlyModelViewSet):
     GET /api/translation/documents/ - List documents
     GET /api/translation/documents/<id>/ - Get document details
     """
-    queryset = TranslationDocument.objects.all()
+    queryset = TranslationDocumentSerializer.optimize_queryset(TranslationDocument.objects.all())
     serializer_class = TranslationDocumentSerializer
 
     def get_queryset(self):
         """Filter by circle if provided"""
         # Get authenticated user
-        access_key, error = get_key_from_request(self.request)
-        if not access_key:
+        principal = get_principal(self.request)
+        if not principal:
             return TranslationDocument.objects.none()
 
         queryset = super().get_queryset()
@@ -355,18 +1223,194 @@ class TranslationDocumentViewSet(viewsets.ReadOnlyModelViewSet):
                 return TranslationDocument.objects.none()
             queryset = queryset.filter(circle_id=circle_id)
         else:
-            # Return documents for circles the user has access to
-            if access_key.role == 'facilitator':
-                # Facilitators see their own circle documents
-                user_circles = Circle.objects.filter(
-                    facilitator_key=access_key,
-                    circle_type='translation'
-                ).values_list('id', flat=True)
-            else:
-                # Participants see documents from their circles
-                user_circles = CircleParticipant.objects.filter(
-                    access_key=access_key
-                ).values_list('circle_id', flat=True)
-            queryset = queryset.filter(circle_id__in=user_circles)
+            # Return documents for circles the user facilitates or belongs to
+            queryset = queryset.filter(circle_id__in=principal.circle_ids)
 
         return queryset
+
+    @action(detail=True, methods=['post'])
+    def terminology(self, request, pk=None):
+        """
+        Check glossary renderings across the document's JSON file.
+
+        POST /api/translation/documents/<id>/terminology/
+        Body: {"glossary": [{"source": "Dharma", "target": "ธรรมะ"}, ...]}
+        """
+        document = self.get_object()
+
+        serializer = TerminologyScanSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            loader = JSONDocumentLoader(document.file_path)
+            paragraphs = (
+                {
+                    'paragraph_id': paragraph['paragraph_id'],
+                    'chapter_id': paragraph['chapter_id'],
+                    'status': paragraph['status'],
+                    'text': paragraph['text'],
+                    'corrected_translation': paragraph['corrected_translation'],
+                }
+                for paragraph in loader.iter_paragraphs()
+            )
+            report = get_scanner(serializer.validated_data['glossary']).scan(paragraphs)
+        except FileNotFoundError:
+            return Response(
+                {'error': 'Document file not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response({'document_id': document.id, **report})
+
+    @action(detail=True, methods=['get'])
+    def preview(self, request, pk=None):
+        """
+        Browse a document's paragraphs without starting a session.
+
+        GET /api/translation/documents/<id>/preview/
+        Query params:
+        - offset: Paragraphs to skip (default 0)
+        - limit: Page size (default 100, max 500)
+        - chapter: Restrict the page to one chapter
+
+        Served from the parsed JSON in the document cache; nothing is
+        written. Responses carry an ETag for the file version, and
+        If-None-Match is answered with 304 after a single stat.
+        """
+        document = self.get_object()
+
+        try:
+            offset = max(0, int(request.query_params.get('offset', 0)))
+            limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return Response({'error': 'offset and limit must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        try:
+            etag = document_etag(document.file_path)
+            if if_none_match(request, etag):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                response['ETag'] = etag
+                return response
+
+            page = preview_page(
+                document.file_path, offset, limit,
+                chapter_id=request.query_params.get('chapter')
+            )
+        except FileNotFoundError:
+            return Response(
+                {'error': f'JSON file not found: {document.file_path}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        if page is None:
+            return Response({'error': 'Chapter not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        etag = page.pop('etag')
+        response = Response({
+            'document_id': document.id,
+            'language': document.language,
+            **page,
+        })
+        response['ETag'] = etag
+        return response
+
+    @action(detail=True, methods=['get'])
+    def diff(self, request, pk=None):
+        """
+        Paragraph-level diff between two generations of the JSON file.
+
+        GET /api/translation/documents/<id>/diff/
+        Query params:
+        - from: Older generation (default 1, the version before the last save)
+        - to: Newer generation (default 0, the current file)
+        - output: "json" (default) or "html"
+
+        Generation N is the rotated backup <file>.N. The report is streamed.
+        """
+        document = self.get_object()
+
+        try:
+            old = generation_path(document.file_path, int(request.query_params.get('from', 1)))
+            new = generation_path(document.file_path, int(request.query_params.get('to', 0)))
+        except ValueError:
+            return Response({'error': 'from and to must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+        for path in (old, new):
+            if not path.exists():
+                return Response(
+                    {'error': f'Generation not found: {path.name}'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+        if request.query_params.get('output') == 'html':
+            return StreamingHttpResponse(iter_html_report(old, new), content_type='text/html; charset=utf-8')
+        return StreamingHttpResponse(iter_json_report(old, new), content_type='application/json')
+
+
+def _authorize_event_stream(request, session_id):
+    """
+    Resolve the session for an event stream and check circle access.
+
+    Returns: tuple (session, error_response)
+    """
+    try:
+        session = TranslationSession.objects.select_related('document').get(id=session_id)
+    except TranslationSession.DoesNotExist:
+        return None, JsonResponse({'error': 'Session not found'}, status=404)
+
+    access_key, circle, error_response = check_circle_access(request, session.document.circle_id)
+    if error_response:
+        return None, error_response
+    return session, None
+
+
+async def session_events(request, session_id):
+    """
+    Stream paragraph changes in a session as Server-Sent Events.
+
+    GET /api/translation/sessions/<id>/events/
+    Headers:
+    - Authorization: Key <key>
+    - Last-Event-ID: Resume after this change sequence (sent on reconnect)
+    Query params:
+    - since: Resume after this change sequence (default: now)
+    - text: "hash" to send text_hash without corrected_translation
+
+    Events: "paragraph" (id = change sequence) and "session_ended".
+    Async view: under ASGI an idle stream holds no worker thread. Under
+    WSGI Django buffers the whole stream before sending it, so the view
+    answers 501 there and clients poll /changes/ instead.
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {'error': 'Event streams need the ASGI server; poll the changes endpoint instead'},
+            status=501
+        )
+
+    session, error_response = await sync_to_async(_authorize_event_stream)(request, session_id)
+    if error_response:
+        return error_response
+
+    since_param = request.headers.get('Last-Event-ID') or request.GET.get('since')
+    if since_param is None:
+        since = session.change_seq
+    else:
+        try:
+            since = int(since_param)
+        except ValueError:
+            return JsonResponse({'error': 'since must be an integer'}, status=400)
+
+    include_text = request.GET.get('text') != 'hash'
+
+    response = StreamingHttpResponse(
+        session_event_stream(session.id, since, include_text),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx-style proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -5,5 +5,7 @@ urlpatterns = [
     path('', views.circles_list_create, name='circles_list_create'),
     path('<int:circle_id>/', views.circle_detail, name='circle_detail'),
     path('<int:circle_id>/keys/generate/', views.generate_participant_key, name='generate_participant_key'),
+    path('<int:circle_id>/keys/batch/', views.batch_generate_participant_keys, name='batch_generate_participant_keys'),
+    path('<int:circle_id>/keys/batch/<int:batch_id>/', views.key_batch_detail, name='key_batch_detail'),
     path('<int:circle_id>/keys/<int:key_id>/remove/', views.remove_participant_key, name='remove_participant_key'),
 ]
\ No newline at end of file
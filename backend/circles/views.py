@@ -1,43 +1,120 @@
+import hashlib
 import json
 import uuid
-from django.http import JsonResponse
+from django.http import HttpResponseNotModified, JsonResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view
+from authentication.principal import get_principal
 from authentication.views import get_key_from_request
 from authentication.models import AccessKey
-from .models import Circle, CircleParticipant
+from .http import if_none_match
+from .models import Circle, CircleParticipant, KeyBatch
+from .provisioning import (
+    KeyBatchError,
+    KeyCollisionError,
+    fail_stale_key_batches,
+    iter_manifest_csv,
+    manifest_rows,
+    provision_keys,
+    start_key_batch,
+    validate_batch,
+)
+
+
+# Circle list pagination
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+CIRCLE_LIST_FIELDS = (
+    'id', 'name', 'description', 'status', 'created_at', 'updated_at', 'jitsi_room_id', 'circle_type'
+)
+
+
+def _circle_list_etag(principal, rows, next_cursor):
+    """
+    ETag of a circle list page: the newest updated_at on the page plus a
+    digest of who is asking and which circles are on it, so edits,
+    additions and removals all change it.
+    """
+    newest = max((int(row['updated_at'].timestamp() * 1_000_000) for row in rows), default=0)
+    digest = hashlib.sha1(
+        f"{principal.key_id}:{next_cursor}:{','.join(str(row['id']) for row in rows)}".encode()
+    ).hexdigest()[:16]
+    return f'"{len(rows)}-{newest:x}-{digest}"'
+
+
+def _list_circles(request, principal):
+    """
+    The caller's circles, oldest first, in a single query.
+
+    Query params: status, circle_type (filters). Paging is opt-in, so
+    existing callers keep getting the full list: limit, after (keyset
+    cursor: the next_cursor of the previous page).
+    """
+    paginate = 'limit' in request.GET or 'after' in request.GET
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_PAGE_SIZE))
+        after = request.GET.get('after')
+        after = int(after) if after else None
+    except ValueError:
+        return JsonResponse({'error': 'limit and after must be integers'}, status=400)
+    if limit < 1:
+        return JsonResponse({'error': 'limit must be positive'}, status=400)
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    if principal.is_facilitator:
+        # Facilitators see their own circles
+        circles = Circle.objects.filter(facilitator_key_id=principal.key_id)
+    else:
+        # Participants see circles they're in (joined through their memberships)
+        circles = Circle.objects.filter(participants__access_key_id=principal.key_id)
+    for field in ('status', 'circle_type'):
+        value = request.GET.get(field)
+        if value:
+            circles = circles.filter(**{field: value})
+    if after is not None:
+        circles = circles.filter(id__gt=after)
+
+    circles = circles.order_by('id').values(*CIRCLE_LIST_FIELDS)
+    next_cursor = None
+    if paginate:
+        rows = list(circles[:limit + 1])
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1]['id']
+    else:
+        rows = list(circles)
+
+    etag = _circle_list_etag(principal, rows, next_cursor)
+    if if_none_match(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = JsonResponse({
+            'circles': [{
+                **row,
+                'created_at': row['created_at'].isoformat(),
+                'updated_at': row['updated_at'].isoformat(),
+            } for row in rows],
+            'next_cursor': next_cursor,
+        })
+    response['ETag'] = etag
+    response['Vary'] = 'Authorization'
+    return response
 
 
 @api_view(['GET', 'POST'])
 def circles_list_create(request):
-    """List circles or create new circle"""
+    """List circles (optionally paginated, see _list_circles) or create new circle"""
     
     # Verify authentication
-    access_key, error = get_key_from_request(request)
+    principal = get_principal(request)
+    access_key = principal.access_key
     if not access_key:
-        return JsonResponse({'error': error}, status=401)
+        return JsonResponse({'error': principal.error}, status=401)
     
     if request.method == 'GET':
-        if access_key.role == 'facilitator':
-            # Facilitators see their own circles
-            circles = Circle.objects.filter(facilitator_key=access_key)
-        else:
-            # Participants see circles they're in
-            participant_circles = CircleParticipant.objects.filter(access_key=access_key)
-            circles = Circle.objects.filter(id__in=[cp.circle.id for cp in participant_circles])
-        
-        return JsonResponse({
-            'circles': [{
-                'id': circle.id,
-                'name': circle.name,
-                'description': circle.description,
-                'status': circle.status,
-                'created_at': circle.created_at.isoformat(),
-                'jitsi_room_id': circle.jitsi_room_id,
-                'circle_type': circle.circle_type
-            } for circle in circles]
-        })
+        return _list_circles(request, principal)
     
     elif request.method == 'POST':
         # Only facilitators can create circles
@@ -242,3 +319,123 @@ def remove_participant_key(request, circle_id, key_id):
         return JsonResponse({'error': 'Participant key not found in this circle'}, status=404)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
+
+
+def _own_circle(request, circle_id, action):
+    """(circle, None) if the caller facilitates circle_id, else (None, error response)"""
+    principal = get_principal(request)
+    if not principal or not principal.is_facilitator:
+        return None, JsonResponse({'error': f'Only facilitators can {action}'}, status=403)
+    try:
+        circle = Circle.objects.get(id=circle_id)
+    except Circle.DoesNotExist:
+        return None, JsonResponse({'error': 'Circle not found'}, status=404)
+    if circle.facilitator_key_id != principal.key_id:
+        return None, JsonResponse({'error': f'Only the circle facilitator can {action}'}, status=403)
+    return circle, None
+
+
+def _manifest_response(request, circle, access_keys, output, status=200):
+    """Key manifest as JSON, or as a CSV download when output is 'csv'"""
+    rows = manifest_rows(access_keys)
+    if output == 'csv':
+        response = StreamingHttpResponse(iter_manifest_csv(rows), content_type='text/csv; charset=utf-8',
+                                         status=status)
+        response['Content-Disposition'] = f'attachment; filename="circle-{circle.id}-keys.csv"'
+        return response
+    response = JsonResponse({'circle_id': circle.id, 'created': len(rows), 'keys': rows}, status=status)
+    if request.GET.get('download'):
+        response['Content-Disposition'] = f'attachment; filename="circle-{circle.id}-keys.json"'
+    return response
+
+
+@api_view(['POST'])
+def batch_generate_participant_keys(request, circle_id):
+    """
+    Generate and/or import participant keys for a circle in one transaction.
+
+    POST /api/circles/<circle_id>/keys/batch/
+    Body: {
+        "count": 40,              // keys to generate
+        "keys": ["alice", ...],   // custom keys to import
+        "output": "json",         // or "csv" (also ?output=csv)
+        "async": false            // true: run in the background, poll the batch
+    }
+
+    Returns the manifest of created keys (201); with "async", 202 and the
+    batch to poll. 409 lists imported keys that already exist.
+    """
+    circle, error_response = _own_circle(request, circle_id, 'generate participant keys')
+    if error_response:
+        return error_response
+
+    try:
+        data = json.loads(request.body or b'{}')
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    if not isinstance(data, dict):
+        return JsonResponse({'error': 'Expected a JSON object'}, status=400)
+    count, keys = data.get('count', 0), data.get('keys', [])
+    output = request.GET.get('output') or data.get('output', 'json')
+    if output not in ('json', 'csv'):
+        return JsonResponse({'error': 'output must be "json" or "csv"'}, status=400)
+
+    try:
+        if data.get('async'):
+            # Fail fast on bad input; collisions are checked again when it runs
+            keys = validate_batch(count, keys)
+            batch = KeyBatch.objects.create(
+                circle=circle,
+                created_by_id=circle.facilitator_key_id,
+                generate_count=count,
+                imported_keys=keys,
+            )
+            start_key_batch(batch)
+            return JsonResponse(_batch_data(batch), status=202)
+
+        access_keys = provision_keys(circle, count, keys)
+    except KeyCollisionError as e:
+        return JsonResponse({'error': str(e), 'collisions': e.collisions}, status=409)
+    except KeyBatchError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    return _manifest_response(request, circle, access_keys, output, status=201)
+
+
+def _batch_data(batch):
+    return {
+        'batch_id': batch.id,
+        'circle_id': batch.circle_id,
+        'status': batch.status,
+        'requested': batch.generate_count + len(batch.imported_keys),
+        'created': len(batch.key_ids),
+        'error': batch.error or None,
+        'created_at': batch.created_at.isoformat(),
+        'started_at': batch.started_at.isoformat() if batch.started_at else None,
+        'finished_at': batch.finished_at.isoformat() if batch.finished_at else None,
+    }
+
+
+@api_view(['GET'])
+def key_batch_detail(request, circle_id, batch_id):
+    """
+    Status of an asynchronous key batch; once completed, ?manifest=1 (or
+    ?output=csv) returns its manifest instead.
+
+    GET /api/circles/<circle_id>/keys/batch/<batch_id>/
+    """
+    circle, error_response = _own_circle(request, circle_id, 'view key batches')
+    if error_response:
+        return error_response
+    # A batch whose worker went away would otherwise stay pending/running
+    fail_stale_key_batches(KeyBatch.objects.filter(id=batch_id, circle=circle))
+    try:
+        batch = KeyBatch.objects.get(id=batch_id, circle=circle)
+    except KeyBatch.DoesNotExist:
+        return JsonResponse({'error': 'Key batch not found'}, status=404)
+
+    output = request.GET.get('output')
+    if batch.status == 'completed' and (output or request.GET.get('manifest')):
+        access_keys = AccessKey.objects.filter(id__in=batch.key_ids).order_by('id')
+        return _manifest_response(request, circle, access_keys, output or 'json')
+    return JsonResponse(_batch_data(batch))
@@ -1,7 +1,7 @@
 import json
 from django.http import JsonResponse
 from rest_framework.decorators import api_view
-from authentication.views import get_key_from_request
+from authentication.principal import get_principal
 from circles.models import Circle
 from .models import Message
 
@@ -11,9 +11,10 @@ def messages_list_create(request):
     """List messages or send new message"""
     
     # Verify authentication
-    access_key, error = get_key_from_request(request)
+    principal = get_principal(request)
+    access_key = principal.access_key
     if not access_key:
-        return JsonResponse({'error': error}, status=401)
+        return JsonResponse({'error': principal.error}, status=401)
     
     if request.method == 'GET':
         circle_id = request.GET.get('circle_id')
@@ -24,15 +25,9 @@ def messages_list_create(request):
         try:
             circle = Circle.objects.get(id=circle_id)
             
-            # Check if user has access to this circle
-            if access_key.role == 'facilitator':
-                if circle.facilitator_key != access_key:
-                    return JsonResponse({'error': 'Access denied'}, status=403)
-            else:
-                # Check if participant is in this circle
-                from circles.models import CircleParticipant
-                if not CircleParticipant.objects.filter(circle=circle, access_key=access_key).exists():
-                    return JsonResponse({'error': 'Access denied'}, status=403)
+            # Check if user facilitates or belongs to this circle
+            if not principal.can_access(circle):
+                return JsonResponse({'error': 'Access denied'}, status=403)
             
             messages = Message.objects.filter(circle=circle, is_visible=True)
             
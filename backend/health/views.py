@@ -1,6 +1,10 @@
 from django.http import JsonResponse
 from django.db import connection
 from rest_framework.decorators import api_view
+from authentication.keycache import access_keys, last_used_buffer
+from circles.membership import memberships
+from circles.translation.search import search_indexes
+from circles.translation.services import document_cache
 
 
 @api_view(['GET'])
@@ -14,7 +18,13 @@ def health_check(request):
         
         return JsonResponse({
             'status': 'healthy',
-            'database': 'connected'
+            'database': 'connected',
+            'caches': {
+                'translation_documents': document_cache.stats(),
+                'translation_search': search_indexes.stats(),
+                'access_keys': {**access_keys.stats(), 'last_used': last_used_buffer.stats()},
+                'circle_memberships': memberships.stats(),
+            }
         })
     except Exception as e:
         return JsonResponse({
@@ -54,6 +54,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'authentication.middleware.PrincipalMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -160,3 +161,63 @@ JITSI_CONFIG = {
     'jwt_app_id': None,
 }
 
+# Access key lookups (authentication.keycache)
+ACCESS_KEY_CONFIG = {
+    # Active keys are cached per worker; a deactivated key stays usable on
+    # other workers for at most this long
+    'cache_ttl_seconds': 30,
+    'cache_max_entries': 4096,
+    # last_used is advanced at most this often per key...
+    'last_used_resolution_seconds': 60,
+    # ...and written for all keys in one UPDATE at most this often
+    'last_used_flush_seconds': 5,
+}
+
+# Circle membership index (circles.membership)
+CIRCLE_MEMBERSHIP_CONFIG = {
+    # Each key's {circle: role} map is cached per worker; membership
+    # changes made through another worker show up within this long
+    'cache_ttl_seconds': 30,
+    'cache_max_entries': 4096,
+}
+
+# Asynchronous participant key batches (circles.provisioning)
+KEY_BATCH_CONFIG = {
+    # A batch still pending or running after this long lost its worker
+    # (restart, deploy, crash) and is reported as failed; run
+    # `manage.py recover_key_batches` after a restart to finish pending ones
+    'stale_after_seconds': 600,
+}
+
+# Translation circle configuration
+TRANSLATION_CONFIG = {
+    # Previous versions of each JSON document kept as <file>.1 .. <file>.N
+    # when a session is saved back to disk
+    'json_backup_generations': 5,
+    # Approximate memory budget (bytes of JSON on disk) for parsed documents
+    # shared across sessions by the in-process document cache
+    'document_cache_max_bytes': 64 * 1024 * 1024,
+    # Files at least this large are parsed incrementally when a session
+    # starts (unless already cached), bounding memory per session load
+    'stream_threshold_bytes': 8 * 1024 * 1024,
+    # Paragraphs inserted per bulk_create batch when a session starts
+    'load_batch_size': 500,
+    # Session event stream (served by the ASGI application): seconds
+    # between change polls, keepalive comments and before the stream is
+    # recycled, and deltas read per poll
+    'event_poll_interval': 1.0,
+    'event_heartbeat_seconds': 15,
+    'event_stream_max_seconds': 300,
+    'event_batch_size': 200,
+    # Sessions whose in-process search index is kept per worker
+    'search_index_max_sessions': 8,
+    # Per-glossary cache of terminology scan results, keyed by paragraph
+    # content hash
+    'terminology_cache_paragraphs': 20000,
+    # Write <file>.review.json/.html (paragraph diff against <file>.1)
+    # whenever a session is saved
+    'review_reports': True,
+    # Keep a binary copy of each document's paragraphs (<file>.sidecar) so
+    # session loads map a file instead of parsing JSON
+    'document_sidecar': True,
+}
@@ -15,6 +15,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
 
 urlpatterns = [
@@ -28,3 +29,7 @@ urlpatterns = [
         path('translation/', include('circles.translation.urls')),
     ])),
 ]
+
+# Admin static files under DEBUG (runserver served these itself; the dev
+# stack runs uvicorn)
+urlpatterns += staticfiles_urlpatterns()
@@ -71,6 +71,7 @@ export interface Circle {
   description: string
   status: 'inactive' | 'active' | 'ended'
   created_at: string
+  updated_at?: string
   jitsi_room_id: string
   circle_type: 'discussion' | 'translation' | 'study'
 }
@@ -102,8 +103,39 @@ export interface GenerateKeyRequest {
   custom_key?: string
 }
 
+export interface KeyBatchRequest {
+  count?: number
+  keys?: string[]
+  async?: boolean
+}
+
+export interface KeyManifest {
+  circle_id: number
+  created: number
+  keys: ParticipantKey[]
+}
+
+export interface KeyBatch {
+  batch_id: number
+  circle_id: number
+  status: 'pending' | 'running' | 'completed' | 'failed'
+  requested: number
+  created: number
+  error: string | null
+  created_at: string
+  finished_at: string | null
+}
+
 export interface CirclesResponse {
   circles: Circle[]
+  next_cursor?: number | null  // with limit/after: pass as `after` to get the next page
+}
+
+export interface CircleListParams {
+  status?: string
+  circle_type?: 'discussion' | 'translation' | 'study'
+  limit?: number
+  after?: number
 }
 
 // Message types
@@ -217,8 +249,8 @@ export class ApiService {
   }
 
   // Circles
-  async getCircles(): Promise<CirclesResponse> {
-    const response = await apiClient.get('/circles/')
+  async getCircles(params?: CircleListParams): Promise<CirclesResponse> {
+    const response = await apiClient.get('/circles/', { params })
     return response.data
   }
 
@@ -247,6 +279,16 @@ export class ApiService {
     return response.data
   }
 
+  async batchGenerateParticipantKeys(circleId: number, batch: KeyBatchRequest): Promise<KeyManifest | KeyBatch> {
+    const response = await apiClient.post(`/circles/${circleId}/keys/batch/`, batch)
+    return response.data
+  }
+
+  async getKeyBatch(circleId: number, batchId: number): Promise<KeyBatch> {
+    const response = await apiClient.get(`/circles/${circleId}/keys/batch/${batchId}/`)
+    return response.data
+  }
+
   async removeParticipantKey(circleId: number, keyId: number): Promise<{ message: string }> {
     const response = await apiClient.delete(`/circles/${circleId}/keys/${keyId}/remove/`)
     return response.data
@@ -365,33 +407,174 @@ export class ApiService {
   }
 
   // End translation session
-  async endTranslationSession(sessionId: number): Promise<{ message: string; session: TranslationSession }> {
+  async endTranslationSession(sessionId: number): Promise<{
+    message: string
+    session: TranslationSession
+    review: ReviewSummary | { error: string } | null
+  }> {
     const response = await apiClient.post(`/translation/sessions/${sessionId}/end/`)
     return response.data
   }
 
+  // Browse a document's paragraphs without starting a session
+  async getDocumentPreview(
+    documentId: number,
+    params: { offset?: number; limit?: number; chapter?: string } = {}
+  ): Promise<DocumentPreview> {
+    const response = await apiClient.get(`/translation/documents/${documentId}/preview/`, { params })
+    return response.data
+  }
+
+  // Paragraph diff between two generations of a document's JSON file (0 = current)
+  async getDocumentDiff(documentId: number, from = 1, to = 0): Promise<DocumentDiff> {
+    const response = await apiClient.get(`/translation/documents/${documentId}/diff/`, {
+      params: { from, to }
+    })
+    return response.data
+  }
+
   // List all paragraphs in a session
   async getSessionParagraphs(
     sessionId: number,
-    filters?: { status?: string; chapter?: string }
+    filters?: { status?: string; chapter?: string; fields?: string[]; limit?: number; cursor?: string }
   ): Promise<ParagraphsResponse> {
     let url = `/translation/sessions/${sessionId}/paragraphs/`
     if (filters) {
       const params = new URLSearchParams()
       if (filters.status) params.append('status', filters.status)
       if (filters.chapter) params.append('chapter', filters.chapter)
+      if (filters.fields) params.append('fields', filters.fields.join(','))
+      if (filters.limit) params.append('limit', String(filters.limit))
+      if (filters.cursor) params.append('cursor', filters.cursor)
       if (params.toString()) url += `?${params.toString()}`
     }
     const response = await apiClient.get(url)
     return response.data
   }
 
+  // Ranked full-text search over a session's source and target text
+  async searchSessionParagraphs(
+    sessionId: number,
+    query: string,
+    options?: { fields?: string[]; limit?: number; offset?: number }
+  ): Promise<ParagraphSearchResponse> {
+    const params = new URLSearchParams({ q: query })
+    if (options?.fields) params.append('fields', options.fields.join(','))
+    if (options?.limit) params.append('limit', String(options.limit))
+    if (options?.offset) params.append('offset', String(options.offset))
+    const response = await apiClient.get(`/translation/sessions/${sessionId}/search/?${params.toString()}`)
+    return response.data
+  }
+
+  // Glossary consistency scan over a session's current corrections
+  async scanSessionTerminology(sessionId: number, glossary: GlossaryEntry[]): Promise<TerminologyReport> {
+    const response = await apiClient.post(`/translation/sessions/${sessionId}/terminology/`, { glossary })
+    return response.data
+  }
+
+  // Paragraphs written after a change sequence number (catch-up after reconnect)
+  async getSessionChanges(sessionId: number, since: number, limit?: number): Promise<ParagraphChangesResponse> {
+    const params = new URLSearchParams({ since: String(since) })
+    if (limit) params.append('limit', String(limit))
+    const response = await apiClient.get(`/translation/sessions/${sessionId}/changes/?${params.toString()}`)
+    return response.data
+  }
+
+  // Follow live paragraph changes in a session (Server-Sent Events).
+  // Uses fetch rather than EventSource so the Authorization header is sent;
+  // reconnects with Last-Event-ID until the session ends or unsubscribe is called.
+  // A server without streaming (WSGI, 501) calls onUnavailable instead, so the
+  // caller can poll getSessionChanges.
+  subscribeSessionChanges(
+    sessionId: number,
+    since: number,
+    onChange: (change: ParagraphChange) => void,
+    onEnd?: () => void,
+    onUnavailable?: () => void
+  ): () => void {
+    const controller = new AbortController()
+    let lastSeq = since
+
+    const connect = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          const response = await fetch(
+            `${API_BASE_URL}/api/translation/sessions/${sessionId}/events/`,
+            {
+              headers: {
+                Authorization: `Key ${this.accessKey}`,
+                'Last-Event-ID': String(lastSeq),
+              },
+              signal: controller.signal,
+            }
+          )
+          if (response.status === 501) {
+            onUnavailable?.()
+            return
+          }
+          if (!response.ok || !response.body) {
+            console.warn(`Session event stream refused: ${response.status}`)
+            return
+          }
+
+          const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+          let buffer = ''
+          for (;;) {
+            const { value, done } = await reader.read()
+            if (done) break
+            buffer += value
+            let boundary
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+              const message = buffer.slice(0, boundary)
+              buffer = buffer.slice(boundary + 2)
+              let event = ''
+              let data = ''
+              for (const line of message.split('\n')) {
+                if (line.startsWith('event: ')) event = line.slice(7)
+                else if (line.startsWith('data: ')) data += line.slice(6)
+              }
+              if (event === 'paragraph') {
+                const change: ParagraphChange = JSON.parse(data)
+                lastSeq = change.change_seq
+                onChange(change)
+              } else if (event === 'session_ended') {
+                onEnd?.()
+                return
+              }
+            }
+          }
+        } catch (error: any) {
+          if (controller.signal.aborted) return
+          console.warn('Session event stream interrupted, reconnecting', error)
+        }
+        // Server recycles streams periodically; back off briefly before resuming
+        await new Promise(resolve => setTimeout(resolve, 1000))
+      }
+    }
+
+    connect()
+    return () => controller.abort()
+  }
+
   // Get single paragraph
   async getParagraph(paragraphId: number): Promise<ParagraphCorrection> {
     const response = await apiClient.get(`/translation/paragraphs/${paragraphId}/`)
     return response.data
   }
 
+  // Prior approved translations of similar source paragraphs
+  async getParagraphSuggestions(
+    paragraphId: number,
+    options?: { k?: number; minSimilarity?: number }
+  ): Promise<TranslationSuggestionsResponse> {
+    const params = new URLSearchParams()
+    if (options?.k) params.append('k', String(options.k))
+    if (options?.minSimilarity !== undefined) params.append('min_similarity', String(options.minSimilarity))
+    const query = params.toString() ? `?${params.toString()}` : ''
+    const response = await apiClient.get(`/translation/paragraphs/${paragraphId}/suggestions/${query}`)
+    return response.data
+  }
+
   // Update paragraph correction
   async updateParagraph(
     paragraphId: number,
@@ -406,6 +589,33 @@ export class ApiService {
     const response = await apiClient.post(`/translation/paragraphs/${paragraphId}/approve/`)
     return response.data
   }
+
+  // Other languages of a paragraph in a multi-language session
+  async getParagraphTranslations(
+    paragraphId: number
+  ): Promise<{ paragraph_id: number; languages: string[]; translations: ParagraphTranslation[] }> {
+    const response = await apiClient.get(`/translation/paragraphs/${paragraphId}/translations/`)
+    return response.data
+  }
+
+  // Update one language of a paragraph
+  async updateParagraphTranslation(
+    paragraphId: number,
+    language: string,
+    data: ParagraphUpdateRequest
+  ): Promise<ParagraphTranslation> {
+    const response = await apiClient.patch(
+      `/translation/paragraphs/${paragraphId}/translations/${language}/update/`,
+      data
+    )
+    return response.data
+  }
+
+  // Approve one language of a paragraph (facilitator only)
+  async approveParagraphTranslation(paragraphId: number, language: string): Promise<ParagraphTranslation> {
+    const response = await apiClient.post(`/translation/paragraphs/${paragraphId}/translations/${language}/approve/`)
+    return response.data
+  }
 }
 
 // Translation types
@@ -435,6 +645,8 @@ export interface TranslationSession {
   ended_by: number | null
   total_paragraphs: number
   paragraphs_modified: number
+  change_seq: number
+  languages: string[]  // multi-language session; empty = the document's language
 }
 
 export interface ParagraphCorrection {
@@ -451,22 +663,173 @@ export interface ParagraphCorrection {
   last_modified_at: string
   approved_by: number | null
   approved_at: string | null
+  version: number
+  change_seq: number
+  translations?: ParagraphTranslation[]  // other languages of a multi-language session
+}
+
+// One further language of a paragraph in a multi-language session
+export interface ParagraphTranslation {
+  id: number
+  paragraph: number
+  language: string
+  original_translation: string
+  corrected_translation: string
+  status: 'unchecked' | 'in_progress' | 'approved'
+  last_modified_by_key: string | null
+  last_modified_at: string
+  approved_by_key: string | null
+  approved_at: string | null
+  version: number
+}
+
+// Compact paragraph delta from the session event stream
+export interface ParagraphChange {
+  id: number
+  paragraph_id: string
+  status: 'unchecked' | 'in_progress' | 'approved'
+  version: number
+  change_seq: number
+  last_modified_at: string
+  last_modified_by_key: string | null
+  approved_by_key: string | null
+  text_hash: string
+  corrected_translation?: string
 }
 
 export interface SessionStartRequest {
   document_id: number
   circle_id: number
+  languages?: string[]  // e.g. ['thai', 'vietnamese', 'korean']: first is the primary language
 }
 
 export interface ParagraphUpdateRequest {
   corrected_translation: string
   status?: 'unchecked' | 'in_progress' | 'approved'
+  version?: number  // server answers 409 with the current paragraph if stale
 }
 
 export interface ParagraphsResponse {
   session_id: number
+  change_seq: number  // resume the session event stream from here
   total_paragraphs: number
   paragraphs: ParagraphCorrection[]
+  next_cursor?: string | null  // present when limit/cursor was requested
+}
+
+export interface ParagraphSearchHit {
+  id: number
+  paragraph_id: string
+  chapter_id: string
+  status: 'unchecked' | 'in_progress' | 'approved'
+  score: number
+  // [start, end) offsets in Unicode code points, per matched field
+  highlights: Partial<Record<'text' | 'original_translation' | 'corrected_translation', [number, number][]>>
+}
+
+export interface ParagraphSearchResponse {
+  session_id: number
+  query: string
+  total: number
+  offset: number
+  hits: ParagraphSearchHit[]
+}
+
+export interface TranslationSuggestion {
+  entry_id: number
+  similarity: number  // source text similarity, 0..1
+  source_text: string
+  target_text: string
+  occurrences: number
+  document_title: string | null
+  paragraph_id: string
+  last_approved_at: string
+}
+
+export interface TranslationSuggestionsResponse {
+  paragraph_id: number
+  language: string
+  suggestions: TranslationSuggestion[]
+}
+
+export interface GlossaryEntry {
+  source: string
+  target: string | string[]  // approved rendering(s)
+}
+
+export type StatusCounts = Record<string, number>
+
+export interface DocumentPreview {
+  document_id: number
+  language: string
+  metadata: Record<string, unknown>
+  paragraph_count: number
+  languages: string[]
+  status: Record<string, StatusCounts>
+  chapters: {
+    id: string
+    title: string
+    section_id: string
+    section_title: string
+    offset: number
+    paragraphs: number
+    status: Record<string, StatusCounts>
+  }[]
+  offset: number
+  limit: number
+  total: number
+  paragraphs: {
+    index: number
+    paragraph_id: string
+    chapter_id: string
+    section_id: string
+    text: string
+    translations: Record<string, { text: string; corrected_text: string; status: string }>
+  }[]
+}
+
+export interface ReviewSummary {
+  added: number
+  removed: number
+  modified: number
+  unchanged: number
+}
+
+export interface DocumentDiff {
+  old: string
+  new: string
+  changes: {
+    paragraph_id: string
+    change: 'added' | 'removed' | 'modified'
+    chapter_id: string | number
+    fields: Record<string, { old: unknown; new: unknown }>
+  }[]
+  summary: ReviewSummary
+}
+
+export interface TerminologyReport {
+  session_id?: number
+  document_id?: number
+  terms: number
+  paragraphs_scanned: number
+  paragraphs_with_issues: number
+  term_counts: Record<string, number>
+  issues: {
+    id?: number
+    paragraph_id: string
+    chapter_id: string
+    status: 'unchecked' | 'in_progress' | 'approved'
+    missing: { source: string; target: string[] }[]
+  }[]
+  seconds: number
+}
+
+export interface ParagraphChangesResponse {
+  session_id: number
+  status: 'active' | 'completed' | 'aborted'
+  paragraphs: ParagraphCorrection[]
+  next_since: number
+  has_more: boolean
 }
 
 // Export singleton instance